@@ -1,74 +1,132 @@
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from . import models, schemas
+from . import config, models, schemas
 from .database import get_db
+from .utils.password_hashing import PasswordHasher, bcrypt_salt
+from .utils.token_cache import TeamPrincipal, TokenPrincipal, VerifiedTokenCache
+from .utils.tracing import traced
+import hashlib
+import hmac
 import time
 
-# Security configuration
-SECRET_KEY = "your-secret-key-here"  # In production, use environment variable
+# Security configuration (서명 키는 MYFC_JWT_KEYS로 설정, kid별 다중 키 지원)
+SIGNING_KEYS = config.JWT_KEYS
+ACTIVE_KID = config.JWT_ACTIVE_KID
+SECRET_KEY = SIGNING_KEYS[ACTIVE_KID]
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# bcrypt 해싱 최적화: 라운드 수를 4로 더 낮춤 (개발 환경용, 프로덕션에서는 더 높은 값 사용)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+# 검증된 토큰 캐시 (비밀번호 변경/팀 삭제 시 TeamService에서 무효화)
+verified_tokens = VerifiedTokenCache(config.TOKEN_CACHE_SIZE)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="teams/login")
 
+# 비밀번호 해싱 (라운드는 MYFC_BCRYPT_ROUNDS 또는 시작 시 보정값, 전용 스레드 풀에서 실행)
+password_hasher = PasswordHasher(config.BCRYPT_ROUNDS, config.HASH_MAX_WORKERS)
+
+def get_pwd_context():
+    return password_hasher.context
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     try:
-        start_time = time.time()
-        result = pwd_context.verify(plain_password, hashed_password)
-        return result
+        return password_hasher.verify(plain_password, hashed_password)
     except Exception as e:
         return False
 
-def get_password_hash(password: str) -> str:
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
     try:
-        start_time = time.time()
-        hashed_password = pwd_context.hash(password)
-        return hashed_password
+        return await password_hasher.verify_async(plain_password, hashed_password)
     except Exception as e:
-        raise
+        return False
+
+def get_password_hash(password: str) -> str:
+    return password_hasher.hash(password)
 
-# 비동기 버전의 비밀번호 해싱 (별도 스레드에서 실행)
+# 비동기 버전의 비밀번호 해싱 (해싱 전용 스레드 풀에서 실행)
 async def get_password_hash_async(password: str) -> str:
-    with ThreadPoolExecutor() as executor:
-        return await asyncio.get_event_loop().run_in_executor(
-            executor, get_password_hash, password
-        )
+    return await password_hasher.hash_async(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    from jose import jwt
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, SIGNING_KEYS[ACTIVE_KID], algorithm=ALGORITHM, headers={"kid": ACTIVE_KID})
     return encoded_jwt
 
-async def get_current_team(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def password_fingerprint(hashed_password: Optional[str]) -> Optional[str]:
+    """토큰에 넣는 비밀번호 해시 지문 - 비밀번호가 바뀌면 이전 토큰이 거부됨
+
+    bcrypt 솔트로 계산 (비밀번호 변경 시 새 솔트, 비용 상향 재해싱은 솔트를 유지하므로 지문 불변)
+    """
+    if not hashed_password:
+        return None
+    return hashlib.sha256(bcrypt_salt(hashed_password).encode()).hexdigest()[:16]
+
+def decode_access_token(token: str) -> TokenPrincipal:
+    """서명/만료 검증 후 토큰 내용 반환 (검증 결과는 만료 시각까지 캐시)
+
+    헤더의 kid로 검증 키 선택, kid가 없는 이전 토큰은 현재 서명 키로 검증
+    """
+    principal = verified_tokens.get(token)
+    if principal is not None:
+        return principal
+
+    from jose import JWTError, jwt
+    kid = jwt.get_unverified_header(token).get("kid", ACTIVE_KID)
+    key = SIGNING_KEYS.get(kid)
+    if key is None:
+        raise JWTError(f"unknown signing key: {kid}")
+    payload = jwt.decode(token, key, algorithms=[ALGORITHM])
+    team_id: str = payload.get("sub")
+    exp = payload.get("exp")
+    if team_id is None or exp is None:
+        raise JWTError("missing claims")
+    token_data = schemas.TokenData(team_id=team_id)
+    principal = TokenPrincipal(token_data.team_id, float(exp), payload.get("pwd"))
+    verified_tokens.put(token, principal)
+    return principal
+
+@traced("auth.get_current_team")
+async def get_current_team(request: Request, token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    """토큰의 팀 확인 → TeamPrincipal (id, name) 스냅샷"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    from jose import JWTError
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        team_id: str = payload.get("sub")
-        if team_id is None:
-            raise credentials_exception
-        token_data = schemas.TokenData(team_id=team_id)
-    except JWTError:
+        principal = decode_access_token(token)
+    except (JWTError, ValueError):
         raise credentials_exception
+
+    # 팀 단위 요청 제한 (DB 조회 전에 거절, 비싼 라우트일수록 비용 가중)
+    from .utils.rate_limit import team_limiter, request_cost
+    await team_limiter.hit_async(principal.team_id, request_cost(request))
     
-    team = db.query(models.Team).filter(models.Team.id == token_data.team_id).first()
-    if team is None:
+    # 최근에 확인한 팀이면 DB 세션 없이 통과 (지연 세션이 열리지 않음)
+    team = verified_tokens.get_team(principal.team_id, config.AUTH_TEAM_CACHE_TTL)
+    if team is None or (principal.password_fingerprint is not None and principal.password_fingerprint != team.password_fingerprint):
+        db_team = db.query(models.Team).filter(models.Team.id == principal.team_id).first()
+        if db_team is None:
+            raise credentials_exception
+        team = TeamPrincipal(db_team.id, db_team.name, password_fingerprint(db_team.password))
+        verified_tokens.put_team(team)
+    # 비밀번호 변경 이전에 발급된 토큰 거부
+    if principal.password_fingerprint is not None and principal.password_fingerprint != team.password_fingerprint:
         raise credentials_exception
-    return team 
\ No newline at end of file
+    return team
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """관리용 엔드포인트 보호 - MYFC_ADMIN_TOKEN 미설정 시 엔드포인트 자체를 숨김"""
+    if not config.ADMIN_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, config.ADMIN_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
@@ -0,0 +1,104 @@
+import os
+
+# 환경 변수 기반 설정 (.env 파일은 python-dotenv로 로드 가능)
+
+def _get_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+DATABASE_URL = os.getenv("MYFC_DATABASE_URL", "sqlite:///./myfc.db")
+
+# 서버 시작(lifespan) 시 create_all 실행 여부 - 개발용, 운영 스키마는 `python -m app.manage migrate`로 관리
+AUTO_CREATE_SCHEMA = _get_bool("MYFC_AUTO_CREATE_SCHEMA")
+
+# 워커 프로세스 수 (python -m app.manage serve / gunicorn.conf.py 에서 사용)
+WORKERS = int(os.getenv("MYFC_WORKERS", "1"))
+
+# 워커 간 캐시 무효화/pub-sub용 SQLite 이벤트 버스 파일 (다중 워커면 기본 활성화)
+EVENT_BUS_PATH = os.getenv("MYFC_EVENT_BUS_PATH") or ("./myfc_bus.db" if WORKERS > 1 else None)
+
+# SQLite WAL 모드 - 여러 워커가 읽는 동안에도 쓰기가 막히지 않도록
+SQLITE_WAL = _get_bool("MYFC_SQLITE_WAL", True)
+
+# Idempotency-Key 응답 보관 시간, 같은 키의 동시 요청이 최초 요청 완료를 기다리는 최대 시간,
+# 처리 중 선점 기한 (지나면 대기 중인 재시도가 이어받음 - 가장 느린 쓰기 요청보다 길게)
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("MYFC_IDEMPOTENCY_TTL_SECONDS", str(24 * 3600)))
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("MYFC_IDEMPOTENCY_WAIT_SECONDS", "10"))
+IDEMPOTENCY_LEASE_SECONDS = float(os.getenv("MYFC_IDEMPOTENCY_LEASE_SECONDS", "30"))
+
+# 업로드 파일 저장소 - local(업로드 디렉터리) 또는 object(오브젝트 스토리지 대체 구현)
+STORAGE_BACKEND = os.getenv("MYFC_STORAGE_BACKEND", "local")
+UPLOAD_DIR = os.getenv("MYFC_UPLOAD_DIR", "uploads")
+UPLOAD_URL_PREFIX = "uploads"
+# 파일 I/O 전용 스레드 풀 크기 (이벤트 루프/기본 스레드 풀을 막지 않도록 별도로 제한)
+STORAGE_MAX_WORKERS = int(os.getenv("MYFC_STORAGE_MAX_WORKERS", "4"))
+
+# 응답 압축 - 이 크기(바이트) 미만 본문은 압축하지 않음
+COMPRESSION_MIN_SIZE = int(os.getenv("MYFC_COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("MYFC_COMPRESSION_GZIP_LEVEL", "6"))
+
+# 토큰 버킷 요청 제한 - 팀(토큰)별 초당 충전량/최대 적립량, 로그인은 IP별
+RATE_LIMIT_ENABLED = _get_bool("MYFC_RATE_LIMIT_ENABLED", True)
+RATE_LIMIT_TEAM_RATE = float(os.getenv("MYFC_RATE_LIMIT_TEAM_RATE", "20"))
+RATE_LIMIT_TEAM_BURST = float(os.getenv("MYFC_RATE_LIMIT_TEAM_BURST", "100"))
+RATE_LIMIT_LOGIN_RATE = float(os.getenv("MYFC_RATE_LIMIT_LOGIN_RATE", "0.2"))
+RATE_LIMIT_LOGIN_BURST = float(os.getenv("MYFC_RATE_LIMIT_LOGIN_BURST", "10"))
+# 버킷 상태를 워커 간 공유할 SQLite 파일 (없으면 프로세스 메모리)
+RATE_LIMIT_STORE_PATH = os.getenv("MYFC_RATE_LIMIT_STORE_PATH")
+
+# 전역 동시 처리 제한 - 초과 요청은 대기열에서 잠시 기다리고, 넘치면 503
+ADMISSION_MAX_CONCURRENT = int(os.getenv("MYFC_ADMISSION_MAX_CONCURRENT", "40"))
+ADMISSION_MAX_QUEUE = int(os.getenv("MYFC_ADMISSION_MAX_QUEUE", "100"))
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("MYFC_ADMISSION_QUEUE_TIMEOUT", "2.0"))
+
+# JWT 서명 키 - "kid:secret,kid2:secret2" 형식 (키 교체 중에는 이전 키도 검증용으로 유지)
+# 새 토큰은 MYFC_JWT_ACTIVE_KID(기본: 첫 번째 키)로 서명하고 헤더에 kid를 기록
+def _parse_signing_keys(value: str) -> dict:
+    keys = {}
+    for item in value.split(","):
+        kid, sep, secret = item.strip().partition(":")
+        if not sep or not kid or not secret:
+            raise ValueError("MYFC_JWT_KEYS must look like 'kid:secret,kid2:secret2'")
+        keys[kid] = secret
+    return keys
+
+JWT_KEYS = (
+    _parse_signing_keys(os.environ["MYFC_JWT_KEYS"]) if os.getenv("MYFC_JWT_KEYS")
+    else {"default": os.getenv("MYFC_SECRET_KEY", "your-secret-key-here")}
+)
+JWT_ACTIVE_KID = os.getenv("MYFC_JWT_ACTIVE_KID") or next(iter(JWT_KEYS))
+if JWT_ACTIVE_KID not in JWT_KEYS:
+    raise ValueError(f"MYFC_JWT_ACTIVE_KID {JWT_ACTIVE_KID!r} is not in MYFC_JWT_KEYS")
+
+# 검증된 토큰 캐시 크기 (0이면 매 요청 서명 검증)
+TOKEN_CACHE_SIZE = int(os.getenv("MYFC_TOKEN_CACHE_SIZE", "10000"))
+
+# 인증 시 DB에서 확인한 팀을 다시 조회하지 않는 시간(초) - 적중하면 요청이 DB 세션 없이 인증됨
+# 다른 워커에서 바뀐 비밀번호/삭제된 팀은 최대 이 시간만큼 늦게 반영 (0이면 매 요청 조회)
+AUTH_TEAM_CACHE_TTL = float(os.getenv("MYFC_AUTH_TEAM_CACHE_TTL", "30"))
+
+# 리프레시 토큰 유효 기간 (액세스 토큰 만료 시 비밀번호 대신 리프레시 토큰으로 재발급)
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("MYFC_REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+
+# bcrypt 비용 (passlib 기본값 12) - MYFC_BCRYPT_TARGET_MS를 주면 시작 시 현재 하드웨어에서
+# 목표 검증 시간에 맞춰 보정하되 MYFC_BCRYPT_ROUNDS 아래로는 내리지 않음
+# (`python -m app.manage calibrate-bcrypt`로 미리 재서 MYFC_BCRYPT_ROUNDS에 고정해도 됨, 4는 테스트 전용)
+BCRYPT_ROUNDS = int(os.getenv("MYFC_BCRYPT_ROUNDS", "12"))
+BCRYPT_TARGET_MS = float(os.getenv("MYFC_BCRYPT_TARGET_MS", "0"))
+# 해싱 전용 스레드 풀 크기 (동시 로그인/가입 해싱 수 상한)
+HASH_MAX_WORKERS = int(os.getenv("MYFC_HASH_MAX_WORKERS", "2"))
+
+# 관리용 엔드포인트(/admin) 접근 토큰 - X-Admin-Token 헤더, 설정하지 않으면 비활성화
+ADMIN_TOKEN = os.getenv("MYFC_ADMIN_TOKEN")
+
+# 동일한 동시 GET 요청 합치기 - 진행 중인 계산을 기다리는 최대 시간(초), 넘으면 직접 계산
+COALESCE_TIMEOUT = float(os.getenv("MYFC_COALESCE_TIMEOUT", "10"))
+
+# 샘플링 프로파일러 (/admin/profiler) - 한 번에 실행할 수 있는 최대 시간(초)
+PROFILER_MAX_DURATION = float(os.getenv("MYFC_PROFILER_MAX_DURATION", "60"))
+
+# 요청 추적 스팬 - 샘플링 비율(0이면 끔, 1이면 전체), 내보낼 JSON Lines 파일 (없으면 콘솔)
+TRACE_SAMPLE_RATE = float(os.getenv("MYFC_TRACE_SAMPLE_RATE", "0"))
+TRACE_EXPORT_PATH = os.getenv("MYFC_TRACE_EXPORT_PATH")
@@ -1,9 +1,11 @@
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.engine import Engine
 import time
+from . import config
+from .utils.tracing import end_child, start_child, start_sql_span
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./myfc.db"
+SQLALCHEMY_DATABASE_URL = config.DATABASE_URL
 
 # SQLite 전용 연결 설정 - 최적화
 engine = create_engine(
@@ -16,6 +18,20 @@ engine = create_engine(
     pool_recycle=3600    # 연결 재활용 시간 설정
 )
 
+def configure_sqlite(engine: Engine) -> None:
+    """연결마다 WAL 모드 적용 (다중 워커의 읽기와 쓰기가 서로 막지 않도록, 잠금 대기는 connect_args timeout)"""
+    if engine.dialect.name != "sqlite" or not config.SQLITE_WAL:
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+configure_sqlite(engine)
+
 # 세션 설정 최적화
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -27,18 +43,80 @@ SessionLocal = sessionmaker(
 # SQLAlchemy 2.0 호환 방식
 Base = declarative_base()
 
-# 쿼리 실행 시간 추적을 위한 이벤트 리스너
+# 쿼리 실행 시간 추적을 위한 이벤트 리스너 (추적 중인 요청이면 SQL 문마다 스팬)
 @event.listens_for(Engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     conn.info.setdefault('query_start_time', []).append(time.time())
+    conn.info.setdefault('query_spans', []).append(start_sql_span(statement))
 
 @event.listens_for(Engine, "after_cursor_execute")
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     total = time.time() - conn.info['query_start_time'].pop()
+    end_child(*conn.info['query_spans'].pop())
+
+@event.listens_for(Engine, "handle_error")
+def handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get('query_spans'):
+        conn.info['query_start_time'].pop()
+        end_child(*conn.info['query_spans'].pop(), error=exception_context.original_exception)
+
+# 커밋(flush 포함) 구간 스팬 - 느린 요청이 쓰기에서 시간을 쓰는지 구분
+@event.listens_for(Session, "before_commit")
+def before_commit(session):
+    session.info['commit_span'] = start_child("db.commit")
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def end_commit_span(session, *args):
+    commit_span = session.info.pop('commit_span', None)
+    if commit_span is not None:
+        end_child(*commit_span)
+
+class LazySession:
+    """처음 사용할 때 만들어지는 요청용 세션
+
+    캐시 적중, 권한 거절, 304 등 DB를 쓰지 않는 요청은 Session 생성도 연결 체크아웃도 없이 끝남
+    (Session 자체도 첫 쿼리 시점에 연결을 가져가므로 연결 점유는 실제 쿼리부터 close까지)
+    """
+    __slots__ = ("_factory", "_session")
+
+    def __init__(self, factory=None):
+        self._factory = factory or SessionLocal
+        self._session = None
+
+    @property
+    def materialized(self) -> bool:
+        return self._session is not None
+
+    def __getattr__(self, name):
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
 
 def get_db():
-    db = SessionLocal()
+    db = LazySession()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+def init_db():
+    """모델 기준으로 누락된 테이블 생성 (개발/테스트용, 운영은 마이그레이션 사용)
+
+    집계 테이블(team_records, opponent_records)이 새로 생긴 DB에는 마이그레이션 백필이 없으므로
+    경기와 어긋난 팀의 전적을 재구성
+    """
+    from . import models
+    from .services.match_service import MatchService
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        MatchService(db).rebuild_stale_records()
+    finally:
+        db.close()
+
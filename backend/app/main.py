@@ -1,28 +1,65 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from .database import engine
-from . import models
-from .routers import team, player, match, analytics
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm.exc import StaleDataError
+from contextlib import asynccontextmanager
+from . import config
+from .database import init_db
+from .utils.versioning import CONFLICT_DETAIL
+from .utils.middleware import ProcessTimeMiddleware
+from .utils.tracing import TracingMiddleware
+from .utils.profiler import RouteTagMiddleware
+from .utils.compression import CompressionMiddleware
+from .utils.content_negotiation import ContentNegotiationMiddleware, NegotiatedJSONResponse
+from .utils.rate_limit import AdmissionControlMiddleware
+from .routers import team, player, match, analytics, leaderboard, search, media, sync, admin
+import asyncio
 import time
 import json
 import traceback
 from typing import Callable, AsyncGenerator
 
-# 데이터 베이스 테이블 생성 (이미 존재하면 무시)
-models.Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    # 스키마는 import 시점이 아닌 시작 단계에서, 그리고 명시적으로 요청한 경우에만 생성
+    # (운영 환경은 `python -m app.manage migrate`로 미리 마이그레이션)
+    if config.AUTO_CREATE_SCHEMA:
+        init_db()
 
-# CallableFactory 클래스 구현 (비동기 요청 처리를 위해)
-class CallableFactory:
-    def __init__(self, body: bytes):
-        self.body = body
-    
-    async def __call__(self) -> dict:
-        return {"type": "http.request", "body": self.body, "more_body": False}
+    # 다중 워커 모드: 캐시 무효화를 이벤트 버스로 다른 워커와 공유
+    bus = None
+    if config.EVENT_BUS_PATH:
+        from .utils.event_bus import EventBus
+        from .utils.cache import analytics_cache
+        bus = EventBus(config.EVENT_BUS_PATH)
+        analytics_cache.attach(bus)
+        bus.start()
+
+    # bcrypt 비용 보정 (현재 하드웨어에서 목표 검증 시간에 맞는 라운드 선택)
+    from .auth import password_hasher
+    if config.BCRYPT_TARGET_MS > 0:
+        await asyncio.get_running_loop().run_in_executor(
+            None, password_hasher.calibrate, config.BCRYPT_TARGET_MS
+        )
+
+    # 교체/삭제된 업로드 파일 백그라운드 일괄 정리
+    from .utils.storage import get_orphan_cleaner
+    cleaner = get_orphan_cleaner()
+    cleaner.start()
+    yield
+    await cleaner.stop()
+    password_hasher.shutdown()
+    if bus is not None:
+        analytics_cache.detach()
+        bus.stop()
 
 app = FastAPI(
     title="MyFC App API",
     description="API for managing football teams, players, and matches",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # Accept: application/msgpack 요청은 같은 스키마를 MessagePack으로 응답
+    default_response_class=NegotiatedJSONResponse
 )
 
 # CORS 설정 (모든 출처 허용)
@@ -34,31 +71,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 요청/응답 로깅 미들웨어 제거
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    # 요청 본문 읽기
-    body = b""
-    async for chunk in request.stream():
-        body += chunk
-    # 스트림을 사용하여 원래 Request 객체 재생성
-    request = Request(request.scope, receive=CallableFactory(body))
-    # 요청 처리
-    try:
-        response = await call_next(request)
-    except Exception as e:
-        raise
-    # 처리 시간 계산
-    process_time = time.time() - time.time()  # 실제로는 의미 없음, 필요시 구현
-    # 응답 헤더에 처리 시간 추가
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+# JSON/MessagePack 협상 (압축 미들웨어 안쪽에서 변환)
+app.add_middleware(ContentNegotiationMiddleware)
+
+# 응답 압축 (Accept-Encoding 협상, 작은 응답은 제외)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MIN_SIZE,
+    gzip_level=config.COMPRESSION_GZIP_LEVEL,
+)
+
+# 전역 동시 처리 제한 (과부하 시 503으로 부하 차단)
+app.add_middleware(
+    AdmissionControlMiddleware,
+    max_concurrent=config.ADMISSION_MAX_CONCURRENT,
+    max_queue=config.ADMISSION_MAX_QUEUE,
+    queue_timeout=config.ADMISSION_QUEUE_TIMEOUT,
+)
+
+# 처리 시간 헤더 (본문을 버퍼링하지 않는 ASGI 미들웨어)
+app.add_middleware(ProcessTimeMiddleware)
+
+# 요청 추적 스팬 (MYFC_TRACE_SAMPLE_RATE > 0일 때만, traceparent 헤더 전파)
+app.add_middleware(TracingMiddleware)
+
+# 프로파일러 실행 중 스레드풀/해시 풀 작업에 라우트 태그 전달
+app.add_middleware(RouteTagMiddleware)
+
+@app.exception_handler(StaleDataError)
+async def stale_data_handler(request: Request, exc: StaleDataError):
+    # 동시 수정으로 버전이 맞지 않는 쓰기 (버전 명시 없이 같은 행을 갱신한 경우 포함)
+    return JSONResponse(status_code=409, content={"detail": CONFLICT_DETAIL})
 
 # Include routers
 app.include_router(team.router)
 app.include_router(player.router)
 app.include_router(match.router)
 app.include_router(analytics.router)
+app.include_router(leaderboard.router)
+app.include_router(search.router)
+app.include_router(media.router)
+app.include_router(sync.router)
+app.include_router(admin.router)
 
 @app.get("/")
 def read_root():
@@ -0,0 +1,167 @@
+"""관리 명령 (마이그레이션, 서버 실행)
+
+사용법:
+    python -m app.manage migrate      # 스키마를 최신 리비전으로 업그레이드
+    python -m app.manage create-all   # 마이그레이션 없이 모델 기준 테이블 생성 (개발용)
+    python -m app.manage serve --workers 4 [--host 0.0.0.0] [--port 8000]
+    python -m app.manage cleanup-uploads [--dry-run]   # 어떤 팀도 참조하지 않는 업로드 파일 삭제
+    python -m app.manage precompress-uploads           # 업로드 파일의 .gz/.br 변형 생성 (미디어 응답용)
+    python -m app.manage calibrate-bcrypt --target-ms 250   # 목표 검증 시간에 맞는 MYFC_BCRYPT_ROUNDS 측정
+    python -m app.manage rebuild-records [--all]     # 경기와 어긋난 상대/통산 전적 재구성 (--all: 모든 팀)
+"""
+import argparse
+import os
+from typing import List, Optional
+
+from sqlalchemy import inspect
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Alembic 도입 이전 스키마에 해당하는 기준 리비전
+BASELINE_REVISION = "0001"
+
+def get_alembic_config():
+    from alembic.config import Config
+    alembic_cfg = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    return alembic_cfg
+
+def migrate(revision: str = "head") -> None:
+    """마이그레이션 적용 (Alembic 도입 전 create_all로 만든 DB는 기준 리비전으로 stamp 후 업그레이드)"""
+    from alembic import command
+    from app.database import engine
+
+    alembic_cfg = get_alembic_config()
+    with engine.begin() as connection:
+        alembic_cfg.attributes["connection"] = connection
+        tables = set(inspect(connection).get_table_names())
+        if "teams" in tables and "alembic_version" not in tables:
+            command.stamp(alembic_cfg, BASELINE_REVISION)
+        command.upgrade(alembic_cfg, revision)
+
+def create_all() -> None:
+    from app.database import init_db
+    init_db()
+
+def serve(workers: int, host: str, port: int) -> None:
+    """uvicorn 다중 워커 실행 (워커 프로세스는 MYFC_WORKERS로 이벤트 버스 사용 여부를 판단)"""
+    import uvicorn
+    os.environ["MYFC_WORKERS"] = str(workers)
+    uvicorn.run("app.main:app", host=host, port=port, workers=workers, app_dir=BACKEND_DIR)
+
+def cleanup_uploads(dry_run: bool = False) -> List[str]:
+    """DB에서 참조하지 않는 업로드 파일 일괄 삭제 (백그라운드 정리에서 놓친 파일 수거)"""
+    import asyncio
+    from app.database import SessionLocal
+    from app.models import Team
+    from app.utils.media import original_name
+    from app.utils.storage import get_storage, name_from_url
+
+    db = SessionLocal()
+    try:
+        referenced = {
+            name_from_url(url)
+            for row in db.query(Team.logo_url, Team.image_url)
+            for url in row if url
+        }
+    finally:
+        db.close()
+
+    async def sweep() -> List[str]:
+        storage = get_storage()
+        orphans = sorted(name for name in await storage.list_names() if original_name(name) not in referenced)
+        if orphans and not dry_run:
+            await storage.delete_many(orphans)
+        return orphans
+
+    orphans = asyncio.run(sweep())
+    print(f"{'found' if dry_run else 'deleted'} {len(orphans)} orphan upload(s)")
+    return orphans
+
+def precompress_uploads() -> List[str]:
+    """업로드 파일마다 미리 압축된 변형 생성 (압축 효과가 없는 파일은 건너뜀)"""
+    import asyncio
+    from app.utils.media import VARIANT_SUFFIXES, precompress
+    from app.utils.storage import get_storage
+
+    async def run() -> List[str]:
+        storage = get_storage()
+        saved = []
+        for name in await storage.list_names():
+            if not name.endswith(VARIANT_SUFFIXES):
+                saved.extend(await precompress(storage, name))
+        return saved
+
+    saved = asyncio.run(run())
+    print(f"created {len(saved)} precompressed variant(s)")
+    return saved
+
+def calibrate_bcrypt(target_ms: float, max_rounds: int) -> int:
+    """라운드별 bcrypt 검증 시간을 재고 목표 시간 이내의 최대 라운드 출력"""
+    from app import config
+    from app.utils.password_hashing import calibrate_rounds
+
+    # 현재 설정(MYFC_BCRYPT_ROUNDS)보다 낮은 비용은 제안하지 않음
+    rounds, table = calibrate_rounds(target_ms, min_rounds=config.BCRYPT_ROUNDS, max_rounds=max(max_rounds, config.BCRYPT_ROUNDS))
+    for cost, ms in table.items():
+        print(f"rounds={cost:>2}  verify={ms:8.1f} ms")
+    print(f"MYFC_BCRYPT_ROUNDS={rounds}")
+    return rounds
+
+def rebuild_records(all_teams: bool = False) -> List[int]:
+    """집계 전적(opponent_records, team_records)을 경기로부터 재구성 (기본은 어긋난 팀만)"""
+    from app.database import SessionLocal
+    from app.models import Team
+    from app.services.match_service import MatchService
+
+    db = SessionLocal()
+    try:
+        service = MatchService(db)
+        if all_teams:
+            team_ids = [team_id for (team_id,) in db.query(Team.id).order_by(Team.id)]
+            for team_id in team_ids:
+                service.rebuild_opponent_records(team_id)
+        else:
+            team_ids = service.rebuild_stale_records()
+    finally:
+        db.close()
+    print(f"rebuilt records for {len(team_ids)} team(s)")
+    return team_ids
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.manage")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = subparsers.add_parser("migrate", help="스키마 마이그레이션 적용")
+    migrate_parser.add_argument("revision", nargs="?", default="head")
+    subparsers.add_parser("create-all", help="모델 기준 테이블 생성 (개발용)")
+    serve_parser = subparsers.add_parser("serve", help="다중 워커 서버 실행")
+    serve_parser.add_argument("--workers", type=int, default=int(os.getenv("MYFC_WORKERS", "1")))
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    cleanup_parser = subparsers.add_parser("cleanup-uploads", help="참조되지 않는 업로드 파일 삭제")
+    cleanup_parser.add_argument("--dry-run", action="store_true")
+    subparsers.add_parser("precompress-uploads", help="업로드 파일의 gzip/brotli 변형 생성")
+    calibrate_parser = subparsers.add_parser("calibrate-bcrypt", help="목표 검증 시간에 맞는 bcrypt 라운드 측정")
+    calibrate_parser.add_argument("--target-ms", type=float, default=250.0)
+    calibrate_parser.add_argument("--max-rounds", type=int, default=15)
+    rebuild_parser = subparsers.add_parser("rebuild-records", help="상대/통산 전적 재구성")
+    rebuild_parser.add_argument("--all", action="store_true")
+
+    args = parser.parse_args(argv)
+    if args.command == "migrate":
+        migrate(args.revision)
+    elif args.command == "create-all":
+        create_all()
+    elif args.command == "serve":
+        serve(args.workers, args.host, args.port)
+    elif args.command == "cleanup-uploads":
+        cleanup_uploads(args.dry_run)
+    elif args.command == "precompress-uploads":
+        precompress_uploads()
+    elif args.command == "calibrate-bcrypt":
+        calibrate_bcrypt(args.target_ms, args.max_rounds)
+    elif args.command == "rebuild-records":
+        rebuild_records(args.all)
+
+if __name__ == "__main__":
+    main()
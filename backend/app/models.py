@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Integer, String, Float, Text, DateTime, ForeignKey, LargeBinary, Table, Index, delete, event, insert, select, text
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -8,7 +8,10 @@ match_player = Table(
     'match_player',
     Base.metadata,
     Column('match_id', Integer, ForeignKey('matches.id', ondelete='CASCADE')),
-    Column('player_id', Integer, ForeignKey('players.id', ondelete='SET NULL'), nullable=True)
+    Column('player_id', Integer, ForeignKey('players.id', ondelete='SET NULL'), nullable=True),
+    # 경기별 출전 선수 / 선수별 출전 경기 조회
+    Index('ix_match_player_match_id_player_id', 'match_id', 'player_id'),
+    Index('ix_match_player_player_id', 'player_id')
 )
 
 class Team(Base):
@@ -17,12 +20,16 @@ class Team(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True)
     description = Column(String)
-    type = Column(String)
+    type = Column(String, index=True)
     password = Column(String)
     logo_url = Column(String, nullable=True)
     image_url = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 낙관적 동시성 제어용 행 버전 (UPDATE마다 증가, 불일치 시 StaleDataError)
+    version_id = Column(Integer, nullable=False, default=1, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version_id}
 
     players = relationship("Player", back_populates="team")
     matches = relationship("Match", back_populates="team")
@@ -34,28 +41,47 @@ class Player(Base):
     name = Column(String, index=True)
     number = Column(Integer)
     position = Column(String)
-    team_id = Column(Integer, ForeignKey("teams.id"))
+    team_id = Column(Integer, ForeignKey("teams.id"), index=True)
     goal_count = Column(Integer, default=0)
     assist_count = Column(Integer, default=0)
     mom_count = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    version_id = Column(Integer, nullable=False, default=1, server_default="1")
+
+    # 경기/골 기록이 올리는 누적 기록(goal_count 등)은 서버 집계라 버전을 올리지 않음
+    # → 사용자 수정에서만 bump_version으로 직접 증가 (동시 골 기록끼리 409가 나지 않도록)
+    __mapper_args__ = {"version_id_col": version_id, "version_id_generator": False}
 
     team = relationship("Team", back_populates="players")
     matches = relationship("Match", secondary=match_player, back_populates="players")
     goals = relationship("Goal", foreign_keys="[Goal.player_id]", back_populates="player")
     assists = relationship("Goal", foreign_keys="[Goal.assist_player_id]", back_populates="assist_player")
 
+# 리그 순위표용 인덱스 (기록 내림차순, 동점이면 먼저 등록된 선수 순으로 정렬 없이 상위 N명 조회)
+Index("ix_players_goal_count", Player.goal_count.desc(), Player.id)
+Index("ix_players_assist_count", Player.assist_count.desc(), Player.id)
+Index("ix_players_mom_count", Player.mom_count.desc(), Player.id)
+
 class Match(Base):
     __tablename__ = "matches"
 
     id = Column(Integer, primary_key=True, index=True)
     date = Column(DateTime(timezone=True))
     opponent = Column(String)
+    # 상대팀별 집계용 정규화 키 (utils.match_utils.normalize_opponent)
+    opponent_key = Column(String)
     score = Column(String)
     team_id = Column(Integer, ForeignKey("teams.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    version_id = Column(Integer, nullable=False, default=1, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version_id}
+    __table_args__ = (
+        Index("ix_matches_team_id_opponent_key", "team_id", "opponent_key"),
+        Index("ix_matches_team_id_date", "team_id", "date"),
+    )
 
     team = relationship("Team", back_populates="matches")
     players = relationship("Player", secondary=match_player, back_populates="matches")
@@ -66,9 +92,9 @@ class Goal(Base):
     __tablename__ = "goals"
 
     id = Column(Integer, primary_key=True, index=True)
-    match_id = Column(Integer, ForeignKey("matches.id"))
-    player_id = Column(Integer, ForeignKey("players.id", ondelete="SET NULL"), nullable=True)
-    assist_player_id = Column(Integer, ForeignKey("players.id", ondelete="SET NULL"), nullable=True)
+    match_id = Column(Integer, ForeignKey("matches.id"), index=True)
+    player_id = Column(Integer, ForeignKey("players.id", ondelete="SET NULL"), nullable=True, index=True)
+    assist_player_id = Column(Integer, ForeignKey("players.id", ondelete="SET NULL"), nullable=True, index=True)
     quarter = Column(Integer)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -83,11 +109,277 @@ class QuarterScore(Base):
     __tablename__ = "quarter_scores"
     
     id = Column(Integer, primary_key=True, index=True)
-    match_id = Column(Integer, ForeignKey("matches.id"))
+    match_id = Column(Integer, ForeignKey("matches.id"), index=True)
     quarter = Column(Integer)
     our_score = Column(Integer)
     opponent_score = Column(Integer)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    match = relationship("Match", back_populates="quarter_scores") 
\ No newline at end of file
+    match = relationship("Match", back_populates="quarter_scores")
+
+class OpponentRecord(Base):
+    """팀-상대팀별 상대 전적 (MatchService 쓰기 시 증분 갱신)"""
+    __tablename__ = "opponent_records"
+
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id"))
+    opponent_key = Column(String)
+    opponent = Column(String)
+    matches = Column(Integer, default=0)
+    wins = Column(Integer, default=0)
+    draws = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    goals_for = Column(Integer, default=0)
+    goals_against = Column(Integer, default=0)
+    # 최근 경기 결과 (최신순, W/D/L), 최대 OPPONENT_FORM_LENGTH 경기
+    recent_form = Column(String, default="")
+    last_match_date = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_opponent_records_team_id_opponent_key", "team_id", "opponent_key", unique=True),
+    )
+
+class TeamRecord(Base):
+    """팀 통산 전적 (상대 전적과 함께 MatchService 쓰기 시 증분 갱신, 팀 승률 순위표용)"""
+    __tablename__ = "team_records"
+
+    team_id = Column(Integer, ForeignKey("teams.id"), primary_key=True)
+    matches = Column(Integer, default=0)
+    wins = Column(Integer, default=0)
+    draws = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    goals_for = Column(Integer, default=0)
+    goals_against = Column(Integer, default=0)
+    win_rate = Column(Float, default=0.0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+# 팀 승률 순위표용 인덱스 (승률, 경기 수 내림차순)
+Index("ix_team_records_win_rate", TeamRecord.win_rate.desc(), TeamRecord.matches.desc(), TeamRecord.team_id)
+
+class IdempotencyKey(Base):
+    """Idempotency-Key 헤더별 최초 응답 저장 (재시도 요청은 저장된 응답으로 재생)"""
+    __tablename__ = "idempotency_keys"
+
+    id = Column(Integer, primary_key=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
+    key = Column(String, nullable=False)
+    # 요청 메서드/경로/본문 해시 - 같은 키로 다른 요청을 보내면 거부
+    request_hash = Column(String, nullable=False)
+    # 처리 중이면 NULL, 완료되면 응답 상태 코드/본문(JSON)
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)
+    # 처리 중 선점 기한 - 지나면 선점한 요청이 죽은 것으로 보고 대기 중인 재시도가 이어받음
+    locked_until = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_idempotency_keys_team_id_key", "team_id", "key", unique=True),
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+
+class RefreshToken(Base):
+    """리프레시 토큰 (원문 대신 SHA-256 다이제스트만 저장)
+
+    - 사용할 때마다 같은 family_id로 새 토큰을 발급하고 기존 토큰은 used_at 기록 (회전)
+    - 이미 사용된 토큰이 다시 제시되면 탈취로 보고 family 전체 폐기
+    """
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
+    family_id = Column(String(32), nullable=False)
+    token_hash = Column(LargeBinary(32), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    used_at = Column(DateTime, nullable=True)
+    revoked_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_refresh_tokens_token_hash", "token_hash", unique=True),
+        Index("ix_refresh_tokens_team_id", "team_id"),
+        Index("ix_refresh_tokens_family_id", "family_id"),
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+    )
+
+class ChangeLog(Base):
+    """오프라인 동기화용 변경 기록 (세션 flush 시 record_changes가 기록)
+
+    - id가 동기화 버전: AUTOINCREMENT로 삭제된 id도 재사용하지 않아 항상 증가
+    - 팀·엔티티별 최신 변경 한 행만 유지 (이전 행은 삭제) → 크기는 엔티티 수, 조회는 변경 수에 비례
+    - deleted=1 행은 삭제 표시(tombstone)
+    """
+    __tablename__ = "change_log"
+
+    id = Column(Integer, primary_key=True)
+    team_id = Column(Integer, nullable=False)
+    entity = Column(String(16), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    deleted = Column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        Index("ix_change_log_team_id_id", "team_id", "id"),
+        Index("ix_change_log_team_id_entity_entity_id", "team_id", "entity", "entity_id", unique=True),
+        {"sqlite_autoincrement": True},
+    )
+
+# 통합 검색 인덱스 (SQLite FTS5, trigram 토크나이저로 한글 부분 문자열 검색 지원)
+# - rowid = 원본 ID * 3 + 종류 (팀 0, 선수 1, 상대팀 2) 로 트리거에서 한 행만 갱신
+# - scope: 팀 검색은 "#teams#", 선수/상대팀은 "#{team_id}#" 구문 검색으로 팀 범위 제한
+SEARCH_INDEX_TABLE_DDL = """
+    CREATE VIRTUAL TABLE search_index USING fts5(
+        title, body, scope, kind UNINDEXED, ref_id UNINDEXED, team_id UNINDEXED,
+        tokenize = 'trigram'
+    )
+"""
+
+SEARCH_INDEX_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS teams_search_insert AFTER INSERT ON teams BEGIN
+        INSERT INTO search_index(rowid, title, body, scope, kind, ref_id, team_id)
+        VALUES (new.id * 3, coalesce(new.name, ''), coalesce(new.description, ''), '#teams#', 'team', new.id, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS teams_search_update AFTER UPDATE OF name, description ON teams BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 3;
+        INSERT INTO search_index(rowid, title, body, scope, kind, ref_id, team_id)
+        VALUES (new.id * 3, coalesce(new.name, ''), coalesce(new.description, ''), '#teams#', 'team', new.id, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS teams_search_delete AFTER DELETE ON teams BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 3;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS players_search_insert AFTER INSERT ON players BEGIN
+        INSERT INTO search_index(rowid, title, body, scope, kind, ref_id, team_id)
+        VALUES (new.id * 3 + 1, coalesce(new.name, ''), coalesce(new.position, ''), '#' || new.team_id || '#', 'player', new.id, new.team_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS players_search_update AFTER UPDATE OF name, position, team_id ON players BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 3 + 1;
+        INSERT INTO search_index(rowid, title, body, scope, kind, ref_id, team_id)
+        VALUES (new.id * 3 + 1, coalesce(new.name, ''), coalesce(new.position, ''), '#' || new.team_id || '#', 'player', new.id, new.team_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS players_search_delete AFTER DELETE ON players BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 3 + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS opponent_records_search_insert AFTER INSERT ON opponent_records BEGIN
+        INSERT INTO search_index(rowid, title, body, scope, kind, ref_id, team_id)
+        VALUES (new.id * 3 + 2, coalesce(new.opponent, ''), '', '#' || new.team_id || '#', 'opponent', new.id, new.team_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS opponent_records_search_update AFTER UPDATE OF opponent ON opponent_records BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 3 + 2;
+        INSERT INTO search_index(rowid, title, body, scope, kind, ref_id, team_id)
+        VALUES (new.id * 3 + 2, coalesce(new.opponent, ''), '', '#' || new.team_id || '#', 'opponent', new.id, new.team_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS opponent_records_search_delete AFTER DELETE ON opponent_records BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 3 + 2;
+    END
+    """,
+]
+
+# 검색 인덱스가 새로 만들어질 때 기존 데이터 적재
+SEARCH_INDEX_BACKFILL = [
+    """
+    INSERT INTO search_index(rowid, title, body, scope, kind, ref_id, team_id)
+    SELECT id * 3, coalesce(name, ''), coalesce(description, ''), '#teams#', 'team', id, id FROM teams
+    """,
+    """
+    INSERT INTO search_index(rowid, title, body, scope, kind, ref_id, team_id)
+    SELECT id * 3 + 1, coalesce(name, ''), coalesce(position, ''), '#' || team_id || '#', 'player', id, team_id FROM players
+    """,
+    """
+    INSERT INTO search_index(rowid, title, body, scope, kind, ref_id, team_id)
+    SELECT id * 3 + 2, coalesce(opponent, ''), '', '#' || team_id || '#', 'opponent', id, team_id FROM opponent_records
+    """,
+]
+
+@event.listens_for(Base.metadata, "after_create")
+def create_search_index(target, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'")
+    ).first()
+    if not exists:
+        connection.execute(text(SEARCH_INDEX_TABLE_DDL))
+        for statement in SEARCH_INDEX_BACKFILL:
+            connection.execute(text(statement))
+    for statement in SEARCH_INDEX_TRIGGERS:
+        connection.execute(text(statement))
+
+@event.listens_for(Base.metadata, "before_drop")
+def drop_search_index(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("DROP TABLE IF EXISTS search_index"))
+
+# 동기화 대상 엔티티 (골/쿼터 스코어 변경은 소속 경기의 변경으로 기록)
+SYNC_ENTITIES = {Team: "team", Player: "player", Match: "match"}
+MATCH_CHILDREN = (Goal, QuarterScore)
+
+@event.listens_for(Session, "before_flush")
+def collect_modified(session, flush_context, instances):
+    """flush 전에 수정된 객체 수집 (SQL 식으로 갱신한 속성은 flush 중 만료되어 after_flush에서는 수정 여부가 보이지 않음)"""
+    session.info["modified"] = [obj for obj in session.dirty if session.is_modified(obj)]
+
+@event.listens_for(Session, "after_flush")
+def record_changes(session, flush_context):
+    """flush된 팀/선수/경기 변경을 change_log에 기록 (같은 트랜잭션, 서비스 코드 수정 없이 모든 쓰기 경로 포함)"""
+    changes = {}  # (team_id, entity, entity_id) -> deleted
+    child_match_ids = set()
+    deleted_teams = set()
+    upserted = list(session.new) + session.info.pop("modified", [])
+    for obj, deleted in [(obj, False) for obj in upserted] + [(obj, True) for obj in session.deleted]:
+        if isinstance(obj, MATCH_CHILDREN):
+            if obj.match_id is not None:
+                child_match_ids.add(obj.match_id)
+            continue
+        entity = SYNC_ENTITIES.get(type(obj))
+        if entity is None:
+            continue
+        team_id = obj.id if entity == "team" else obj.team_id
+        if team_id is None:
+            continue
+        if entity == "team" and deleted:
+            deleted_teams.add(team_id)
+        key = (team_id, entity, obj.id)
+        changes[key] = changes.get(key, False) or deleted
+
+    connection = session.connection()
+    known_matches = {entity_id for (_, entity, entity_id) in changes if entity == "match"}
+    pending = child_match_ids - known_matches
+    if pending:
+        for match_id, team_id in connection.execute(select(Match.id, Match.team_id).where(Match.id.in_(pending))):
+            changes[(team_id, "match", match_id)] = False
+
+    table = ChangeLog.__table__
+    if deleted_teams:
+        connection.execute(delete(table).where(table.c.team_id.in_(deleted_teams)))
+    changes = {key: deleted for key, deleted in changes.items() if key[0] not in deleted_teams}
+    if not changes:
+        return
+    grouped = {}
+    for team_id, entity, entity_id in changes:
+        grouped.setdefault((team_id, entity), []).append(entity_id)
+    for (team_id, entity), entity_ids in grouped.items():
+        connection.execute(delete(table).where(
+            table.c.team_id == team_id, table.c.entity == entity, table.c.entity_id.in_(entity_ids)
+        ))
+    connection.execute(insert(table), [
+        {"team_id": team_id, "entity": entity, "entity_id": entity_id, "deleted": deleted}
+        for (team_id, entity, entity_id), deleted in sorted(changes.items())
+    ])
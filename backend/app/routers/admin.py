@@ -0,0 +1,54 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
+from .. import auth, config
+from ..utils.profiler import endpoint_routes, profiler
+from ..utils.single_flight import request_coalescer
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(auth.require_admin)],
+    include_in_schema=False
+)
+
+@router.get("/metrics/hashing")
+def get_hashing_metrics():
+    """bcrypt 비용 대비 지연 (라운드별 평균/최대 ms, 풀 크기 기준 초당 검증 가능 수)"""
+    return auth.password_hasher.stats()
+
+@router.get("/metrics/coalescing")
+def get_coalescing_metrics():
+    """동시 요청 합치기 현황 (계산한 요청/결과를 공유받은 요청/대기 시간 초과 수)"""
+    return request_coalescer.stats()
+
+@router.post("/profiler/start")
+def start_profiler(
+    request: Request,
+    duration: float = Query(10.0, gt=0),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    route: Optional[str] = None
+):
+    """샘플링 프로파일러 시작 (duration초 후 자동 종료, route를 주면 해당 라우트 경로 템플릿만 수집)"""
+    if duration > config.PROFILER_MAX_DURATION:
+        raise HTTPException(status_code=400, detail=f"duration must be at most {config.PROFILER_MAX_DURATION:g} seconds")
+    endpoints = endpoint_routes(request.app.routes, route)
+    if route is not None and not endpoints:
+        raise HTTPException(status_code=404, detail=f"Route {route} not found")
+    if not profiler.start(duration, interval_ms / 1000, endpoints, only_tagged=route is not None):
+        raise HTTPException(status_code=409, detail="Profiler is already running")
+    return profiler.status()
+
+@router.post("/profiler/stop")
+def stop_profiler():
+    profiler.stop()
+    return profiler.status()
+
+@router.get("/profiler")
+def get_profile(format: str = Query("status", pattern="^(status|collapsed|speedscope)$")):
+    """마지막 프로파일 결과 (collapsed: flamegraph.pl 입력 형식, speedscope: speedscope.app JSON)"""
+    if format == "collapsed":
+        return PlainTextResponse(profiler.collapsed())
+    if format == "speedscope":
+        return profiler.speedscope()
+    return profiler.status()
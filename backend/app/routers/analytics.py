@@ -1,20 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import date
 
 from app.database import get_db
 from app.auth import get_current_team
 from app.services.analytics_service import AnalyticsService
+from app.utils.cache import analytics_cache
+from app.utils.compression import CompressedPayload
+from app.utils.single_flight import request_coalescer, route_key
 from app.schemas import (
     TeamAnalyticsOverview, GoalsWinCorrelation, ConcededLossCorrelation,
-    PlayerContributionsResponse, Team
+    PlayerContributionsResponse, OpponentRecordsResponse, RollingFormResponse,
+    AnalyticsWindow, Team
 )
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+def get_analytics_window(
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    last_n: Optional[int] = Query(None, ge=1)
+) -> AnalyticsWindow:
+    """분석 기간 필터 (?from=YYYY-MM-DD&to=YYYY-MM-DD&last_n=N)"""
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    return AnalyticsWindow(date_from=date_from, date_to=date_to, last_n=last_n)
+
+def _window_key(window: AnalyticsWindow) -> tuple:
+    return (window.date_from, window.date_to, window.last_n)
+
+def _cached_response(request: Request, team_id: int, key: tuple, model, factory):
+    """직렬화/압축까지 마친 본문을 캐시 (적중 시 협상된 인코딩 바이트를 그대로 응답)
+
+    캐시가 비어 있을 때 같은 요청이 동시에 들어오면 계산은 한 번만 (나머지는 결과 공유)
+    - 합치기 키에 팀 캐시 세대를 포함: 무효화 이후 요청은 무효화 이전에 시작한 계산에 합류하지 않음
+      (합류하면 이전 결과를 새 세대로 캐시에 저장하게 됨)
+    """
+    payload = analytics_cache.get_or_set(team_id, key, lambda: request_coalescer.do(
+        route_key(request, analytics_cache.generation(team_id)),
+        lambda: CompressedPayload.from_model(model, factory())
+    ))
+    return payload.response(request)
+
 @router.get("/team/{team_id}/overview", response_model=TeamAnalyticsOverview)
 def get_team_analytics_overview(
     team_id: int,
+    request: Request,
+    window: AnalyticsWindow = Depends(get_analytics_window),
     db: Session = Depends(get_db),
     current_team: Team = Depends(get_current_team)
 ):
@@ -28,11 +61,16 @@ def get_team_analytics_overview(
         raise HTTPException(status_code=403, detail="Access denied")
     
     analytics_service = AnalyticsService(db)
-    return analytics_service.get_team_analytics_overview(team_id)
+    return _cached_response(
+        request, team_id, ("overview", _window_key(window)), TeamAnalyticsOverview,
+        lambda: analytics_service.get_team_analytics_overview(team_id, window)
+    )
 
 @router.get("/team/{team_id}/goals-win-correlation", response_model=GoalsWinCorrelation)
 def get_goals_win_correlation(
     team_id: int,
+    request: Request,
+    window: AnalyticsWindow = Depends(get_analytics_window),
     db: Session = Depends(get_db),
     current_team: Team = Depends(get_current_team)
 ):
@@ -43,11 +81,16 @@ def get_goals_win_correlation(
         raise HTTPException(status_code=403, detail="Access denied")
     
     analytics_service = AnalyticsService(db)
-    return analytics_service.get_goals_win_correlation(team_id)
+    return _cached_response(
+        request, team_id, ("goals-win-correlation", _window_key(window)), GoalsWinCorrelation,
+        lambda: analytics_service.get_goals_win_correlation(team_id, window)
+    )
 
 @router.get("/team/{team_id}/conceded-loss-correlation", response_model=ConcededLossCorrelation)
 def get_conceded_loss_correlation(
     team_id: int,
+    request: Request,
+    window: AnalyticsWindow = Depends(get_analytics_window),
     db: Session = Depends(get_db),
     current_team: Team = Depends(get_current_team)
 ):
@@ -58,11 +101,16 @@ def get_conceded_loss_correlation(
         raise HTTPException(status_code=403, detail="Access denied")
     
     analytics_service = AnalyticsService(db)
-    return analytics_service.get_conceded_loss_correlation(team_id)
+    return _cached_response(
+        request, team_id, ("conceded-loss-correlation", _window_key(window)), ConcededLossCorrelation,
+        lambda: analytics_service.get_conceded_loss_correlation(team_id, window)
+    )
 
 @router.get("/team/{team_id}/player-contributions", response_model=PlayerContributionsResponse)
 def get_player_contributions(
     team_id: int,
+    request: Request,
+    window: AnalyticsWindow = Depends(get_analytics_window),
     db: Session = Depends(get_db),
     current_team: Team = Depends(get_current_team)
 ):
@@ -73,4 +121,52 @@ def get_player_contributions(
         raise HTTPException(status_code=403, detail="Access denied")
     
     analytics_service = AnalyticsService(db)
-    return analytics_service.get_player_contributions(team_id) 
\ No newline at end of file
+    return _cached_response(
+        request, team_id, ("player-contributions", _window_key(window)), PlayerContributionsResponse,
+        lambda: analytics_service.get_player_contributions(team_id, window)
+    )
+
+@router.get("/team/{team_id}/opponents", response_model=OpponentRecordsResponse)
+def get_opponent_records(
+    team_id: int,
+    request: Request,
+    opponent: Optional[str] = None,
+    window: AnalyticsWindow = Depends(get_analytics_window),
+    db: Session = Depends(get_db),
+    current_team: Team = Depends(get_current_team)
+):
+    """
+    상대팀별 상대 전적
+    - 승/무/패, 득점/실점, 최근 경기 결과
+    - opponent 지정 시 해당 상대팀만 조회
+    """
+    if current_team.id != team_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    analytics_service = AnalyticsService(db)
+    return _cached_response(
+        request, team_id, ("opponents", opponent, _window_key(window)), OpponentRecordsResponse,
+        lambda: analytics_service.get_opponent_records(team_id, opponent, window)
+    )
+
+@router.get("/team/{team_id}/rolling-form", response_model=RollingFormResponse)
+def get_rolling_form(
+    team_id: int,
+    request: Request,
+    size: int = Query(5, ge=1, le=50),
+    window: AnalyticsWindow = Depends(get_analytics_window),
+    db: Session = Depends(get_db),
+    current_team: Team = Depends(get_current_team)
+):
+    """
+    최근 경기 흐름 (이동 구간 승률/득실차)
+    - size: 이동 구간 경기 수
+    """
+    if current_team.id != team_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    analytics_service = AnalyticsService(db)
+    return _cached_response(
+        request, team_id, ("rolling-form", size, _window_key(window)), RollingFormResponse,
+        lambda: analytics_service.get_rolling_form(team_id, size, window)
+    )
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from .. import models, schemas, auth
+from ..database import get_db
+from ..services.leaderboard_service import LeaderboardService
+
+router = APIRouter(
+    prefix="/leaderboards",
+    tags=["leaderboards"]
+)
+
+@router.get("/players/{stat}", response_model=schemas.PlayerLeaderboard)
+def get_player_leaderboard(
+    stat: str,
+    team_type: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_team: models.Team = Depends(auth.get_current_team)
+):
+    """
+    리그 전체 선수 순위
+    - stat: goals(득점), assists(어시스트), mom(MOM)
+    - team_type: 팀 유형 필터
+    """
+    leaderboard_service = LeaderboardService(db)
+    return leaderboard_service.get_player_leaderboard(stat, team_type, limit, offset)
+
+@router.get("/teams/win-rate", response_model=schemas.TeamLeaderboard)
+def get_team_leaderboard(
+    team_type: Optional[str] = None,
+    min_matches: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_team: models.Team = Depends(auth.get_current_team)
+):
+    """
+    리그 전체 팀 승률 순위
+    - min_matches: 최소 경기 수
+    """
+    leaderboard_service = LeaderboardService(db)
+    return leaderboard_service.get_team_leaderboard(team_type, min_matches, limit, offset)
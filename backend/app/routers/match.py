@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session, joinedload
-from typing import List
+from typing import List, Optional
 from .. import models, schemas, auth
 from ..database import get_db
 from app.services.match_service import MatchService
+from app.services.idempotency_service import IdempotencyService
+from app.utils.versioning import parse_if_match, etag
+from app.utils.single_flight import request_coalescer, route_key
+from app.utils.profiler import propagate_route
 
 router = APIRouter(
     prefix="/matches",
@@ -19,9 +24,17 @@ def get_match_service(
 @router.post("/create", response_model=schemas.Match)
 def create_match(
     match: schemas.MatchCreate,
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     match_service: MatchService = Depends(get_match_service)
 ):
-    return match_service.create_match(match, match_service.current_team)
+    """Idempotency-Key 헤더가 있으면 재시도 시 경기를 다시 만들지 않고 최초 응답 반환"""
+    idempotency = IdempotencyService(match_service.db)
+    return idempotency.run(
+        match_service.current_team.id, idempotency_key,
+        idempotency.fingerprint(request.method, request.url.path, match),
+        lambda: schemas.Match.model_validate(match_service.create_match(match, match_service.current_team))
+    )
 
 @router.get("/team/{team_id}", response_model=List[schemas.Match])
 def get_team_matches(
@@ -34,9 +47,16 @@ def get_team_matches(
 def update_match(
     match_id: int,
     match_update: schemas.MatchUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None, alias="If-Match"),
     match_service: MatchService = Depends(get_match_service)
 ):
-    return match_service.update_match(match_id, match_update, match_service.current_team)
+    """If-Match(또는 본문 version_id)가 현재 버전과 다르면 409"""
+    match = match_service.update_match(
+        match_id, match_update, match_service.current_team, parse_if_match(if_match)
+    )
+    response.headers["ETag"] = etag(match.version_id)
+    return match
 
 @router.delete("/{match_id}")
 def delete_match(
@@ -48,18 +68,51 @@ def delete_match(
 @router.get("/{match_id}/detail", response_model=schemas.MatchDetail)
 async def get_match_detail(
     match_id: int,
+    request: Request,
     match_service: MatchService = Depends(get_match_service)
 ):
     """Get detailed match information including players and goals"""
-    return match_service.get_match_detail(match_id)
+    # 같은 팀의 동시 요청은 한 번만 조회 (권한 검사 결과가 팀마다 다르므로 팀 ID 포함)
+    # 조회는 스레드풀에서 실행해 이벤트 루프를 막지 않음
+    return await request_coalescer.do_async(
+        route_key(request, match_service.current_team.id),
+        lambda: run_in_threadpool(propagate_route(match_service.get_match_detail), match_id)
+    )
 
 @router.post("/{match_id}/goals", response_model=schemas.Goal)
 def add_goal(
     match_id: int,
     goal: schemas.GoalCreate,
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     match_service: MatchService = Depends(get_match_service)
 ):
-    return match_service.add_goal(match_id, goal, match_service.current_team)
+    """Idempotency-Key 헤더가 있으면 재시도 시 골/선수 기록을 다시 올리지 않고 최초 응답 반환"""
+    idempotency = IdempotencyService(match_service.db)
+    return idempotency.run(
+        match_service.current_team.id, idempotency_key,
+        idempotency.fingerprint(request.method, request.url.path, goal),
+        lambda: schemas.Goal.model_validate(match_service.add_goal(match_id, goal, match_service.current_team))
+    )
+
+@router.post("/{match_id}/goals/batch", response_model=List[schemas.Goal])
+def add_goals_batch(
+    match_id: int,
+    batch: schemas.GoalBatchCreate,
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    match_service: MatchService = Depends(get_match_service)
+):
+    """여러 골을 한 번에 기록 (MOM은 배치 전체 기준으로 한 번만 선정)"""
+    idempotency = IdempotencyService(match_service.db)
+    return idempotency.run(
+        match_service.current_team.id, idempotency_key,
+        idempotency.fingerprint(request.method, request.url.path, batch),
+        lambda: [
+            schemas.Goal.model_validate(goal)
+            for goal in match_service.add_goals_batch(match_id, batch, match_service.current_team)
+        ]
+    )
 
 @router.get("/team/{team_id}/recent", response_model=List[schemas.Match])
 def get_recent_matches(
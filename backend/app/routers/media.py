@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Request
+from .. import config
+from ..utils.media import serve_media
+from ..utils.storage import get_storage
+
+router = APIRouter(
+    prefix=f"/{config.UPLOAD_URL_PREFIX}",
+    tags=["media"]
+)
+
+@router.api_route("/{name}", methods=["GET", "HEAD"])
+async def get_media(name: str, request: Request):
+    """업로드된 로고/이미지 제공 (인증 불필요, Range/조건부 요청 지원)"""
+    return await serve_media(request, get_storage(), name)
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from .. import models, schemas, auth
 from ..database import get_db
 from ..services.player_service import PlayerService
+from ..utils.versioning import parse_if_match, etag
 
 router = APIRouter(
     prefix="/players",
@@ -32,21 +33,29 @@ def get_team_players(
 def update_player(
     player_id: int,
     player_update: schemas.PlayerUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None, alias="If-Match"),
     db: Session = Depends(get_db),
     current_team: models.Team = Depends(auth.get_current_team)
 ):
     player_service = PlayerService(db)
-    return player_service.update_player(player_id, player_update, current_team)
+    player = player_service.update_player(player_id, player_update, current_team, parse_if_match(if_match))
+    response.headers["ETag"] = etag(player.version_id)
+    return player
 
 @router.put("/{player_id}/stats", response_model=schemas.Player)
 def update_player_stats(
     player_id: int,
     player_stats: schemas.PlayerUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None, alias="If-Match"),
     db: Session = Depends(get_db),
     current_team: models.Team = Depends(auth.get_current_team)
 ):
     player_service = PlayerService(db)
-    return player_service.update_player_stats(player_id, player_stats, current_team)
+    player = player_service.update_player_stats(player_id, player_stats, current_team, parse_if_match(if_match))
+    response.headers["ETag"] = etag(player.version_id)
+    return player
 
 @router.delete("/{player_id}")
 def delete_player(
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from .. import models, schemas, auth
+from ..database import get_db
+from ..services.search_service import SearchService
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"]
+)
+
+@router.get("/teams", response_model=schemas.SearchResults)
+def search_teams(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """팀 이름/설명 검색 (로그인 화면용, 인증 불필요)"""
+    search_service = SearchService(db)
+    return search_service.search(q, kinds=["team"], limit=limit)
+
+@router.get("", response_model=schemas.SearchResults)
+def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    kinds: Optional[str] = Query(None, description="쉼표로 구분한 검색 대상 (team,player,opponent)"),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_team: models.Team = Depends(auth.get_current_team)
+):
+    """팀 전체 + 내 팀 선수/상대팀 통합 검색"""
+    search_service = SearchService(db)
+    kind_list = [kind.strip() for kind in kinds.split(",") if kind.strip()] if kinds else None
+    return search_service.search(q, current_team.id, kind_list, limit)
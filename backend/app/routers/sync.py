@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from .. import models, schemas, auth
+from ..database import get_db
+from ..services.sync_service import SyncService, SYNC_PAGE_SIZE
+
+router = APIRouter(
+    prefix="/sync",
+    tags=["sync"]
+)
+
+@router.get("/team/{team_id}", response_model=schemas.SyncResponse)
+def sync_team(
+    team_id: int,
+    since: int = Query(0, ge=0),
+    limit: int = Query(SYNC_PAGE_SIZE, ge=1, le=SYNC_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_team: models.Team = Depends(auth.get_current_team)
+):
+    """since(이전 응답의 version) 이후 생성/수정/삭제된 팀, 선수, 경기 (since=0이면 전체)"""
+    return SyncService(db).changes_since(team_id, since, current_team, limit)
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Header, Response, status, UploadFile, File
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from .. import models, schemas, auth
 from ..database import get_db
+from ..services.bootstrap_service import BootstrapService, bootstrap_etag
 from ..services.team_service import TeamService
+from ..services.token_service import TokenService
+from ..utils.versioning import parse_if_match, etag, etag_matches
+from ..utils.rate_limit import limit_login
 
 router = APIRouter(
     prefix="/teams",
@@ -15,25 +19,60 @@ async def create_team(team: schemas.TeamCreate, db: Session = Depends(get_db)):
     team_service = TeamService(db)
     return await team_service.create_team(team)
 
-@router.post("/login", response_model=schemas.Token)
+@router.post("/login", response_model=schemas.Token, dependencies=[Depends(limit_login)])
 async def login_team(team: schemas.TeamCreate, db: Session = Depends(get_db)):
     team_service = TeamService(db)
     return await team_service.login_team(team)
 
+@router.post("/token/refresh", response_model=schemas.Token)
+def refresh_token(body: schemas.TokenRefresh, db: Session = Depends(get_db)):
+    """리프레시 토큰으로 액세스 토큰 재발급 (리프레시 토큰도 새로 발급, 이전 토큰은 폐기)"""
+    return TokenService(db).refresh(body.refresh_token)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(body: schemas.TokenRefresh, db: Session = Depends(get_db)):
+    """리프레시 토큰이 속한 로그인 세션 폐기"""
+    TokenService(db).revoke(body.refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
 @router.get("/{team_id}", response_model=schemas.Team)
 def get_team(team_id: int, db: Session = Depends(get_db)):
     team_service = TeamService(db)
     return team_service.get_team(team_id)
 
+@router.get("/{team_id}/bootstrap", response_model=schemas.Bootstrap)
+def get_bootstrap(
+    team_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    db: Session = Depends(get_db),
+    current_team: models.Team = Depends(auth.get_current_team)
+):
+    """앱 시작 화면 묶음 (팀, 선수, 최근 경기, 분석 개요) - 바뀐 것이 없으면 304"""
+    if current_team.id != team_id:
+        raise HTTPException(status_code=403, detail="Not authorized to view this team")
+    bootstrap_service = BootstrapService(db)
+    version = bootstrap_service.version(team_id)
+    tag = bootstrap_etag(team_id, version)
+    headers = {"ETag": tag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, tag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return bootstrap_service.bootstrap(team_id, current_team, version)
+
 @router.put("/{team_id}", response_model=schemas.Team)
 def update_team(
     team_id: int,
     team_update: schemas.TeamUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None, alias="If-Match"),
     db: Session = Depends(get_db),
     current_team: models.Team = Depends(auth.get_current_team)
 ):
     team_service = TeamService(db)
-    return team_service.update_team(team_id, team_update, current_team)
+    team = team_service.update_team(team_id, team_update, current_team, parse_if_match(if_match))
+    response.headers["ETag"] = etag(team.version_id)
+    return team
 
 @router.delete("/{team_id}")
 def delete_team(
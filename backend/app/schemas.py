@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
 from typing import Optional, List, Dict
-from datetime import datetime
+from datetime import datetime, date
 
 # Team 스키마
 class TeamBase(BaseModel):
@@ -16,6 +16,8 @@ class TeamUpdate(BaseModel):
     description: Optional[str] = None
     type: Optional[str] = None
     password: Optional[str] = None
+    # 낙관적 동시성 제어: 클라이언트가 읽은 버전 (If-Match 헤더로도 전달 가능)
+    version_id: Optional[int] = None
 
 class Team(TeamBase):
     model_config = ConfigDict(from_attributes=True)
@@ -25,6 +27,7 @@ class Team(TeamBase):
     image_url: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    version_id: int = 1
 
 # Player 스키마
 class PlayerBase(BaseModel):
@@ -43,6 +46,7 @@ class PlayerUpdate(BaseModel):
     goal_count: Optional[int] = None
     assist_count: Optional[int] = None
     mom_count: Optional[int] = None
+    version_id: Optional[int] = None
 
 class Player(PlayerBase):
     model_config = ConfigDict(from_attributes=True)
@@ -53,6 +57,7 @@ class Player(PlayerBase):
     mom_count: int = 0
     created_at: datetime
     updated_at: Optional[datetime] = None
+    version_id: int = 1
 
 # Goal 스키마
 class GoalBase(BaseModel):
@@ -64,6 +69,17 @@ class GoalBase(BaseModel):
 class GoalCreate(GoalBase):
     pass
 
+# 골 일괄 입력 (경기 ID는 경로에서 지정)
+GOAL_BATCH_MAX_SIZE = 50
+
+class GoalBatchItem(BaseModel):
+    player_id: int
+    assist_player_id: Optional[int] = None
+    quarter: int
+
+class GoalBatchCreate(BaseModel):
+    goals: List[GoalBatchItem] = Field(..., min_length=1, max_length=GOAL_BATCH_MAX_SIZE)
+
 class Goal(GoalBase):
     model_config = ConfigDict(from_attributes=True)
     
@@ -110,6 +126,7 @@ class MatchUpdate(BaseModel):
     score: Optional[str] = None
     player_ids: Optional[List[int]] = None
     quarter_scores: Optional[List[QuarterScoreBase]] = None
+    version_id: Optional[int] = None
 
 class Match(MatchBase):
     model_config = ConfigDict(from_attributes=True)
@@ -117,6 +134,7 @@ class Match(MatchBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
+    version_id: int = 1
 
 # MatchDetail 스키마 (상세 정보를 위한 확장)
 class PlayerDetail(BaseModel):
@@ -152,11 +170,38 @@ class MatchDetail(BaseModel):
     players: List[PlayerDetail]
     goals: List[GoalDetail]
     quarter_scores: Dict[str, QuarterScoreDetail]
+    version_id: int = 1
+
+# 오프라인 동기화 스키마
+class SyncDeleted(BaseModel):
+    players: List[int] = []
+    matches: List[int] = []
+
+class SyncResponse(BaseModel):
+    """since 이후 변경분 - version을 다음 요청의 since로 사용, has_more면 이어서 요청"""
+    team_id: int
+    since: int
+    version: int
+    has_more: bool = False
+    team: Optional[Team] = None
+    players: List[Player] = []
+    matches: List[MatchDetail] = []
+    deleted: SyncDeleted = SyncDeleted()
 
 # 순환 참조 해결 (model_rebuild 사용)
 Goal.model_rebuild()
 
 # Analytics 스키마
+class AnalyticsWindow(BaseModel):
+    """분석 기간 필터 (from/to는 경기 날짜 기준 양 끝 포함, last_n은 최근 N경기)"""
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    last_n: Optional[int] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.date_from is None and self.date_to is None and self.last_n is None
+
 class TeamAnalyticsOverview(BaseModel):
     total_matches: int
     wins: int
@@ -207,10 +252,99 @@ class PlayerContributionsResponse(BaseModel):
     top_contributor: Dict[str, str]
     most_reliable: Dict[str, str]
 
+class OpponentRecordData(BaseModel):
+    opponent: str
+    matches: int
+    wins: int
+    draws: int
+    losses: int
+    win_rate: float
+    goals_for: int
+    goals_against: int
+    goal_difference: int
+    recent_form: str
+    last_match_date: Optional[datetime] = None
+
+class OpponentRecordsResponse(BaseModel):
+    opponents: List[OpponentRecordData]
+
+class RollingFormPoint(BaseModel):
+    match_id: int
+    date: datetime
+    opponent: str
+    result: str
+    goals_for: int
+    goals_against: int
+    win_rate: float
+    goal_difference: int
+
+class RollingFormResponse(BaseModel):
+    window: int
+    points: List[RollingFormPoint]
+
+# Leaderboard 스키마
+class PlayerLeaderboardEntry(BaseModel):
+    rank: int
+    player_id: int
+    name: str
+    team_id: int
+    team_name: str
+    value: int
+
+class PlayerLeaderboard(BaseModel):
+    stat: str
+    offset: int
+    limit: int
+    has_more: bool
+    entries: List[PlayerLeaderboardEntry]
+
+class TeamLeaderboardEntry(BaseModel):
+    rank: int
+    team_id: int
+    team_name: str
+    team_type: str
+    matches: int
+    wins: int
+    draws: int
+    losses: int
+    win_rate: float
+
+class TeamLeaderboard(BaseModel):
+    offset: int
+    limit: int
+    has_more: bool
+    entries: List[TeamLeaderboardEntry]
+
+# Search 스키마
+class SearchResult(BaseModel):
+    kind: str
+    id: int
+    team_id: int
+    title: str
+    subtitle: Optional[str] = None
+
+class SearchResults(BaseModel):
+    query: str
+    results: List[SearchResult]
+
+# Bootstrap 스키마 (앱 시작 화면 묶음)
+class Bootstrap(BaseModel):
+    """팀, 선수 목록, 최근 경기, 분석 개요를 한 번에 - version은 ETag 계산에 쓴 change_log 버전"""
+    version: int
+    team: Team
+    players: List[Player]
+    recent_matches: List[Match]
+    overview: TeamAnalyticsOverview
+
 # Token 스키마
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None
+
+class TokenRefresh(BaseModel):
+    refresh_token: str
 
 class TokenData(BaseModel):
     team_id: Optional[int] = None 
\ No newline at end of file
@@ -0,0 +1,229 @@
+import numpy as np
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from typing import Dict, List, Optional
+from app.models import Player, Match, match_player
+from app.schemas import (
+    TeamAnalyticsOverview, GoalsWinCorrelation, GoalRangeData,
+    ConcededLossCorrelation, ConcededRangeData,
+    PlayerContributionsResponse, PlayerContribution
+)
+from app.utils.match_utils import parse_score
+
+# 득점/실점 구간 라벨 (0~2골은 해당 인덱스, 그 외는 3+)
+BUCKET_LABELS = ["0", "1", "2", "3+"]
+
+class MatchArrays:
+    """팀 경기를 경기 ID 순 컬럼형 배열로 적재한 구조
+
+    - match_ids / goals_for / goals_against: 경기당 한 칸 (기간/최근 N경기 필터는 match_query의 SQL에서 적용)
+    - appearance_players / appearance_matches: 출전 기록 희소 행렬 (COO, 행=선수, 열=경기 인덱스)
+    """
+
+    def __init__(self, match_ids, goals_for, goals_against, player_ids, appearance_players, appearance_matches):
+        self.match_ids = match_ids
+        self.goals_for = goals_for
+        self.goals_against = goals_against
+        self.player_ids = player_ids
+        self.appearance_players = appearance_players
+        self.appearance_matches = appearance_matches
+
+    @classmethod
+    def load(cls, db: Session, match_query) -> "MatchArrays":
+        """경기 쿼리 결과를 한 번에 적재 (스코어 파싱은 경기당 한 번)"""
+        rows = sorted(match_query.with_entities(Match.id, Match.score).all(), key=lambda row: row[0])
+        count = len(rows)
+        match_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=count)
+        scores = np.array([parse_score(row[1]) for row in rows], dtype=np.int64).reshape(count, 2)
+
+        match_window = match_query.with_entities(Match.id).subquery()
+        appearances = db.execute(
+            select(match_player.c.player_id, match_player.c.match_id).where(
+                match_player.c.match_id.in_(select(match_window.c.id)),
+                match_player.c.player_id.is_not(None)
+            )
+        ).all()
+        appearance_player_ids = np.fromiter((row[0] for row in appearances), dtype=np.int64, count=len(appearances))
+        appearance_match_ids = np.fromiter((row[1] for row in appearances), dtype=np.int64, count=len(appearances))
+        player_ids, appearance_players = np.unique(appearance_player_ids, return_inverse=True)
+
+        return cls(
+            match_ids=match_ids,
+            goals_for=scores[:, 0],
+            goals_against=scores[:, 1],
+            player_ids=player_ids,
+            appearance_players=appearance_players.reshape(-1),
+            appearance_matches=np.searchsorted(match_ids, appearance_match_ids)
+        )
+
+    def __len__(self) -> int:
+        return len(self.match_ids)
+
+    @property
+    def wins(self):
+        return self.goals_for > self.goals_against
+
+    @property
+    def losses(self):
+        return self.goals_for < self.goals_against
+
+class AnalyticsEngine:
+    """MatchArrays 기반 벡터 연산 분석 (AnalyticsService의 반복문 구현과 동일한 결과)"""
+
+    def __init__(self, arrays: MatchArrays):
+        self.arrays = arrays
+
+    def overview(self) -> TeamAnalyticsOverview:
+        arrays = self.arrays
+        total_matches = len(arrays)
+        if total_matches == 0:
+            return TeamAnalyticsOverview(
+                total_matches=0, wins=0, draws=0, losses=0, win_rate=0.0,
+                avg_goals_scored=0.0, avg_goals_conceded=0.0,
+                highest_scoring_match={"match_id": 0, "goals": 0},
+                most_conceded_match={"match_id": 0, "goals": 0}
+            )
+
+        wins = int(np.count_nonzero(arrays.wins))
+        losses = int(np.count_nonzero(arrays.losses))
+        draws = total_matches - wins - losses
+        total_goals_scored = int(arrays.goals_for.sum())
+        total_goals_conceded = int(arrays.goals_against.sum())
+
+        return TeamAnalyticsOverview(
+            total_matches=total_matches,
+            wins=wins,
+            draws=draws,
+            losses=losses,
+            win_rate=round(wins / total_matches * 100, 1),
+            avg_goals_scored=round(total_goals_scored / total_matches, 1),
+            avg_goals_conceded=round(total_goals_conceded / total_matches, 1),
+            highest_scoring_match=self._first_max(arrays.goals_for),
+            most_conceded_match=self._first_max(arrays.goals_against)
+        )
+
+    def _first_max(self, goals) -> Dict[str, int]:
+        """최댓값을 처음 기록한 경기 (0골이면 기본값)"""
+        index = int(np.argmax(goals))
+        if goals[index] <= 0:
+            return {"match_id": 0, "goals": 0}
+        return {"match_id": int(self.arrays.match_ids[index]), "goals": int(goals[index])}
+
+    def _bucket_counts(self, goals, outcome):
+        """0/1/2/3+ 구간별 (경기 수, 결과 수), 0~2 이외의 값은 모두 3+ 구간"""
+        buckets = np.where((goals >= 0) & (goals <= 2), goals, 3)
+        matches = np.bincount(buckets, minlength=4)
+        outcomes = np.bincount(buckets[outcome], minlength=4)
+        return [(label, int(matches[i]), int(outcomes[i])) for i, label in enumerate(BUCKET_LABELS) if matches[i] > 0]
+
+    def goals_win_correlation(self) -> GoalsWinCorrelation:
+        arrays = self.arrays
+        goal_ranges = []
+        total_wins = total_goals_for_wins = 0
+        for label, matches_count, wins_count in self._bucket_counts(arrays.goals_for, arrays.wins):
+            goal_ranges.append(GoalRangeData(
+                goals=label,
+                matches=matches_count,
+                wins=wins_count,
+                win_rate=round(wins_count / matches_count * 100, 1)
+            ))
+            total_wins += wins_count
+            total_goals_for_wins += wins_count * BUCKET_LABELS.index(label)
+
+        optimal_goals = 0
+        highest_win_rate = 0
+        for range_data in goal_ranges:
+            if range_data.win_rate > highest_win_rate:
+                highest_win_rate = range_data.win_rate
+                optimal_goals = BUCKET_LABELS.index(range_data.goals)
+
+        avg_goals_for_win = (total_goals_for_wins / total_wins) if total_wins > 0 else 0.0
+        return GoalsWinCorrelation(
+            goal_ranges=goal_ranges,
+            optimal_goals=optimal_goals,
+            avg_goals_for_win=round(avg_goals_for_win, 1)
+        )
+
+    def conceded_loss_correlation(self) -> ConcededLossCorrelation:
+        arrays = self.arrays
+        conceded_ranges = []
+        total_losses = total_conceded_for_losses = 0
+        for label, matches_count, losses_count in self._bucket_counts(arrays.goals_against, arrays.losses):
+            conceded_ranges.append(ConcededRangeData(
+                conceded=label,
+                matches=matches_count,
+                losses=losses_count,
+                loss_rate=round(losses_count / matches_count * 100, 1)
+            ))
+            total_losses += losses_count
+            total_conceded_for_losses += losses_count * BUCKET_LABELS.index(label)
+
+        danger_threshold = 3
+        for range_data in conceded_ranges:
+            if range_data.loss_rate >= 50.0:
+                danger_threshold = BUCKET_LABELS.index(range_data.conceded)
+                break
+
+        avg_conceded_for_loss = (total_conceded_for_losses / total_losses) if total_losses > 0 else 0.0
+        return ConcededLossCorrelation(
+            conceded_ranges=conceded_ranges,
+            danger_threshold=danger_threshold,
+            avg_conceded_for_loss=round(avg_conceded_for_loss, 1)
+        )
+
+    def player_contributions(
+        self, players: List[Player], windowed_stats: Optional[Dict[int, tuple]] = None
+    ) -> PlayerContributionsResponse:
+        """선수별 출전/승리 수는 출전 희소 행렬에서 bincount로 한 번에 계산"""
+        arrays = self.arrays
+        player_count = len(arrays.player_ids)
+        matches_played = np.bincount(arrays.appearance_players, minlength=player_count)
+        wins = np.bincount(arrays.appearance_players[arrays.wins[arrays.appearance_matches]], minlength=player_count)
+        player_index = {int(player_id): i for i, player_id in enumerate(arrays.player_ids)}
+
+        player_contributions = []
+        for player in players:
+            index = player_index.get(player.id)
+            if index is None:
+                continue
+            matches_count = int(matches_played[index])
+            wins_count = int(wins[index])
+
+            if windowed_stats is not None:
+                goal_count, assist_count, mom_count = windowed_stats.get(player.id, (0, 0, 0))
+            else:
+                goal_count, assist_count, mom_count = player.goal_count, player.assist_count, player.mom_count
+
+            win_rate = wins_count / matches_count * 100
+            contribution_score = (win_rate / 100) * (goal_count * 4 + assist_count * 2) * (mom_count + 1)
+            contribution_score = int(contribution_score * 100) / 100
+
+            player_contributions.append(PlayerContribution(
+                id=player.id,
+                name=player.name,
+                matches_played=matches_count,
+                wins=wins_count,
+                win_rate=round(win_rate, 1),
+                goals=goal_count,
+                assists=assist_count,
+                mom_count=mom_count,
+                contribution_score=contribution_score,
+                avg_goals_per_match=round(goal_count / matches_count, 2)
+            ))
+
+        top_contributor = {"name": "", "score": "0"}
+        most_reliable = {"name": "", "win_rate": "0"}
+        if player_contributions:
+            top_player = max(player_contributions, key=lambda p: p.contribution_score)
+            top_contributor = {"name": top_player.name, "score": str(top_player.contribution_score)}
+
+            reliable_players = [p for p in player_contributions if p.matches_played >= 3]
+            if reliable_players:
+                reliable_player = max(reliable_players, key=lambda p: p.win_rate)
+                most_reliable = {"name": reliable_player.name, "win_rate": str(reliable_player.win_rate)}
+
+        return PlayerContributionsResponse(
+            players=sorted(player_contributions, key=lambda p: p.contribution_score, reverse=True),
+            top_contributor=top_contributor,
+            most_reliable=most_reliable
+        )
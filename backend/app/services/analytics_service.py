@@ -1,39 +1,64 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, cast, Integer
-from typing import List, Dict, Any
-from app.models import Team, Player, Match, Goal, QuarterScore
+from sqlalchemy import func, case, cast, Integer, select
+from typing import List, Dict, Any, Optional
+from collections import deque
+from datetime import datetime, time, timedelta
+from app.models import Team, Player, Match, Goal, QuarterScore, OpponentRecord
 from app.schemas import (
     TeamAnalyticsOverview, GoalsWinCorrelation, GoalRangeData,
     ConcededLossCorrelation, ConcededRangeData,
-    PlayerContributionsResponse, PlayerContribution
+    PlayerContributionsResponse, PlayerContribution,
+    OpponentRecordsResponse, OpponentRecordData,
+    AnalyticsWindow, RollingFormResponse, RollingFormPoint
 )
+from app.utils.match_utils import parse_score, get_match_result, normalize_opponent, select_mom
+from app.services.match_service import OPPONENT_FORM_LENGTH
+from app.utils.tracing import trace_methods
 
+@trace_methods
 class AnalyticsService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, use_engine: bool = True):
         self.db = db
+        # True면 컬럼형 배열 기반 AnalyticsEngine 사용, False면 경기별 반복문 구현 사용
+        self.use_engine = use_engine
     
     def _parse_score(self, score: str) -> tuple:
         """스코어 문자열을 파싱하여 우리팀 점수와 상대팀 점수를 반환"""
-        try:
-            our_score, opponent_score = map(int, score.split(':'))
-            return our_score, opponent_score
-        except:
-            return 0, 0
+        return parse_score(score)
     
     def _get_match_result(self, score: str) -> str:
         """경기 결과 계산 (WIN/DRAW/LOSE)"""
-        our_score, opponent_score = self._parse_score(score)
-        if our_score > opponent_score:
-            return 'WIN'
-        elif our_score < opponent_score:
-            return 'LOSE'
-        else:
-            return 'DRAW'
+        return get_match_result(*parse_score(score))
+    
+    def _window_query(self, team_id: int, window: Optional[AnalyticsWindow] = None):
+        """기간 필터가 적용된 팀 경기 쿼리 ((team_id, date) 인덱스 사용)"""
+        query = self.db.query(Match).filter(Match.team_id == team_id)
+        if window is None:
+            return query
+        if window.date_from is not None:
+            query = query.filter(Match.date >= datetime.combine(window.date_from, time.min))
+        if window.date_to is not None:
+            query = query.filter(Match.date < datetime.combine(window.date_to + timedelta(days=1), time.min))
+        if window.last_n is not None:
+            query = query.order_by(Match.date.desc(), Match.id.desc()).limit(window.last_n)
+        return query
+    
+    def _get_engine(self, team_id: int, window: Optional[AnalyticsWindow] = None):
+        """기간 내 경기를 컬럼형 배열로 한 번 적재한 분석 엔진 (NumPy는 첫 분석 요청 시 로드)"""
+        from app.services.analytics_engine import AnalyticsEngine, MatchArrays
+        return AnalyticsEngine(MatchArrays.load(self.db, self._window_query(team_id, window)))
+    
+    def _get_matches(self, team_id: int, window: Optional[AnalyticsWindow] = None) -> List[Match]:
+        """기간 내 경기 목록 (집계 결과가 조회 순서에 좌우되지 않도록 ID 순 정렬)"""
+        return sorted(self._window_query(team_id, window).all(), key=lambda match: match.id)
     
-    def get_team_analytics_overview(self, team_id: int) -> TeamAnalyticsOverview:
+    def get_team_analytics_overview(self, team_id: int, window: Optional[AnalyticsWindow] = None) -> TeamAnalyticsOverview:
         """팀 전체 통계 개요"""
-        # 전체 경기 조회
-        matches = self.db.query(Match).filter(Match.team_id == team_id).all()
+        if self.use_engine:
+            return self._get_engine(team_id, window).overview()
+        
+        # 기간 내 경기 조회
+        matches = self._get_matches(team_id, window)
         
         if not matches:
             return TeamAnalyticsOverview(
@@ -85,9 +110,12 @@ class AnalyticsService:
             most_conceded_match=most_conceded
         )
     
-    def get_goals_win_correlation(self, team_id: int) -> GoalsWinCorrelation:
+    def get_goals_win_correlation(self, team_id: int, window: Optional[AnalyticsWindow] = None) -> GoalsWinCorrelation:
         """득점 수별 승률 분석"""
-        matches = self.db.query(Match).filter(Match.team_id == team_id).all()
+        if self.use_engine:
+            return self._get_engine(team_id, window).goals_win_correlation()
+        
+        matches = self._get_matches(team_id, window)
         
         # 득점별 그룹화
         goal_groups = {"0": [], "1": [], "2": [], "3+": []}
@@ -144,9 +172,12 @@ class AnalyticsService:
             avg_goals_for_win=round(avg_goals_for_win, 1)
         )
     
-    def get_conceded_loss_correlation(self, team_id: int) -> ConcededLossCorrelation:
+    def get_conceded_loss_correlation(self, team_id: int, window: Optional[AnalyticsWindow] = None) -> ConcededLossCorrelation:
         """실점 수별 패배율 분석"""
-        matches = self.db.query(Match).filter(Match.team_id == team_id).all()
+        if self.use_engine:
+            return self._get_engine(team_id, window).conceded_loss_correlation()
+        
+        matches = self._get_matches(team_id, window)
         
         # 실점별 그룹화
         conceded_groups = {"0": [], "1": [], "2": [], "3+": []}
@@ -202,37 +233,57 @@ class AnalyticsService:
             avg_conceded_for_loss=round(avg_conceded_for_loss, 1)
         )
     
-    def get_player_contributions(self, team_id: int) -> PlayerContributionsResponse:
+    def get_player_contributions(self, team_id: int, window: Optional[AnalyticsWindow] = None) -> PlayerContributionsResponse:
         """선수별 승리 기여도 분석"""
         # 선수 및 출전 경기 정보 조회
         players_data = self.db.query(Player).filter(Player.team_id == team_id).all()
         
+        # 기간 필터가 있으면 누적 통계 대신 기간 내 골 기록으로 득점/어시스트/MOM 계산
+        window_ids = None
+        windowed_stats = {}
+        if window is not None and not window.is_empty:
+            window_ids = self._window_query(team_id, window).with_entities(Match.id).subquery()
+            windowed_stats = self._get_windowed_player_stats(window_ids)
+        
+        if self.use_engine:
+            return self._get_engine(team_id, window).player_contributions(
+                players_data, windowed_stats if window_ids is not None else None
+            )
+        
         player_contributions = []
         
         for player in players_data:
             # 출전 경기 조회 (match_player 테이블을 통해)
-            matches_played = self.db.query(Match).join(
+            matches_query = self.db.query(Match).join(
                 Match.players
             ).filter(
                 Match.team_id == team_id,
                 Player.id == player.id
-            ).all()
+            )
+            if window_ids is not None:
+                matches_query = matches_query.filter(Match.id.in_(select(window_ids.c.id)))
+            matches_played = matches_query.all()
             
             matches_count = len(matches_played)
             if matches_count == 0:
                 continue
             
+            if window_ids is not None:
+                goal_count, assist_count, mom_count = windowed_stats.get(player.id, (0, 0, 0))
+            else:
+                goal_count, assist_count, mom_count = player.goal_count, player.assist_count, player.mom_count
+            
             # 승리한 경기 수 계산
             wins = sum(1 for match in matches_played if self._get_match_result(match.score) == 'WIN')
             win_rate = (wins / matches_count * 100) if matches_count > 0 else 0.0
             
             # 기여도 점수 계산 (승률 * (골*4 + 어시스트*2) * (MOM+1))
-            contribution_score = (win_rate / 100) * (player.goal_count * 4 + 
-                                                   player.assist_count * 2) * (player.mom_count + 1)
+            contribution_score = (win_rate / 100) * (goal_count * 4 + 
+                                                   assist_count * 2) * (mom_count + 1)
             # 소수점 두자리 이하 버림
             contribution_score = int(contribution_score * 100) / 100
             
-            avg_goals_per_match = player.goal_count / matches_count if matches_count > 0 else 0.0
+            avg_goals_per_match = goal_count / matches_count if matches_count > 0 else 0.0
             
             player_contributions.append(PlayerContribution(
                 id=player.id,
@@ -240,9 +291,9 @@ class AnalyticsService:
                 matches_played=matches_count,
                 wins=wins,
                 win_rate=round(win_rate, 1),
-                goals=player.goal_count,
-                assists=player.assist_count,
-                mom_count=player.mom_count,
+                goals=goal_count,
+                assists=assist_count,
+                mom_count=mom_count,
                 contribution_score=contribution_score,
                 avg_goals_per_match=round(avg_goals_per_match, 2)
             ))
@@ -266,4 +317,126 @@ class AnalyticsService:
             players=sorted(player_contributions, key=lambda p: p.contribution_score, reverse=True),
             top_contributor=top_contributor,
             most_reliable=most_reliable
-        ) 
\ No newline at end of file
+        )
+    
+    def _get_windowed_player_stats(self, window_ids) -> Dict[int, tuple]:
+        """기간 내 골 기록으로 선수별 (득점, 어시스트, MOM) 계산"""
+        goals = self.db.query(Goal.match_id, Goal.player_id, Goal.assist_player_id).filter(
+            Goal.match_id.in_(select(window_ids.c.id))
+        ).order_by(Goal.id).all()
+        
+        stats = {}
+        goals_by_match = {}
+        for match_id, player_id, assist_player_id in goals:
+            goals_by_match.setdefault(match_id, []).append((player_id, assist_player_id))
+            stats.setdefault(player_id, [0, 0, 0])[0] += 1
+            if assist_player_id:
+                stats.setdefault(assist_player_id, [0, 0, 0])[1] += 1
+        for match_goals in goals_by_match.values():
+            mom_player_id = select_mom(match_goals)
+            if mom_player_id:
+                stats.setdefault(mom_player_id, [0, 0, 0])[2] += 1
+        return {player_id: tuple(values) for player_id, values in stats.items()}
+    
+    def get_opponent_records(
+        self, team_id: int, opponent: Optional[str] = None, window: Optional[AnalyticsWindow] = None
+    ) -> OpponentRecordsResponse:
+        """상대팀별 상대 전적 (사전 집계된 opponent_records 조회, 경기 수가 아닌 상대팀 수에 비례)"""
+        if window is not None and not window.is_empty:
+            return self._aggregate_opponent_records(team_id, opponent, window)
+        
+        query = self.db.query(OpponentRecord).filter(OpponentRecord.team_id == team_id)
+        if opponent is not None:
+            query = query.filter(OpponentRecord.opponent_key == normalize_opponent(opponent))
+        # 집계 테이블 도입 이전 경기는 마이그레이션(0002) 또는 `python -m app.manage rebuild-records`로 백필
+        records = query.order_by(OpponentRecord.matches.desc(), OpponentRecord.opponent_key).all()
+        
+        return OpponentRecordsResponse(opponents=[
+            OpponentRecordData(
+                opponent=record.opponent,
+                matches=record.matches,
+                wins=record.wins,
+                draws=record.draws,
+                losses=record.losses,
+                win_rate=round(record.wins / record.matches * 100, 1) if record.matches > 0 else 0.0,
+                goals_for=record.goals_for,
+                goals_against=record.goals_against,
+                goal_difference=record.goals_for - record.goals_against,
+                recent_form=record.recent_form or "",
+                last_match_date=record.last_match_date
+            )
+            for record in records
+        ])
+    
+    def _aggregate_opponent_records(
+        self, team_id: int, opponent: Optional[str], window: AnalyticsWindow
+    ) -> OpponentRecordsResponse:
+        """기간 필터가 있는 상대 전적은 사전 집계를 쓸 수 없으므로 기간 내 경기만 집계"""
+        opponent_key = normalize_opponent(opponent) if opponent is not None else None
+        records = {}
+        for match in sorted(self._window_query(team_id, window).all(), key=lambda m: (m.date, m.id)):
+            key = normalize_opponent(match.opponent)
+            if opponent_key is not None and key != opponent_key:
+                continue
+            our_score, opponent_score = parse_score(match.score)
+            result = get_match_result(our_score, opponent_score)
+            record = records.setdefault(key, {
+                "opponent": match.opponent, "matches": 0, "wins": 0, "draws": 0, "losses": 0,
+                "goals_for": 0, "goals_against": 0, "recent_form": "", "last_match_date": None
+            })
+            record["opponent"] = match.opponent
+            record["matches"] += 1
+            record["wins"] += result == 'WIN'
+            record["draws"] += result == 'DRAW'
+            record["losses"] += result == 'LOSE'
+            record["goals_for"] += our_score
+            record["goals_against"] += opponent_score
+            record["recent_form"] = (result[0] + record["recent_form"])[:OPPONENT_FORM_LENGTH]
+            record["last_match_date"] = match.date
+        
+        ordered = sorted(records.items(), key=lambda item: (-item[1]["matches"], item[0]))
+        return OpponentRecordsResponse(opponents=[
+            OpponentRecordData(
+                win_rate=round(record["wins"] / record["matches"] * 100, 1),
+                goal_difference=record["goals_for"] - record["goals_against"],
+                **record
+            )
+            for _, record in ordered
+        ])
+    
+    def get_rolling_form(
+        self, team_id: int, window_size: int = 5, window: Optional[AnalyticsWindow] = None
+    ) -> RollingFormResponse:
+        """최근 window_size 경기 이동 구간의 승률/득실차 추이 (날짜순 한 번의 순회로 계산)"""
+        query = self._window_query(team_id, window)
+        if window is not None and window.last_n is not None:
+            matches = query.all()[::-1]
+        else:
+            matches = query.order_by(Match.date.asc(), Match.id.asc()).all()
+        
+        points = []
+        recent = deque()
+        wins = goal_difference = 0
+        for match in matches:
+            goals_for, goals_against = parse_score(match.score)
+            result = get_match_result(goals_for, goals_against)
+            recent.append((result == 'WIN', goals_for - goals_against))
+            wins += result == 'WIN'
+            goal_difference += goals_for - goals_against
+            if len(recent) > window_size:
+                dropped_win, dropped_difference = recent.popleft()
+                wins -= dropped_win
+                goal_difference -= dropped_difference
+            
+            points.append(RollingFormPoint(
+                match_id=match.id,
+                date=match.date,
+                opponent=match.opponent,
+                result=result,
+                goals_for=goals_for,
+                goals_against=goals_against,
+                win_rate=round(wins / len(recent) * 100, 1),
+                goal_difference=goal_difference
+            ))
+        
+        return RollingFormResponse(window=window_size, points=points)
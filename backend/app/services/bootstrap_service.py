@@ -0,0 +1,56 @@
+from app import models
+from app.schemas import AnalyticsWindow
+from app.services.analytics_service import AnalyticsService
+from app.services.match_service import MatchService
+from app.utils.cache import analytics_cache
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
+from fastapi import HTTPException
+from datetime import datetime
+from typing import Dict
+
+def bootstrap_etag(team_id: int, version: int) -> str:
+    """change_log 버전 + 날짜 (최근 경기 목록은 오늘 날짜 기준으로 나뉘므로 날짜가 바뀌면 새 태그)"""
+    return f'"{team_id}-{version}-{datetime.now().date():%Y%m%d}"'
+
+class BootstrapService:
+    """앱 시작 화면 묶음 - 팀, 선수 목록, 최근 경기, 분석 개요
+
+    - 개별 API 네 번 대신 인증/세션/연결 체크아웃 한 번으로 같은 세션에서 조회
+      (버전, 팀+선수 JOIN, 최근 경기 - 분석 개요가 캐시에 있으면 쿼리 세 번)
+    - 분석 개요는 분석 캐시에 보관 (경기/선수 변경 시 무효화)
+    - 팀·선수·경기(골, 쿼터 점수 포함) 변경은 모두 change_log id를 올리므로
+      팀의 최신 change_log id로 묶음 전체의 ETag를 계산 (인덱스 조회 한 번으로 304 판단)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def version(self, team_id: int) -> int:
+        return self.db.query(func.max(models.ChangeLog.id)).filter(
+            models.ChangeLog.team_id == team_id
+        ).scalar() or 0
+
+    def bootstrap(self, team_id: int, current_team: models.Team, version: int = None) -> Dict:
+        if current_team.id != team_id:
+            raise HTTPException(status_code=403, detail="Not authorized to view this team")
+
+        if version is None:
+            version = self.version(team_id)
+        window = AnalyticsWindow()
+        # 팀 행과 선수 목록은 JOIN 한 번으로 (최근 경기는 미래/과거 정렬·LIMIT이 필요해 별도 쿼리 한 번)
+        team = self.db.query(models.Team).options(joinedload(models.Team.players)).filter(
+            models.Team.id == team_id
+        ).first()
+        if team is None:
+            raise HTTPException(status_code=404, detail="Team not found")
+        return {
+            "version": version,
+            "team": team,
+            "players": team.players,
+            "recent_matches": MatchService(self.db).get_recent_matches(team_id, current_team),
+            "overview": analytics_cache.get_or_set(
+                team_id, ("bootstrap-overview",),
+                lambda: AnalyticsService(self.db).get_team_analytics_overview(team_id, window)
+            ),
+        }
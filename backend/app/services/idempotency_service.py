@@ -0,0 +1,156 @@
+import hashlib
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app import config, models
+from app.utils.cache import analytics_cache
+from app.utils.versioning import deferred_commit
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+# 만료 키 정리 주기 (요청 경로에서 가끔 한 번만 DELETE 실행)
+PURGE_INTERVAL_SECONDS = 60.0
+_last_purge = 0.0
+
+class IdempotencyService:
+    """Idempotency-Key 기반 중복 요청 방지
+
+    - 최초 요청: (팀, 키) 행을 먼저 커밋해 선점(짧은 기한)한 뒤 핸들러 실행
+    - 핸들러의 쓰기와 응답 저장은 한 트랜잭션으로 커밋 (핸들러 안의 서비스 커밋은 flush로 대신)
+      → 응답 없이 쓰기만 남는 경우가 없으므로 실패 시 키를 풀거나 기한이 지난 선점을 이어받아도 중복 실행되지 않음
+    - 재시도: 핸들러를 다시 실행하지 않고 저장된 응답 재생 (Idempotent-Replayed 헤더)
+    - 동시 중복: 고유 인덱스 충돌로 감지하고 최초 요청 완료를 기다렸다가 재생,
+      선점 기한이 지나면 (최초 요청이 죽은 경우) 대기하던 요청이 이어받아 실행
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def fingerprint(self, method: str, path: str, payload: Any) -> str:
+        body = json.dumps(jsonable_encoder(payload), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(f"{method} {path}\n{body}".encode()).hexdigest()
+
+    def run(self, team_id: int, key: Optional[str], request_hash: str, handler: Callable[[], Any]):
+        """키가 없으면 그대로 실행, 있으면 한 번만 실행하고 이후에는 저장된 응답 반환"""
+        if not key:
+            return handler()
+        if len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            raise HTTPException(status_code=400, detail="Idempotency-Key is too long")
+
+        self._purge_expired()
+        record = self._claim(team_id, key, request_hash)
+        if record.status_code is not None:
+            return self._replay(record)
+
+        record_id, lease = record.id, record.locked_until
+        try:
+            with deferred_commit(self.db):
+                body = jsonable_encoder(handler())
+        except Exception:
+            # 핸들러의 쓰기는 커밋 전이므로 되돌리고, 키를 풀어 재시도 허용
+            self.db.rollback()
+            self._owned(record_id, lease).delete(synchronize_session=False)
+            self.db.commit()
+            raise
+
+        # 선점 기한이 지나 다른 요청이 이어받았으면 이 요청의 쓰기는 버림
+        stored = self._owned(record_id, lease).update({
+            models.IdempotencyKey.status_code: 200,
+            models.IdempotencyKey.response_body: json.dumps(body, ensure_ascii=False),
+            models.IdempotencyKey.locked_until: None,
+        }, synchronize_session=False)
+        if stored != 1:
+            self.db.rollback()
+            raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still in progress")
+        self.db.commit()
+        # 핸들러 안의 캐시 무효화는 커밋 전에 일어났으므로 커밋 후 다시 무효화
+        analytics_cache.invalidate_team(team_id)
+        return body
+
+    def _owned(self, record_id: int, lease: datetime):
+        """아직 이 요청이 선점하고 있는 처리 중 행"""
+        return self.db.query(models.IdempotencyKey).filter(
+            models.IdempotencyKey.id == record_id,
+            models.IdempotencyKey.status_code.is_(None),
+            models.IdempotencyKey.locked_until == lease
+        )
+
+    def _claim(self, team_id: int, key: str, request_hash: str) -> models.IdempotencyKey:
+        """키 선점 (이미 있으면 완료될 때까지 대기 후 기존 행 반환, 선점 기한이 지났으면 이어받음)"""
+        now = datetime.utcnow()
+        record = models.IdempotencyKey(
+            team_id=team_id, key=key, request_hash=request_hash,
+            locked_until=now + timedelta(seconds=config.IDEMPOTENCY_LEASE_SECONDS),
+            created_at=now, expires_at=now + timedelta(seconds=config.IDEMPOTENCY_TTL_SECONDS)
+        )
+        self.db.add(record)
+        try:
+            self.db.commit()
+            return record
+        except IntegrityError:
+            self.db.rollback()
+
+        deadline = time.monotonic() + config.IDEMPOTENCY_WAIT_SECONDS
+        while True:
+            existing = self.db.query(models.IdempotencyKey).filter(
+                models.IdempotencyKey.team_id == team_id,
+                models.IdempotencyKey.key == key
+            ).populate_existing().first()
+            if existing is None:
+                # 최초 요청이 실패해 키가 풀림 - 다시 선점 시도
+                return self._claim(team_id, key, request_hash)
+            now = datetime.utcnow()
+            if existing.expires_at < now:
+                # 아직 정리되지 않은 만료 키는 새 요청으로 취급
+                self.db.delete(existing)
+                self.db.commit()
+                return self._claim(team_id, key, request_hash)
+            if existing.request_hash != request_hash:
+                raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request")
+            if existing.status_code is not None:
+                return existing
+            if existing.locked_until is None or existing.locked_until < now:
+                # 선점한 요청이 기한 안에 끝나지 못함 (프로세스 종료 등) - 기한을 갱신한 요청 하나만 이어받음
+                lease = now + timedelta(seconds=config.IDEMPOTENCY_LEASE_SECONDS)
+                taken = self.db.query(models.IdempotencyKey).filter(
+                    models.IdempotencyKey.id == existing.id,
+                    models.IdempotencyKey.status_code.is_(None),
+                    models.IdempotencyKey.locked_until.is_(None) if existing.locked_until is None
+                    else models.IdempotencyKey.locked_until == existing.locked_until
+                ).update({models.IdempotencyKey.locked_until: lease}, synchronize_session=False)
+                self.db.commit()
+                if taken == 1:
+                    # 일괄 UPDATE는 세션의 객체를 갱신하지 않음 (expire_on_commit=False) - run()이 새 기한으로 소유 확인
+                    set_committed_value(existing, "locked_until", lease)
+                    return existing
+                continue
+            if time.monotonic() >= deadline:
+                raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still in progress")
+            self.db.rollback()
+            time.sleep(0.05)
+
+    def _replay(self, record: models.IdempotencyKey) -> JSONResponse:
+        return JSONResponse(
+            status_code=record.status_code,
+            content=json.loads(record.response_body),
+            headers={"Idempotent-Replayed": "true"}
+        )
+
+    def _purge_expired(self) -> None:
+        global _last_purge
+        now = time.monotonic()
+        if now - _last_purge < PURGE_INTERVAL_SECONDS:
+            return
+        _last_purge = now
+        self.db.query(models.IdempotencyKey).filter(
+            models.IdempotencyKey.expires_at < datetime.utcnow()
+        ).delete(synchronize_session=False)
+        self.db.commit()
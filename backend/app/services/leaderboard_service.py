@@ -0,0 +1,87 @@
+from app import models, schemas
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from typing import Optional
+
+# 순위 기준 -> 정렬 컬럼 (각 컬럼에 인덱스가 있어 상위 N명만 인덱스 역순으로 읽음)
+PLAYER_STATS = {
+    "goals": models.Player.goal_count,
+    "assists": models.Player.assist_count,
+    "mom": models.Player.mom_count,
+}
+
+class LeaderboardService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_player_leaderboard(self, stat: str, team_type: Optional[str] = None, limit: int = 20, offset: int = 0):
+        column = PLAYER_STATS.get(stat)
+        if column is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown stat '{stat}' (expected one of: {', '.join(PLAYER_STATS)})"
+            )
+        
+        query = (
+            self.db.query(models.Player.id, models.Player.name, models.Player.team_id, models.Team.name, column)
+            .join(models.Team, models.Team.id == models.Player.team_id)
+            .filter(column > 0)
+        )
+        if team_type is not None:
+            query = query.filter(models.Team.type == team_type)
+        # 동점이면 먼저 등록된 선수 우선
+        rows = query.order_by(column.desc(), models.Player.id.asc()).offset(offset).limit(limit + 1).all()
+        
+        return schemas.PlayerLeaderboard(
+            stat=stat,
+            offset=offset,
+            limit=limit,
+            has_more=len(rows) > limit,
+            entries=[
+                schemas.PlayerLeaderboardEntry(
+                    rank=offset + i + 1,
+                    player_id=player_id,
+                    name=name,
+                    team_id=team_id,
+                    team_name=team_name,
+                    value=value
+                )
+                for i, (player_id, name, team_id, team_name, value) in enumerate(rows[:limit])
+            ]
+        )
+
+    def get_team_leaderboard(self, team_type: Optional[str] = None, min_matches: int = 1, limit: int = 20, offset: int = 0):
+        """팀 승률 순위 (MatchService가 갱신하는 team_records의 win_rate 인덱스 사용)"""
+        query = (
+            self.db.query(models.TeamRecord, models.Team.name, models.Team.type)
+            .join(models.Team, models.Team.id == models.TeamRecord.team_id)
+            .filter(models.TeamRecord.matches >= min_matches)
+        )
+        if team_type is not None:
+            query = query.filter(models.Team.type == team_type)
+        rows = (
+            query.order_by(models.TeamRecord.win_rate.desc(), models.TeamRecord.matches.desc(), models.TeamRecord.team_id.asc())
+            .offset(offset)
+            .limit(limit + 1)
+            .all()
+        )
+        
+        return schemas.TeamLeaderboard(
+            offset=offset,
+            limit=limit,
+            has_more=len(rows) > limit,
+            entries=[
+                schemas.TeamLeaderboardEntry(
+                    rank=offset + i + 1,
+                    team_id=record.team_id,
+                    team_name=team_name,
+                    team_type=team_kind or "",
+                    matches=record.matches,
+                    wins=record.wins,
+                    draws=record.draws,
+                    losses=record.losses,
+                    win_rate=round(record.win_rate * 100, 1)
+                )
+                for i, (record, team_name, team_kind) in enumerate(rows[:limit])
+            ]
+        )
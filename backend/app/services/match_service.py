@@ -1,9 +1,72 @@
 from app import models, schemas
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+from collections import Counter
+from app.utils.match_utils import parse_score, get_match_result, normalize_opponent, select_mom
+from app.utils.cache import analytics_cache
+from app.utils.versioning import check_version, commit_versioned
+from app.utils.tracing import trace_methods
 
+# 상대 전적에 보관할 최근 경기 결과 수
+OPPONENT_FORM_LENGTH = 5
+
+def match_detail(match: models.Match, goals, quarter_scores) -> Dict:
+    """경기 상세 응답 (출전 선수, 골, 쿼터 스코어) - 경기 상세/동기화 응답 공용"""
+    # Get match players directly from the relationship
+    player_data = [
+        {
+            "id": p.id,
+            "name": p.name,
+            "position": p.position,
+            "number": p.number,
+            "team_id": p.team_id,
+            "created_at": p.created_at
+        }
+        for p in match.players
+    ]
+    
+    # Get goals with all required fields
+    goal_data = [
+        {
+            "id": g.id,
+            "match_id": g.match_id,
+            "quarter": g.quarter,
+            "player_id": g.player_id,
+            "assist_player_id": g.assist_player_id,
+            "scorer_name": g.scorer_name,
+            "assist_name": g.assist_name,
+            "created_at": g.created_at
+        }
+        for g in goals
+    ]
+    
+    # Get quarter scores and convert to dictionary format
+    quarter_score_dict = {
+        str(qs.quarter): {
+            "quarter": qs.quarter,
+            "our_score": qs.our_score,
+            "opponent_score": qs.opponent_score
+        }
+        for qs in quarter_scores
+    }
+    
+    return {
+        "id": match.id,
+        "date": match.date,
+        "opponent": match.opponent,
+        "score": match.score,
+        "team_id": match.team_id,
+        "created_at": match.created_at,
+        "players": player_data,
+        "goals": goal_data,
+        "quarter_scores": quarter_score_dict,
+        "version_id": match.version_id
+    }
+
+@trace_methods
 class MatchService:
     def __init__(self, db: Session, current_team: models.Team = None):
         self.db = db
@@ -34,11 +97,12 @@ class MatchService:
         db_match = models.Match(
             date=match.date,
             opponent=match.opponent,
+            opponent_key=normalize_opponent(match.opponent),
             score=match.score,
             team_id=match.team_id
         )
         self.db.add(db_match)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(db_match)
         
         # Add players to match
@@ -101,9 +165,12 @@ class MatchService:
             if mom_player_id:
                 mom_player = self.db.query(models.Player).filter(models.Player.id == mom_player_id).first()
                 if mom_player:
-                    mom_player.mom_count += 1
+                    self._bump_player_counter(mom_player, "mom_count", 1)
 
-        self.db.commit()
+        self._apply_opponent_result(db_match.team_id, db_match.opponent, db_match.score, 1)
+
+        commit_versioned(self.db)
+        analytics_cache.invalidate_team(current_team.id)
         self.db.refresh(db_match)
         
         return db_match
@@ -118,7 +185,10 @@ class MatchService:
         matches = self.db.query(models.Match).filter(models.Match.team_id == team_id).all()
         return matches
 
-    def update_match(self, match_id: int, match_update: schemas.MatchUpdate, current_team: models.Team):
+    def update_match(
+        self, match_id: int, match_update: schemas.MatchUpdate, current_team: models.Team,
+        expected_version: Optional[int] = None
+    ):
         db_match = self.db.query(models.Match).filter(models.Match.id == match_id).first()
         if db_match is None:
             raise HTTPException(
@@ -133,6 +203,10 @@ class MatchService:
             )
         
         update_data = match_update.dict(exclude_unset=True)
+        # If-Match 헤더 또는 본문의 version_id로 읽은 시점 버전 확인
+        body_version = update_data.pop("version_id", None)
+        check_version(db_match, expected_version if expected_version is not None else body_version)
+        previous = (db_match.opponent, db_match.score, db_match.date)
         
         # Handle player updates if provided
         if "player_ids" in update_data:
@@ -149,8 +223,16 @@ class MatchService:
         # Update other fields
         for key, value in update_data.items():
             setattr(db_match, key, value)
+        if "opponent" in update_data:
+            db_match.opponent_key = normalize_opponent(db_match.opponent)
         
-        self.db.commit()
+        # 상대 전적 갱신 (이전 결과 제거 후 새 결과 반영)
+        if previous != (db_match.opponent, db_match.score, db_match.date):
+            self._apply_opponent_result(db_match.team_id, previous[0], previous[1], -1)
+            self._apply_opponent_result(db_match.team_id, db_match.opponent, db_match.score, 1)
+        
+        commit_versioned(self.db)
+        analytics_cache.invalidate_team(current_team.id)
         self.db.refresh(db_match)
         return db_match
 
@@ -210,21 +292,23 @@ class MatchService:
         for player_id, goal_count in goal_scorers.items():
             player = self.db.query(models.Player).filter(models.Player.id == player_id).first()
             if player:
-                player.goal_count = max(0, player.goal_count - goal_count)
+                self._bump_player_counter(player, "goal_count", -goal_count)
         
         for player_id, assist_count in assist_providers.items():
             player = self.db.query(models.Player).filter(models.Player.id == player_id).first()
             if player:
-                player.assist_count = max(0, player.assist_count - assist_count)
+                self._bump_player_counter(player, "assist_count", -assist_count)
         
         if mom_player_id:
             player = self.db.query(models.Player).filter(models.Player.id == mom_player_id).first()
-            if player and player.mom_count > 0:
-                player.mom_count -= 1
+            if player:
+                self._bump_player_counter(player, "mom_count", -1)
         
         # 매치 삭제 (관련 골 정보는 cascade 설정으로 자동 삭제됨)
         self.db.delete(db_match)
+        self._apply_opponent_result(db_match.team_id, db_match.opponent, db_match.score, -1)
         self.db.commit()
+        analytics_cache.invalidate_team(current_team.id)
         return {"message": "Match deleted successfully"}
 
     def get_match_detail(self, match_id: int) -> Dict:
@@ -237,59 +321,10 @@ class MatchService:
         if match.team_id != self.current_team.id:
             raise HTTPException(status_code=403, detail="Not authorized to view this match")
             
-        # Get match players directly from the relationship
-        players = match.players
-        player_data = [
-            {
-                "id": p.id,
-                "name": p.name,
-                "position": p.position,
-                "number": p.number,
-                "team_id": p.team_id,
-                "created_at": p.created_at
-            }
-            for p in players
-        ]
-        
-        # Get goals with all required fields
         goals = self.db.query(models.Goal).filter(models.Goal.match_id == match_id).all()
-        goal_data = [
-            {
-                "id": g.id,
-                "match_id": g.match_id,
-                "quarter": g.quarter,
-                "player_id": g.player_id,
-                "assist_player_id": g.assist_player_id,
-                "scorer_name": g.scorer_name,
-                "assist_name": g.assist_name,
-                "created_at": g.created_at
-            }
-            for g in goals
-        ]
-        
-        # Get quarter scores and convert to dictionary format
         quarter_scores = self.db.query(models.QuarterScore).filter(models.QuarterScore.match_id == match_id).all()
-        quarter_score_dict = {
-            str(qs.quarter): {
-                "quarter": qs.quarter,
-                "our_score": qs.our_score,
-                "opponent_score": qs.opponent_score
-            }
-            for qs in quarter_scores
-        }
-        
-        return {
-            "id": match.id,
-            "date": match.date,
-            "opponent": match.opponent,
-            "score": match.score,
-            "team_id": match.team_id,
-            "created_at": match.created_at,
-            "players": player_data,
-            "goals": goal_data,
-            "quarter_scores": quarter_score_dict
-        }
-
+        return match_detail(match, goals, quarter_scores)
+    
     def calculate_quarter_scores(self, match, goals):
         # 최종 스코어에서 총점 계산
         score_parts = match.score.split(":")
@@ -383,9 +418,9 @@ class MatchService:
         self.db.add(db_goal)
         
         # 선수 통계 업데이트
-        scorer.goal_count += 1
+        self._bump_player_counter(scorer, "goal_count", 1)
         if goal.assist_player_id:
-            assist_player.assist_count += 1
+            self._bump_player_counter(assist_player, "assist_count", 1)
         
         # MOM 자동 선정 로직
         goals = self.db.query(models.Goal).filter(models.Goal.match_id == match_id).all()
@@ -421,32 +456,238 @@ class MatchService:
         if mom_player_id:
             mom_player = self.db.query(models.Player).filter(models.Player.id == mom_player_id).first()
             if mom_player:
-                mom_player.mom_count += 1
+                self._bump_player_counter(mom_player, "mom_count", 1)
         
-        self.db.commit()
+        commit_versioned(self.db)
+        analytics_cache.invalidate_team(current_team.id)
         self.db.refresh(db_goal)
         return db_goal
 
+    def add_goals_batch(self, match_id: int, batch: schemas.GoalBatchCreate, current_team: models.Team):
+        """여러 골을 한 번에 기록 (선수 검증 쿼리 1회, 통계 일괄 반영, MOM은 배치당 한 번 선정)"""
+        db_match = self.db.query(models.Match).filter(models.Match.id == match_id).first()
+        if db_match is None:
+            raise HTTPException(
+                status_code=404, 
+                detail=f"Match with ID {match_id} not found"
+            )
+        
+        if db_match.team_id != current_team.id:
+            raise HTTPException(
+                status_code=403, 
+                detail=f"Not authorized to add goal to match with ID {match_id} (belongs to team ID {db_match.team_id}, your team ID: {current_team.id})"
+            )
+        
+        # 득점/어시스트 선수 한 번에 검증
+        player_ids = {goal.player_id for goal in batch.goals}
+        player_ids.update(goal.assist_player_id for goal in batch.goals if goal.assist_player_id)
+        players = {
+            player.id: player
+            for player in self.db.query(models.Player).filter(
+                models.Player.id.in_(player_ids),
+                models.Player.team_id == current_team.id
+            )
+        }
+        for goal in batch.goals:
+            if goal.player_id not in players:
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"Scorer with ID {goal.player_id} not found or not in team"
+                )
+            if goal.assist_player_id and goal.assist_player_id not in players:
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"Assist player with ID {goal.assist_player_id} not found or not in team"
+                )
+        
+        db_goals = [
+            models.Goal(
+                match_id=match_id,
+                player_id=goal.player_id,
+                assist_player_id=goal.assist_player_id,
+                quarter=goal.quarter,
+                scorer_name=players[goal.player_id].name,
+                assist_name=players[goal.assist_player_id].name if goal.assist_player_id else None
+            )
+            for goal in batch.goals
+        ]
+        self.db.add_all(db_goals)
+        
+        # 선수 통계는 선수별 증가분으로 한 번씩만 반영
+        for player_id, count in Counter(goal.player_id for goal in batch.goals).items():
+            self._bump_player_counter(players[player_id], "goal_count", count)
+        for player_id, count in Counter(goal.assist_player_id for goal in batch.goals if goal.assist_player_id).items():
+            self._bump_player_counter(players[player_id], "assist_count", count)
+        
+        # 기존 골 + 이번 배치 골 기준으로 MOM 한 번 선정
+        self.db.flush()
+        match_goals = self.db.query(models.Goal.player_id, models.Goal.assist_player_id).filter(
+            models.Goal.match_id == match_id
+        ).order_by(models.Goal.id).all()
+        mom_player_id = select_mom(match_goals)
+        if mom_player_id:
+            mom_player = players.get(mom_player_id) or self.db.query(models.Player).filter(models.Player.id == mom_player_id).first()
+            if mom_player:
+                self._bump_player_counter(mom_player, "mom_count", 1)
+        
+        commit_versioned(self.db)
+        analytics_cache.invalidate_team(current_team.id)
+        # 생성 시각 등 서버 기본값을 한 번의 쿼리로 다시 읽기
+        return self.db.query(models.Goal).filter(
+            models.Goal.id.in_([db_goal.id for db_goal in db_goals])
+        ).order_by(models.Goal.id).populate_existing().all()
+
     def get_recent_matches(self, team_id: int, current_team: models.Team, limit: int = 5):
         if current_team.id != team_id:
             raise HTTPException(status_code=403, detail="Not authorized")
         today = datetime.now().date()
-        # 미래 경기 우선, 부족하면 과거 경기 추가
-        future_matches = (
-            self.db.query(models.Match)
-            .filter(models.Match.team_id == team_id, models.Match.date >= today)
-            .order_by(models.Match.date.asc())
+        # 미래 경기 우선(가까운 순), 부족하면 과거 경기(최신순)로 채움 - 쿼리 한 번
+        is_past = models.Match.date < today
+        rows = (
+            self.db.query(models.Match, is_past)
+            .filter(models.Match.team_id == team_id)
+            .order_by(is_past.asc(), case((~is_past, models.Match.date)).asc(), models.Match.date.desc())
             .limit(limit)
             .all()
         )
-        if len(future_matches) < limit:
-            past_matches = (
-                self.db.query(models.Match)
-                .filter(models.Match.team_id == team_id, models.Match.date < today)
-                .order_by(models.Match.date.desc())
-                .limit(limit - len(future_matches))
-                .all()
+        future_matches = [match for match, past in rows if not past]
+        past_matches = [match for match, past in rows if past]
+        # 과거 경기는 최신순이므로 역순으로 붙여줌
+        return future_matches + past_matches[::-1]
+
+    def _bump_player_counter(self, player: models.Player, field: str, delta: int):
+        """선수 누적 기록 증감 - SET x = x + delta로 원자적으로 (0 미만 방지, 서버 집계라 행 버전은 그대로)"""
+        column = getattr(models.Player, field)
+        setattr(player, field, column + delta if delta > 0 else func.max(0, column + delta))
+
+    def _apply_opponent_result(self, team_id: int, opponent: str, score: str, sign: int):
+        """경기 결과를 상대 전적에 반영 (sign=1 추가, sign=-1 제거), 커밋은 호출자가 수행"""
+        self.db.flush()
+        opponent_key = normalize_opponent(opponent)
+        record = self.db.query(models.OpponentRecord).filter(
+            models.OpponentRecord.team_id == team_id,
+            models.OpponentRecord.opponent_key == opponent_key
+        ).first()
+        if record is None:
+            if sign < 0:
+                return
+            record = models.OpponentRecord(
+                team_id=team_id, opponent_key=opponent_key, opponent=opponent,
+                matches=0, wins=0, draws=0, losses=0, goals_for=0, goals_against=0
             )
-            # 과거 경기는 최신순이므로 역순으로 붙여줌
-            return future_matches + past_matches[::-1]
-        return future_matches
\ No newline at end of file
+            self.db.add(record)
+        
+        our_score, opponent_score = parse_score(score)
+        result = get_match_result(our_score, opponent_score)
+        self._apply_result_delta(record, our_score, opponent_score, result, sign)
+        self._apply_team_record(team_id, our_score, opponent_score, result, sign)
+        
+        if record.matches <= 0:
+            self.db.delete(record)
+            return
+        if sign > 0:
+            record.opponent = opponent
+        self._refresh_opponent_form(record)
+
+    def _apply_result_delta(self, record, our_score: int, opponent_score: int, result: str, sign: int):
+        """전적 레코드(상대 전적/팀 통산)에 경기 한 건의 결과를 더하거나 뺌"""
+        record.matches += sign
+        if result == 'WIN':
+            record.wins += sign
+        elif result == 'DRAW':
+            record.draws += sign
+        else:
+            record.losses += sign
+        record.goals_for += sign * our_score
+        record.goals_against += sign * opponent_score
+
+    def _apply_team_record(self, team_id: int, our_score: int, opponent_score: int, result: str, sign: int):
+        """팀 통산 전적과 승률(순위표 정렬 키) 갱신"""
+        record = self.db.query(models.TeamRecord).filter(models.TeamRecord.team_id == team_id).first()
+        if record is None:
+            if sign < 0:
+                return
+            record = models.TeamRecord(
+                team_id=team_id, matches=0, wins=0, draws=0, losses=0, goals_for=0, goals_against=0
+            )
+            self.db.add(record)
+        self._apply_result_delta(record, our_score, opponent_score, result, sign)
+        record.win_rate = record.wins / record.matches if record.matches > 0 else 0.0
+
+    def _refresh_opponent_form(self, record: models.OpponentRecord):
+        """최근 경기 결과를 (team_id, opponent_key) 인덱스로 최대 OPPONENT_FORM_LENGTH 경기만 조회하여 갱신"""
+        self.db.flush()
+        recent = (
+            self.db.query(models.Match.score, models.Match.date)
+            .filter(
+                models.Match.team_id == record.team_id,
+                models.Match.opponent_key == record.opponent_key
+            )
+            .order_by(models.Match.date.desc(), models.Match.id.desc())
+            .limit(OPPONENT_FORM_LENGTH)
+            .all()
+        )
+        record.recent_form = "".join(get_match_result(*parse_score(score))[0] for score, _ in recent)
+        record.last_match_date = recent[0].date if recent else None
+
+    def rebuild_opponent_records(self, team_id: int):
+        """팀의 상대 전적과 통산 전적을 전체 경기로부터 재구성 (기존 데이터 백필용)"""
+        self.db.query(models.OpponentRecord).filter(models.OpponentRecord.team_id == team_id).delete()
+        self.db.query(models.TeamRecord).filter(models.TeamRecord.team_id == team_id).delete()
+        matches = (
+            self.db.query(models.Match)
+            .filter(models.Match.team_id == team_id)
+            .order_by(models.Match.date.asc(), models.Match.id.asc())
+            .all()
+        )
+        records = {}
+        team_record = models.TeamRecord(
+            team_id=team_id, matches=0, wins=0, draws=0, losses=0, goals_for=0, goals_against=0
+        )
+        for match in matches:
+            match.opponent_key = normalize_opponent(match.opponent)
+            record = records.get(match.opponent_key)
+            if record is None:
+                record = models.OpponentRecord(
+                    team_id=team_id, opponent_key=match.opponent_key,
+                    matches=0, wins=0, draws=0, losses=0, goals_for=0, goals_against=0,
+                    recent_form=""
+                )
+                records[match.opponent_key] = record
+            our_score, opponent_score = parse_score(match.score)
+            result = get_match_result(our_score, opponent_score)
+            record.opponent = match.opponent
+            self._apply_result_delta(record, our_score, opponent_score, result, 1)
+            self._apply_result_delta(team_record, our_score, opponent_score, result, 1)
+            record.recent_form = (result[0] + record.recent_form)[:OPPONENT_FORM_LENGTH]
+            record.last_match_date = match.date
+        self.db.add_all(records.values())
+        if team_record.matches > 0:
+            team_record.win_rate = team_record.wins / team_record.matches
+            self.db.add(team_record)
+        self.db.commit()
+        analytics_cache.invalidate_team(team_id)
+        return list(records.values())
+
+    def stale_record_team_ids(self) -> List[int]:
+        """집계 전적이 경기와 맞지 않는 팀 (opponent_key가 비어 있는 경기, 통산 경기 수 불일치)"""
+        counts = dict(
+            self.db.query(models.Match.team_id, func.count(models.Match.id))
+            .filter(models.Match.team_id.isnot(None))
+            .group_by(models.Match.team_id)
+        )
+        recorded = dict(self.db.query(models.TeamRecord.team_id, models.TeamRecord.matches))
+        stale = {team_id for team_id in counts.keys() | recorded.keys() if counts.get(team_id, 0) != recorded.get(team_id, 0)}
+        stale.update(
+            team_id for (team_id,) in self.db.query(models.Match.team_id).filter(
+                models.Match.team_id.isnot(None), models.Match.opponent_key.is_(None)
+            ).distinct()
+        )
+        return sorted(stale)
+
+    def rebuild_stale_records(self) -> List[int]:
+        """집계 전적이 어긋난 팀만 재구성하고 팀 id 목록 반환"""
+        team_ids = self.stale_record_team_ids()
+        for team_id in team_ids:
+            self.rebuild_opponent_records(team_id)
+        return team_ids
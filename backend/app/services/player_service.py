@@ -1,7 +1,9 @@
 from app import models, schemas
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
-from typing import List
+from typing import List, Optional
+from app.utils.cache import analytics_cache
+from app.utils.versioning import bump_version, check_version, commit_versioned
 
 class PlayerService:
     def __init__(self, db: Session):
@@ -14,6 +16,7 @@ class PlayerService:
         db_player = models.Player(**player.dict())
         self.db.add(db_player)
         self.db.commit()
+        analytics_cache.invalidate_team(current_team.id)
         self.db.refresh(db_player)
         return db_player
 
@@ -24,7 +27,10 @@ class PlayerService:
         players = self.db.query(models.Player).filter(models.Player.team_id == team_id).all()
         return players
 
-    def update_player(self, player_id: int, player_update: schemas.PlayerUpdate, current_team: models.Team):
+    def update_player(
+        self, player_id: int, player_update: schemas.PlayerUpdate, current_team: models.Team,
+        expected_version: Optional[int] = None
+    ):
         db_player = self.db.query(models.Player).filter(models.Player.id == player_id).first()
         if db_player is None:
             raise HTTPException(status_code=404, detail="Player not found")
@@ -33,14 +39,21 @@ class PlayerService:
             raise HTTPException(status_code=403, detail="Not authorized to update this player")
         
         update_data = player_update.dict(exclude_unset=True)
+        body_version = update_data.pop("version_id", None)
+        check_version(db_player, expected_version if expected_version is not None else body_version)
         for key, value in update_data.items():
             setattr(db_player, key, value)
+        bump_version(self.db, db_player)
         
-        self.db.commit()
+        commit_versioned(self.db)
+        analytics_cache.invalidate_team(current_team.id)
         self.db.refresh(db_player)
         return db_player
 
-    def update_player_stats(self, player_id: int, player_stats: schemas.PlayerUpdate, current_team: models.Team):
+    def update_player_stats(
+        self, player_id: int, player_stats: schemas.PlayerUpdate, current_team: models.Team,
+        expected_version: Optional[int] = None
+    ):
         db_player = self.db.query(models.Player).filter(models.Player.id == player_id).first()
         if db_player is None:
             raise HTTPException(status_code=404, detail="Player not found")
@@ -50,6 +63,8 @@ class PlayerService:
         
         # 통계 필드 업데이트
         stats_update = player_stats.dict(exclude_unset=True)
+        body_version = stats_update.pop("version_id", None)
+        check_version(db_player, expected_version if expected_version is not None else body_version)
         
         # 적어도 하나의 통계 필드가 포함되어 있는지 확인
         has_stats = any(key in stats_update for key in ['goal_count', 'assist_count', 'mom_count'])
@@ -65,8 +80,10 @@ class PlayerService:
         
         for key, value in stats_fields.items():
             setattr(db_player, key, value)
+        bump_version(self.db, db_player)
         
-        self.db.commit()
+        commit_versioned(self.db)
+        analytics_cache.invalidate_team(current_team.id)
         self.db.refresh(db_player)
         return db_player
 
@@ -80,6 +97,7 @@ class PlayerService:
         
         self.db.delete(db_player)
         self.db.commit()
+        analytics_cache.invalidate_team(current_team.id)
         return {"message": "Player deleted successfully"}
 
     def get_player(self, player_id: int, current_team: models.Team):
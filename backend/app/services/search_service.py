@@ -0,0 +1,119 @@
+from app import models, schemas
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from fastapi import HTTPException
+from typing import List, Optional
+from app.utils.match_utils import normalize_opponent
+
+# 순서 = search_index rowid의 종류 번호 (rowid = 원본 ID * 3 + 종류)
+SEARCH_KINDS = ("team", "player", "opponent")
+# trigram 토크나이저는 3글자 이상만 색인 검색 가능, 더 짧은 검색어는 이름 접두어 인덱스 사용
+MIN_FTS_QUERY_LENGTH = 3
+# 접두어 범위 검색 상한 (name >= q AND name < q + PREFIX_END)
+PREFIX_END = "\U0010ffff"
+
+class SearchService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _fts_phrase(self, value: str) -> str:
+        """FTS5 구문 검색어로 이스케이프"""
+        return '"' + value.replace('"', '""') + '"'
+
+    def _fts_search(self, query: str, scopes: List[str], kinds: List[str], limit: int) -> List[schemas.SearchResult]:
+        """여러 범위를 한 번의 MATCH로 검색 (제목 가중치를 높이고, 검색어로 시작하는 결과를 우선)
+
+        종류는 rowid의 종류 번호로 LIMIT 전에 거름 (같은 범위의 다른 종류가 상위 결과를 차지하지 않도록)
+        """
+        scope_match = " OR ".join(f"scope:{self._fts_phrase(scope)}" for scope in scopes)
+        kind_numbers = ", ".join(str(SEARCH_KINDS.index(kind)) for kind in kinds)
+        rows = self.db.execute(
+            text(
+                "SELECT kind, ref_id, team_id, title, body FROM search_index "
+                f"WHERE search_index MATCH :match AND rowid % {len(SEARCH_KINDS)} IN ({kind_numbers}) "
+                "ORDER BY instr(lower(title), lower(:query)) = 1 DESC, bm25(search_index, 10.0, 1.0, 0.0) "
+                "LIMIT :limit"
+            ),
+            {
+                "match": f"({scope_match}) AND {{title body}}:{self._fts_phrase(query)}",
+                "query": query,
+                "limit": limit,
+            }
+        ).all()
+        return [
+            schemas.SearchResult(kind=kind, id=ref_id, team_id=team_id, title=title, subtitle=body or None)
+            for kind, ref_id, team_id, title, body in rows
+        ]
+
+    def _prefix_search(self, query: str, team_id: Optional[int], kinds: List[str], limit: int) -> List[schemas.SearchResult]:
+        results = []
+        if "team" in kinds:
+            teams = (
+                self.db.query(models.Team.id, models.Team.name, models.Team.description)
+                .filter(models.Team.name >= query, models.Team.name < query + PREFIX_END)
+                .order_by(models.Team.name)
+                .limit(limit)
+                .all()
+            )
+            results += [
+                schemas.SearchResult(kind="team", id=id, team_id=id, title=name, subtitle=description or None)
+                for id, name, description in teams
+            ]
+        if team_id is not None and "player" in kinds:
+            players = (
+                self.db.query(models.Player.id, models.Player.name, models.Player.position)
+                .filter(
+                    models.Player.name >= query,
+                    models.Player.name < query + PREFIX_END,
+                    models.Player.team_id == team_id
+                )
+                .order_by(models.Player.name)
+                .limit(limit)
+                .all()
+            )
+            results += [
+                schemas.SearchResult(kind="player", id=id, team_id=team_id, title=name, subtitle=position or None)
+                for id, name, position in players
+            ]
+        if team_id is not None and "opponent" in kinds:
+            key = normalize_opponent(query)
+            opponents = (
+                self.db.query(models.OpponentRecord.id, models.OpponentRecord.opponent)
+                .filter(
+                    models.OpponentRecord.team_id == team_id,
+                    models.OpponentRecord.opponent_key >= key,
+                    models.OpponentRecord.opponent_key < key + PREFIX_END
+                )
+                .order_by(models.OpponentRecord.opponent_key)
+                .limit(limit)
+                .all()
+            )
+            results += [
+                schemas.SearchResult(kind="opponent", id=id, team_id=team_id, title=opponent)
+                for id, opponent in opponents
+            ]
+        return results[:limit]
+
+    def search(self, query: str, team_id: Optional[int] = None, kinds: Optional[List[str]] = None, limit: int = 20):
+        """팀 이름/설명은 리그 전체, 선수 이름과 상대팀은 team_id 팀 범위에서 검색"""
+        query = query.strip()
+        kinds = list(kinds or SEARCH_KINDS)
+        unknown = [kind for kind in kinds if kind not in SEARCH_KINDS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown search kind(s) {', '.join(unknown)} (expected: {', '.join(SEARCH_KINDS)})"
+            )
+        if not query:
+            return schemas.SearchResults(query=query, results=[])
+        
+        if len(query) < MIN_FTS_QUERY_LENGTH:
+            return schemas.SearchResults(query=query, results=self._prefix_search(query, team_id, kinds, limit))
+        
+        scopes = []
+        if "team" in kinds:
+            scopes.append("#teams#")
+        if team_id is not None and any(kind != "team" for kind in kinds):
+            scopes.append(f"#{team_id}#")
+        results = self._fts_search(query, scopes, kinds, limit) if scopes else []
+        return schemas.SearchResults(query=query, results=results)
@@ -0,0 +1,58 @@
+from app import models
+from app.services.match_service import match_detail
+from sqlalchemy.orm import Session, selectinload
+from fastapi import HTTPException
+from typing import Dict
+
+# 한 번에 내려보내는 변경 수 (오래 오프라인이었던 클라이언트는 has_more로 이어서 요청)
+SYNC_PAGE_SIZE = 500
+
+class SyncService:
+    """change_log 기준 증분 동기화 - 조회량은 since 이후 변경 수에만 비례"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def changes_since(self, team_id: int, since: int, current_team: models.Team, limit: int = SYNC_PAGE_SIZE) -> Dict:
+        if current_team.id != team_id:
+            raise HTTPException(status_code=403, detail="Not authorized to sync this team")
+
+        changes = self.db.query(models.ChangeLog).filter(
+            models.ChangeLog.team_id == team_id,
+            models.ChangeLog.id > since
+        ).order_by(models.ChangeLog.id).limit(limit + 1).all()
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        upserts = {"team": set(), "player": set(), "match": set()}
+        deleted = {"player": set(), "match": set()}
+        for change in changes:
+            target = deleted if change.deleted else upserts
+            if change.entity in target:
+                target[change.entity].add(change.entity_id)
+
+        players = self.db.query(models.Player).filter(
+            models.Player.id.in_(upserts["player"])
+        ).order_by(models.Player.id).all() if upserts["player"] else []
+        matches = self.db.query(models.Match).options(
+            selectinload(models.Match.players),
+            selectinload(models.Match.goals),
+            selectinload(models.Match.quarter_scores),
+        ).filter(
+            models.Match.id.in_(upserts["match"])
+        ).order_by(models.Match.id).all() if upserts["match"] else []
+        # 기록 이후 다른 경로로 지워진 행은 삭제로 전달
+        deleted["player"] |= upserts["player"] - {player.id for player in players}
+        deleted["match"] |= upserts["match"] - {match.id for match in matches}
+
+        return {
+            "team_id": team_id,
+            "since": since,
+            "version": changes[-1].id if changes else since,
+            "has_more": has_more,
+            # current_team은 인증 스냅샷(id/name)이므로 응답에는 팀 행을 조회해서 사용
+            "team": self.db.get(models.Team, team_id) if upserts["team"] else None,
+            "players": players,
+            "matches": [match_detail(match, match.goals, match.quarter_scores) for match in matches],
+            "deleted": {"players": sorted(deleted["player"]), "matches": sorted(deleted["match"])},
+        }
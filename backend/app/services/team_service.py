@@ -1,5 +1,12 @@
 from app import models, schemas, auth
+from app.utils.cache import analytics_cache
+from app.utils.file_handler import save_upload_file, schedule_delete
+from app.services.token_service import TokenService
+from app.utils.versioning import check_version, commit_versioned
+from typing import Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
+from concurrent.futures import Future
 from fastapi import HTTPException, status
 from datetime import timedelta
 import time
@@ -43,18 +50,34 @@ class TeamService:
                 detail="Incorrect team name or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        if not auth.verify_password(team.password, db_team.password):
+        if not await auth.verify_password_async(team.password, db_team.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect team name or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        access_token_expires = timedelta(minutes=auth.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = auth.create_access_token(
-            data={"sub": str(db_team.id)}, expires_delta=access_token_expires
-        )
-        # elapsed = time.time() - start_time
-        return {"access_token": access_token, "token_type": "bearer"}
+        if auth.password_hasher.needs_update(db_team.password):
+            self.schedule_rehash(db_team, team.password)
+        # 액세스 토큰 + 리프레시 토큰 (이후 재발급은 /teams/token/refresh로, 비밀번호 검증 없이)
+        return TokenService(self.db).login(db_team)
+
+    def schedule_rehash(self, db_team: models.Team, password: str) -> Future:
+        """현재 bcrypt 비용보다 낮은 해시를 로그인 응답과 별개로 재해싱"""
+        bind = self.db.get_bind()
+        team_id, old_hash = db_team.id, db_team.password
+
+        def rehash():
+            new_hash = auth.password_hasher.rehash(password, old_hash)
+            with Session(bind) as session:
+                # 그 사이 비밀번호가 바뀌었으면 덮어쓰지 않음 (버전도 올리지 않는 내부 갱신)
+                session.execute(
+                    update(models.Team)
+                    .where(models.Team.id == team_id, models.Team.password == old_hash)
+                    .values(password=new_hash)
+                )
+                session.commit()
+
+        return auth.password_hasher.submit(rehash)
 
     def get_team(self, team_id: int):
         db_team = self.db.query(models.Team).filter(models.Team.id == team_id).first()
@@ -62,7 +85,10 @@ class TeamService:
             raise HTTPException(status_code=404, detail="Team not found")
         return db_team
 
-    def update_team(self, team_id: int, team_update: schemas.TeamUpdate, current_team: models.Team):
+    def update_team(
+        self, team_id: int, team_update: schemas.TeamUpdate, current_team: models.Team,
+        expected_version: Optional[int] = None
+    ):
         if current_team.id != team_id:
             raise HTTPException(status_code=403, detail="Not authorized to update this team")
         
@@ -71,13 +97,21 @@ class TeamService:
             raise HTTPException(status_code=404, detail="Team not found")
         
         update_data = team_update.dict(exclude_unset=True)
+        body_version = update_data.pop("version_id", None)
+        check_version(db_team, expected_version if expected_version is not None else body_version)
         if "password" in update_data:
             update_data["password"] = auth.get_password_hash(update_data["password"])
         
         for key, value in update_data.items():
             setattr(db_team, key, value)
+        if "password" in update_data:
+            # 이전 비밀번호로 받은 리프레시 토큰도 함께 폐기
+            TokenService(self.db).revoke_team(team_id)
         
-        self.db.commit()
+        commit_versioned(self.db)
+        if "password" in update_data:
+            # 이전 비밀번호로 발급된 토큰은 지문이 달라 거부되므로 캐시된 검증 결과도 삭제
+            auth.verified_tokens.invalidate_team(team_id)
         self.db.refresh(db_team)
         return db_team
 
@@ -89,15 +123,15 @@ class TeamService:
         if db_team is None:
             raise HTTPException(status_code=404, detail="Team not found")
         
-        # Delete associated files
-        if db_team.logo_url:
-            from ..utils.file_handler import delete_file
-            delete_file(db_team.logo_url.lstrip("/"))
-        if db_team.image_url:
-            delete_file(db_team.image_url.lstrip("/"))
-        
+        file_urls = (db_team.logo_url, db_team.image_url)
+        # 같은 트랜잭션에서 리프레시 토큰도 삭제 (재사용된 팀 ID로 이전 토큰이 통하지 않도록)
+        TokenService(self.db).delete_team(team_id)
         self.db.delete(db_team)
         self.db.commit()
+        analytics_cache.invalidate_team(team_id)
+        auth.verified_tokens.invalidate_team(team_id)
+        # Delete associated files (커밋 이후 백그라운드 일괄 삭제)
+        schedule_delete(file_urls)
         return {"message": "Team deleted successfully"}
 
     async def upload_logo(self, team_id: int, file, current_team: models.Team):
@@ -108,15 +142,11 @@ class TeamService:
         if db_team is None:
             raise HTTPException(status_code=404, detail="Team not found")
         
-        # Delete old logo if exists
-        if db_team.logo_url:
-            from ..utils.file_handler import delete_file
-            delete_file(db_team.logo_url.lstrip("/"))
-        
-        from ..utils.file_handler import save_upload_file
         file_path = await save_upload_file(file, team_id, "logo")
-        db_team.logo_url = file_path
+        old_url, db_team.logo_url = db_team.logo_url, file_path
         self.db.commit()
+        # Delete old logo if exists (새 파일이 참조된 뒤에 삭제)
+        schedule_delete([old_url], keep=file_path)
         return {"message": "Logo uploaded successfully", "file_path": file_path}
 
     async def upload_image(self, team_id: int, file, current_team: models.Team):
@@ -127,15 +157,11 @@ class TeamService:
         if db_team is None:
             raise HTTPException(status_code=404, detail="Team not found")
         
-        # Delete old image if exists
-        if db_team.image_url:
-            from ..utils.file_handler import delete_file
-            delete_file(db_team.image_url.lstrip("/"))
-        
-        from ..utils.file_handler import save_upload_file
         file_path = await save_upload_file(file, team_id, "image")
-        db_team.image_url = file_path
+        old_url, db_team.image_url = db_team.image_url, file_path
         self.db.commit()
+        # Delete old image if exists (새 파일이 참조된 뒤에 삭제)
+        schedule_delete([old_url], keep=file_path)
         return {"message": "Image uploaded successfully", "file_path": file_path}
 
     # 기타 team 관련 메소드 추가 
\ No newline at end of file
@@ -0,0 +1,130 @@
+import hashlib
+import secrets
+import time
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app import auth, config, models
+
+# 만료 토큰 정리 주기 (요청 경로에서 가끔 한 번만 DELETE 실행)
+PURGE_INTERVAL_SECONDS = 60.0
+_last_purge = 0.0
+
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+class TokenService:
+    """액세스/리프레시 토큰 발급, 회전, 폐기
+
+    - 리프레시는 인덱스 조회 한 번 + 갱신 한 번 (bcrypt 검증 없음)
+    - 회전: 사용한 토큰은 다시 쓸 수 없고, 재사용이 감지되면 같은 family 전체 폐기
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def _digest(raw_token: str) -> bytes:
+        return hashlib.sha256(raw_token.encode()).digest()
+
+    def issue_tokens(self, team: models.Team, family_id: str = None) -> dict:
+        """액세스 토큰과 새 리프레시 토큰 발급 (커밋은 호출한 쪽에서)"""
+        expires_in = auth.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        access_token = auth.create_access_token(
+            data={"sub": str(team.id), "pwd": auth.password_fingerprint(team.password)},
+            expires_delta=timedelta(seconds=expires_in)
+        )
+        raw_token = secrets.token_urlsafe(32)
+        now = datetime.utcnow()
+        self.db.add(models.RefreshToken(
+            team_id=team.id,
+            family_id=family_id or secrets.token_hex(16),
+            token_hash=self._digest(raw_token),
+            created_at=now,
+            expires_at=now + timedelta(days=config.REFRESH_TOKEN_EXPIRE_DAYS),
+        ))
+        return {
+            "access_token": access_token, "token_type": "bearer",
+            "refresh_token": raw_token, "expires_in": expires_in,
+        }
+
+    def login(self, team: models.Team) -> dict:
+        self._purge_expired()
+        tokens = self.issue_tokens(team)
+        self.db.commit()
+        return tokens
+
+    def refresh(self, raw_token: str) -> dict:
+        """리프레시 토큰을 새 액세스/리프레시 토큰으로 교환"""
+        record = self._find(raw_token)
+        now = datetime.utcnow()
+        if record is None or record.revoked_at is not None or record.expires_at <= now:
+            raise _invalid_refresh_token()
+
+        # 조건부 갱신으로 회전 - 동시에 같은 토큰을 쓴 요청 중 하나만 성공
+        claimed = self.db.query(models.RefreshToken).filter(
+            models.RefreshToken.id == record.id,
+            models.RefreshToken.used_at.is_(None),
+            models.RefreshToken.revoked_at.is_(None),
+        ).update({"used_at": now}, synchronize_session=False)
+        if claimed != 1:
+            # 이미 사용된 토큰 재사용 - 탈취 가능성이 있으므로 family 전체 폐기
+            self._revoke_family(record.family_id, now)
+            self.db.commit()
+            raise _invalid_refresh_token()
+
+        team = self.db.get(models.Team, record.team_id)
+        # 팀 ID는 삭제 후 재사용될 수 있으므로 토큰보다 나중에 만들어진 팀이면 다른 팀
+        if team is None or (team.created_at is not None and team.created_at > record.created_at):
+            self.db.rollback()
+            raise _invalid_refresh_token()
+        tokens = self.issue_tokens(team, family_id=record.family_id)
+        self.db.commit()
+        return tokens
+
+    def revoke(self, raw_token: str) -> None:
+        """로그아웃 - 토큰이 속한 family(같은 로그인 세션) 전체 폐기"""
+        record = self._find(raw_token)
+        if record is not None:
+            self._revoke_family(record.family_id, datetime.utcnow())
+            self.db.commit()
+
+    def revoke_team(self, team_id: int) -> int:
+        """팀의 모든 리프레시 토큰 폐기 (비밀번호 변경 시, 커밋은 호출한 쪽에서)"""
+        return self.db.query(models.RefreshToken).filter(
+            models.RefreshToken.team_id == team_id,
+            models.RefreshToken.revoked_at.is_(None),
+        ).update({"revoked_at": datetime.utcnow()}, synchronize_session=False)
+
+    def delete_team(self, team_id: int) -> int:
+        """팀 삭제 시 리프레시 토큰 행 삭제 (SQLite는 외래 키 CASCADE를 적용하지 않음, 커밋은 호출한 쪽에서)"""
+        return self.db.query(models.RefreshToken).filter(
+            models.RefreshToken.team_id == team_id
+        ).delete(synchronize_session=False)
+
+    def _find(self, raw_token: str):
+        return self.db.query(models.RefreshToken).filter(
+            models.RefreshToken.token_hash == self._digest(raw_token)
+        ).first()
+
+    def _revoke_family(self, family_id: str, now: datetime) -> None:
+        self.db.query(models.RefreshToken).filter(
+            models.RefreshToken.family_id == family_id,
+            models.RefreshToken.revoked_at.is_(None),
+        ).update({"revoked_at": now}, synchronize_session=False)
+
+    def _purge_expired(self) -> None:
+        global _last_purge
+        now = time.monotonic()
+        if now - _last_purge < PURGE_INTERVAL_SECONDS:
+            return
+        _last_purge = now
+        self.db.query(models.RefreshToken).filter(
+            models.RefreshToken.expires_at < datetime.utcnow()
+        ).delete(synchronize_session=False)
@@ -1,10 +1,11 @@
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from app.utils.profiler import propagate_route
 
 def run_in_threadpool(func, *args, **kwargs):
     loop = asyncio.get_event_loop()
     executor = ThreadPoolExecutor()
-    return loop.run_in_executor(executor, func, *args, **kwargs)
+    return loop.run_in_executor(executor, propagate_route(func), *args, **kwargs)
 
 async def async_heavy_task(data):
     await asyncio.sleep(1)  # 예시: 실제로는 대용량 연산/IO
@@ -0,0 +1,82 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+INVALIDATE_CHANNEL = "cache.invalidate"
+
+class TeamCache:
+    """팀 단위 TTL 캐시
+
+    - 팀 데이터가 바뀌면 invalidate_team으로 해당 팀 항목 전체 삭제
+    - 이벤트 버스를 연결하면 무효화가 다른 워커 프로세스에도 전파
+    - 팀별 세대(generation) 번호로 계산 도중 무효화된 결과는 저장하지 않음
+    """
+
+    def __init__(self, name: str, ttl: float = 60.0, max_entries_per_team: int = 256):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries_per_team = max_entries_per_team
+        self._entries: Dict[int, Dict[Hashable, Tuple[float, Any]]] = {}
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._bus = None
+
+    def attach(self, bus) -> None:
+        """다른 프로세스의 무효화 이벤트 구독"""
+        self._bus = bus
+        bus.subscribe(INVALIDATE_CHANNEL, self._on_invalidate)
+
+    def detach(self) -> None:
+        self._bus = None
+
+    def _on_invalidate(self, payload: Dict[str, Any]) -> None:
+        if payload.get("cache") == self.name:
+            self._drop(payload["team_id"])
+
+    def get(self, team_id: int, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(team_id, {}).get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def generation(self, team_id: int) -> int:
+        """팀의 현재 세대 (무효화마다 증가)"""
+        with self._lock:
+            return self._generations.get(team_id, 0)
+
+    def get_or_set(self, team_id: int, key: Hashable, factory: Callable[[], Any]) -> Any:
+        value = self.get(team_id, key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            generation = self._generations.get(team_id, 0)
+        value = factory()
+        with self._lock:
+            if self._generations.get(team_id, 0) == generation:
+                entries = self._entries.setdefault(team_id, {})
+                if len(entries) >= self.max_entries_per_team:
+                    entries.pop(next(iter(entries)))
+                entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate_team(self, team_id: int) -> None:
+        """로컬 항목 삭제 후 다른 워커에 전파"""
+        self._drop(team_id)
+        if self._bus is not None:
+            self._bus.publish(INVALIDATE_CHANNEL, {"cache": self.name, "team_id": team_id})
+
+    def _drop(self, team_id: int) -> None:
+        with self._lock:
+            self._generations[team_id] = self._generations.get(team_id, 0) + 1
+            self._entries.pop(team_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            for team_id in self._entries:
+                self._generations[team_id] = self._generations.get(team_id, 0) + 1
+            self._entries.clear()
+
+# 분석 API 응답 캐시 (경기/선수/팀 변경 시 무효화)
+analytics_cache = TeamCache("analytics")
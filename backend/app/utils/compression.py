@@ -0,0 +1,172 @@
+import gzip
+import json
+import zlib
+from typing import Dict, Optional, Type
+
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import config
+from app.utils.content_negotiation import media_type_for, pack, response_format
+from app.utils.media import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 - 없으면 gzip만 사용
+    brotli = None
+
+# 선호 순서 (brotli가 설치된 경우에만 br 협상)
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = (
+    "text/", "application/json", "application/msgpack", "application/javascript", "application/xml", "image/svg+xml"
+)
+
+def negotiate_encoding(accept_encoding: Optional[str], available=SUPPORTED_ENCODINGS) -> Optional[str]:
+    """Accept-Encoding에서 서버가 지원하는 가장 선호하는 인코딩 (없으면 None = identity)"""
+    accepted = accepted_encodings(accept_encoding)
+    for encoding in available:
+        if encoding in accepted:
+            return encoding
+    if "*" in accepted and available:
+        return available[0]
+    return None
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+def _compress(encoding: str, data: bytes, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+class _StreamCompressor:
+    """스트리밍 응답용 점진 압축"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+            self.compress, self.flush = self._compressor.process, self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+            self.compress, self.flush = self._compressor.compress, self._compressor.flush
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상 응답 압축 (gzip, brotli 설치 시 br)
+
+    - minimum_size 미만 본문은 압축하지 않음 (작은 응답은 압축 비용/헤더 오버헤드가 더 큼)
+    - 이미 Content-Encoding이 있는 응답(미리 압축한 캐시 응답, 미디어 변형)과 이미지 등은 그대로 전달
+    """
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int = 1024,
+        gzip_level: int = 6, brotli_quality: int = 4
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor: Optional[_StreamCompressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                passthrough = (
+                    "content-encoding" in headers
+                    or not is_compressible(headers.get("content-type"))
+                    or message["status"] < 200 or message["status"] in (204, 206, 304)
+                )
+                if passthrough:
+                    await send(message)
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body, more_body = message.get("body", b""), message.get("more_body", False)
+            if start_message is not None:
+                headers = MutableHeaders(scope=start_message)
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                headers["Content-Encoding"] = encoding
+                if more_body:
+                    # 길이를 알 수 없는 스트리밍 응답 - 청크 단위 압축
+                    del headers["Content-Length"]
+                    compressor = _StreamCompressor(encoding, self.gzip_level, self.brotli_quality)
+                else:
+                    level = self.brotli_quality if encoding == "br" else self.gzip_level
+                    body = _compress(encoding, body, level)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body, "more_body": False})
+                    return
+                await send(start_message)
+                start_message = None
+
+            chunk = compressor.compress(body)
+            if not more_body:
+                chunk += compressor.flush()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+class CompressedPayload:
+    """캐시에 저장하는 응답 본문 - JSON 직렬화와 압축을 한 번만 수행
+
+    캐시 적중 시에는 협상된 인코딩의 바이트를 그대로 응답하므로 직렬화/압축 비용이 없음
+    (한 번만 압축하므로 요청 중 압축보다 높은 압축 수준 사용)
+    """
+
+    __slots__ = ("body", "variants", "media_type", "packed")
+
+    def __init__(self, body: bytes, media_type: str = "application/json"):
+        self.body = body
+        self.media_type = media_type
+        self.variants: Dict[str, bytes] = {}
+        # MessagePack 본문 (협상된 형식별로 처음 요청될 때 한 번만 변환)
+        self.packed: Dict[str, bytes] = {}
+        if len(body) >= config.COMPRESSION_MIN_SIZE:
+            for encoding in SUPPORTED_ENCODINGS:
+                compressed = _compress(encoding, body, 11 if encoding == "br" else 9)
+                if len(compressed) < len(body):
+                    self.variants[encoding] = compressed
+
+    @classmethod
+    def from_model(cls, model: Type[BaseModel], value) -> "CompressedPayload":
+        """response_model 검증/직렬화를 캐시 저장 시점에 한 번만 수행"""
+        return cls(model.model_validate(value, from_attributes=True).model_dump_json(by_alias=True).encode())
+
+    def response(self, request: Request) -> Response:
+        negotiated = response_format()
+        if negotiated is not None:
+            packed = self.packed.get(negotiated)
+            if packed is None:
+                packed = self.packed[negotiated] = pack(json.loads(self.body), negotiated)
+            return Response(packed, media_type=media_type_for(negotiated))
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"), tuple(self.variants))
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding is None:
+            return Response(self.body, media_type=self.media_type, headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(self.variants[encoding], media_type=self.media_type, headers=headers)
@@ -0,0 +1,150 @@
+import json
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import msgpack
+except ImportError:  # msgpack은 선택 의존성 - 없으면 JSON만 응답
+    msgpack = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+MSGPACK = "msgpack"
+MSGPACK_COMPACT = "msgpack-compact"
+
+# 키 사전 압축: 같은 키 순서의 객체 목록 → {"$keys": [키...], "$rows": [[값...], ...]}
+COMPACT_KEYS = "$keys"
+COMPACT_ROWS = "$rows"
+
+def negotiate_format(accept: Optional[str]) -> Optional[str]:
+    """Accept에서 MessagePack을 JSON 이상으로 선호하면 MSGPACK (keys=compact 파라미터면 MSGPACK_COMPACT), 아니면 None"""
+    if msgpack is None or not accept:
+        return None
+    best, best_q, json_q = None, 0.0, 0.0
+    for part in accept.split(","):
+        media_type, *params = [value.strip() for value in part.split(";")]
+        media_type = media_type.lower()
+        q, compact = 1.0, False
+        for param in params:
+            name, _, value = param.partition("=")
+            name, value = name.strip().lower(), value.strip().strip('"').lower()
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+            elif name == "keys":
+                compact = value == "compact"
+        if media_type in MSGPACK_MEDIA_TYPES:
+            if q > best_q:
+                best, best_q = (MSGPACK_COMPACT if compact else MSGPACK), q
+        elif media_type in ("application/json", "application/*", "*/*"):
+            json_q = max(json_q, q)
+    return best if best is not None and best_q >= json_q else None
+
+def media_type_for(response_format: str) -> str:
+    return "application/msgpack; keys=compact" if response_format == MSGPACK_COMPACT else "application/msgpack"
+
+def compact_keys(value: Any) -> Any:
+    """객체 목록의 반복되는 키를 한 번만 (경기/선수 목록, 상세의 골·선수 목록)"""
+    if isinstance(value, dict):
+        return {key: compact_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        items = [compact_keys(item) for item in value]
+        if len(items) > 1 and all(isinstance(item, dict) for item in items):
+            keys = list(items[0])
+            if all(list(item) == keys for item in items[1:]):
+                return {COMPACT_KEYS: keys, COMPACT_ROWS: [list(item.values()) for item in items]}
+        return items
+    return value
+
+def expand_keys(value: Any) -> Any:
+    """compact_keys의 역변환 (클라이언트 디코딩, 테스트용)"""
+    if isinstance(value, dict):
+        if len(value) == 2 and COMPACT_KEYS in value and COMPACT_ROWS in value:
+            keys = value[COMPACT_KEYS]
+            return [dict(zip(keys, (expand_keys(item) for item in row))) for row in value[COMPACT_ROWS]]
+        return {key: expand_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [expand_keys(item) for item in value]
+    return value
+
+def pack(content: Any, response_format: str) -> bytes:
+    """JSON 호환 값(jsonable_encoder 결과)을 MessagePack으로"""
+    if response_format == MSGPACK_COMPACT:
+        content = compact_keys(content)
+    return msgpack.packb(content, use_bin_type=True)
+
+# 현재 요청에 협상된 응답 형식 (None = JSON)
+_response_format: ContextVar[Optional[str]] = ContextVar("myfc_response_format", default=None)
+
+def response_format() -> Optional[str]:
+    return _response_format.get()
+
+class NegotiatedJSONResponse(JSONResponse):
+    """앱 기본 응답 클래스 - MessagePack이 협상된 요청이면 같은 내용을 JSON 대신 MessagePack으로 직렬화"""
+
+    def render(self, content: Any) -> bytes:
+        negotiated = _response_format.get()
+        if negotiated is None:
+            return super().render(content)
+        self.media_type = media_type_for(negotiated)
+        return pack(content, negotiated)
+
+class ContentNegotiationMiddleware:
+    """Accept: application/msgpack 협상 (msgpack 설치 시)
+
+    - 라우트 응답은 NegotiatedJSONResponse가 바로 MessagePack으로 직렬화 (JSON을 거치지 않음)
+    - 그 밖의 JSON 응답(오류, 멱등성 재응답 등)은 여기서 변환
+    - JSON/MessagePack 응답에는 Vary: Accept 추가
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or msgpack is None:
+            await self.app(scope, receive, send)
+            return
+
+        negotiated = negotiate_format(Headers(scope=scope).get("accept"))
+        start_message: Optional[Message] = None
+        chunks = []
+
+        async def send_negotiated(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                content_type = headers.get("content-type", "")
+                if content_type.startswith(("application/json", "application/msgpack")):
+                    headers.add_vary_header("Accept")
+                if negotiated is not None and content_type.startswith("application/json") \
+                        and message["status"] not in (204, 304):
+                    # 본문을 모아서 변환
+                    start_message = message
+                    return
+                await send(message)
+                return
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            if body:
+                body = pack(json.loads(body), negotiated)
+                headers = MutableHeaders(scope=start_message)
+                headers["Content-Type"] = media_type_for(negotiated)
+                headers["Content-Length"] = str(len(body))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body, "more_body": False})
+
+        token = _response_format.set(negotiated)
+        try:
+            await self.app(scope, receive, send_negotiated)
+        finally:
+            _response_format.reset(token)
@@ -0,0 +1,104 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+Handler = Callable[[Dict[str, Any]], None]
+
+class EventBus:
+    """SQLite 파일 기반 프로세스 간 pub/sub (같은 호스트의 워커끼리 공유)
+
+    - publish: events 테이블에 한 줄 추가 (자기 프로세스 구독자에게는 즉시 전달)
+    - poll: 마지막으로 읽은 ID 이후의 다른 프로세스 이벤트를 채널별 구독자에게 전달
+    - 오래된 이벤트는 retention(초)이 지나면 정리
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.2, retention: float = 300.0):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_prune = 0.0
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL, "
+                "payload TEXT NOT NULL, origin TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            # 새로 뜬 워커는 과거 이벤트를 재생하지 않음
+            self._last_id = conn.execute("SELECT coalesce(max(id), 0) FROM events").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def subscribe(self, channel: str, handler: Handler) -> None:
+        with self._lock:
+            self._handlers.setdefault(channel, []).append(handler)
+
+    def publish(self, channel: str, payload: Dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO events (channel, payload, origin, created_at) VALUES (?, ?, ?, ?)",
+                (channel, json.dumps(payload), self.origin, time.time())
+            )
+        self._dispatch(channel, payload)
+
+    def poll(self) -> int:
+        """다른 프로세스가 발행한 새 이벤트 전달, 전달한 이벤트 수 반환"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, channel, payload, origin FROM events WHERE id > ? ORDER BY id",
+                (self._last_id,)
+            ).fetchall()
+            now = time.time()
+            if now - self._last_prune > self.retention:
+                conn.execute("DELETE FROM events WHERE created_at < ?", (now - self.retention,))
+                self._last_prune = now
+
+        delivered = 0
+        for event_id, channel, payload, origin in rows:
+            self._last_id = event_id
+            if origin == self.origin:
+                continue
+            self._dispatch(channel, json.loads(payload))
+            delivered += 1
+        return delivered
+
+    def _dispatch(self, channel: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            handlers = list(self._handlers.get(channel, ()))
+        for handler in handlers:
+            handler(payload)
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 poll 반복"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="event-bus", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception:
+                # 잠금 경합 등 일시적 오류는 다음 주기에 재시도 (스레드는 유지)
+                continue
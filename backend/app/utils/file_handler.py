@@ -1,44 +1,62 @@
-import os
-import aiofiles
+import asyncio
+import hashlib
 from fastapi import UploadFile, HTTPException
-from typing import Optional
-from datetime import datetime
+from typing import Iterable, Optional
+from app import config
+from app.utils.storage import get_storage, get_orphan_cleaner, name_from_url
+from app.utils.media import variant_names
 
-UPLOAD_DIR = "uploads"
+UPLOAD_DIR = config.UPLOAD_DIR
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
+# 확장자는 클라이언트 파일 이름이 아닌 검증된 content type 기준
+IMAGE_EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png", "image/gif": ".gif"}
+
 async def save_upload_file(upload_file: UploadFile, team_id: int, file_type: str) -> str:
-    if not os.path.exists(UPLOAD_DIR):
-        os.makedirs(UPLOAD_DIR)
-    
     if upload_file.content_type not in ALLOWED_IMAGE_TYPES:
         raise HTTPException(status_code=400, detail="Invalid file type")
-    
-    # Check file size
+
+    # Check file size (한 번만 읽으면서 크기 제한과 해시 계산)
+    chunks = []
     file_size = 0
-    chunk_size = 1024
+    digest = hashlib.sha256()
+    chunk_size = 64 * 1024
     while chunk := await upload_file.read(chunk_size):
         file_size += len(chunk)
         if file_size > MAX_FILE_SIZE:
             raise HTTPException(status_code=400, detail="File too large")
-    
-    # Reset file pointer
-    await upload_file.seek(0)
-    
-    # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_extension = os.path.splitext(upload_file.filename)[1]
-    filename = f"{team_id}_{file_type}_{timestamp}{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, filename)
-    
-    # Save file
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        content = await upload_file.read()
-        await out_file.write(content)
-    
-    return f"/{UPLOAD_DIR}/{filename}"
-
-async def delete_file(file_path: str) -> None:
-    if os.path.exists(file_path):
-        os.remove(file_path) 
\ No newline at end of file
+        digest.update(chunk)
+        chunks.append(chunk)
+
+    # 내용 기반 파일 이름 - 같은 내용이면 같은 이름 (미디어 응답에서 immutable 캐시 가능)
+    file_extension = IMAGE_EXTENSIONS[upload_file.content_type]
+    filename = f"{team_id}_{file_type}_{digest.hexdigest()[:16]}{file_extension}"
+
+    # 이전에 교체되어 삭제 대기 중인 같은 내용의 파일이면 삭제 취소 (삭제 중이면 끝난 뒤 저장)
+    in_flight = get_orphan_cleaner().cancel([filename, *variant_names(filename)])
+    if in_flight is not None:
+        await asyncio.wrap_future(in_flight)
+
+    storage = get_storage()
+    await storage.save(filename, b"".join(chunks), upload_file.content_type)
+    return storage.url(filename)
+
+async def delete_file(file_path: str) -> bool:
+    """업로드 파일 즉시 삭제 (file_path는 URL 또는 uploads/ 경로)"""
+    name = name_from_url(file_path)
+    if not name:
+        return False
+    return await get_storage().delete(name)
+
+def schedule_delete(file_urls: Iterable[Optional[str]], keep: Optional[str] = None) -> None:
+    """더 이상 참조되지 않는 업로드 파일을 백그라운드 일괄 삭제 대상으로 등록
+
+    - 동기 서비스 메서드에서도 호출 가능 (요청을 파일 삭제 I/O로 막지 않음)
+    - keep과 같은 파일(내용이 같은 재업로드)은 삭제하지 않음
+    """
+    names = {name_from_url(url) for url in file_urls if url and url != keep}
+    names.discard(None)
+    if names:
+        # 미리 압축된 변형 파일(.gz/.br)도 함께 삭제
+        get_orphan_cleaner().schedule(names.union(*(variant_names(name) for name in names)))
@@ -0,0 +1,44 @@
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+
+def parse_score(score: str) -> tuple:
+    """스코어 문자열("2:1")을 (우리팀 점수, 상대팀 점수)로 파싱, 형식이 잘못되면 (0, 0)"""
+    try:
+        our_score, opponent_score = map(int, score.split(':'))
+        return our_score, opponent_score
+    except:
+        return 0, 0
+
+def get_match_result(our_score: int, opponent_score: int) -> str:
+    """경기 결과 계산 (WIN/DRAW/LOSE)"""
+    if our_score > opponent_score:
+        return 'WIN'
+    elif our_score < opponent_score:
+        return 'LOSE'
+    else:
+        return 'DRAW'
+
+def normalize_opponent(opponent: str) -> str:
+    """상대팀 이름을 집계용 키로 정규화 (유니코드 NFKC, 대소문자/공백 무시)"""
+    if not opponent:
+        return ""
+    key = unicodedata.normalize("NFKC", opponent).casefold()
+    return _WHITESPACE.sub(" ", key).strip()
+
+def select_mom(goals) -> int:
+    """(득점자 ID, 어시스트 ID) 목록으로 MOM 선정 (득점 2점, 어시스트 1점, 동점이면 먼저 기록된 선수)"""
+    player_scores = {}
+    for scorer_id, assist_id in goals:
+        player_scores[scorer_id] = player_scores.get(scorer_id, 0) + 2
+    for scorer_id, assist_id in goals:
+        if assist_id:
+            player_scores[assist_id] = player_scores.get(assist_id, 0) + 1
+    mom_player_id = None
+    max_score = -1
+    for player_id, score in player_scores.items():
+        if score > max_score:
+            max_score = score
+            mom_player_id = player_id
+    return mom_player_id
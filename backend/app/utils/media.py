@@ -0,0 +1,239 @@
+import hashlib
+import mimetypes
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from app.utils.storage import StorageBackend, StoredObject
+from app.utils.versioning import etag_matches
+
+# 내용 기반 이름 (file_handler.save_upload_file: {team_id}_{type}_{sha256 16자리}.{ext}) - 내용이 바뀌면 이름도 바뀜
+CONTENT_ADDRESSED = re.compile(r"_([0-9a-f]{16})\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+# 미리 압축해 둔 변형 파일 ({name}.br / {name}.gz), 선호 순
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+VARIANT_SUFFIXES = tuple(suffix for _, suffix in PRECOMPRESSED_VARIANTS)
+
+CHUNK_SIZE = 256 * 1024
+
+# 변형 파일은 원본보다 충분히 작을 때만 저장 (PNG/JPEG처럼 이미 압축된 형식은 대부분 건너뜀)
+PRECOMPRESS_MAX_RATIO = 0.9
+
+def variant_names(name: str) -> List[str]:
+    return [name + suffix for _, suffix in PRECOMPRESSED_VARIANTS]
+
+def original_name(name: str) -> str:
+    """변형 파일 이름이면 원본 이름으로 변환"""
+    for suffix in VARIANT_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+def _compressors():
+    import gzip
+    compressors = {"gzip": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+    except ImportError:
+        pass
+    else:
+        compressors["br"] = lambda data: brotli.compress(data, quality=11)
+    return compressors
+
+async def precompress(storage: StorageBackend, name: str) -> List[str]:
+    """원본의 gzip(및 brotli 설치 시 br) 변형 파일 생성, 저장한 변형 이름 반환"""
+    stored = await storage.stat(name)
+    if stored is None:
+        return []
+    data = await storage.read(name)
+    saved = []
+    for encoding, compress in _compressors().items():
+        compressed = compress(data)
+        if len(compressed) <= len(data) * PRECOMPRESS_MAX_RATIO:
+            variant = name + dict(PRECOMPRESSED_VARIANTS)[encoding]
+            await storage.save(variant, compressed, stored.content_type)
+            saved.append(variant)
+    return saved
+
+def accepted_encodings(header: Optional[str]) -> List[str]:
+    """Accept-Encoding에서 q=0이 아닌 인코딩 목록"""
+    encodings = []
+    for part in (header or "").split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        if params.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        encodings.append(token.strip().lower())
+    return encodings
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """단일 bytes 범위를 (start, end) 포함 구간으로 변환
+
+    - 헤더가 없거나 다중 범위/형식 오류면 None (전체 응답, RFC 9110 허용)
+    - 만족할 수 없는 범위면 416
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[6:].strip().partition("-")
+    try:
+        if first == "":
+            suffix = int(last)
+            if suffix <= 0:
+                raise ValueError
+            start, end = max(size - suffix, 0), size - 1
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start > end and last:
+        return None
+    if start >= size:
+        raise HTTPException(status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"})
+    return start, min(end, size - 1)
+
+def entity_tag(name: str, stored: StoredObject, encoding: Optional[str]) -> str:
+    """내용 기반 이름이면 이름의 해시, 아니면 저장소 etag 또는 수정 시각/크기 기반 (인코딩별로 구분)"""
+    match = CONTENT_ADDRESSED.search(name)
+    if match:
+        value = match.group(1)
+    elif stored.etag:
+        value = stored.etag
+    else:
+        value = hashlib.md5(f"{stored.modified}-{stored.size}".encode()).hexdigest()
+    return f'"{value}-{encoding}"' if encoding else f'"{value}"'
+
+def is_not_modified(request: Request, etag: str, modified: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+def range_allowed(request: Request, etag: str, last_modified: str) -> bool:
+    """If-Range가 현재 표현과 다르면 Range를 무시하고 전체 전송"""
+    if_range = request.headers.get("if-range")
+    return if_range is None or if_range in (etag, last_modified)
+
+class MediaResponse(Response):
+    """저장소 파일 본문 전송 (전체 또는 단일 범위)
+
+    - 기본 경로: 저장소 스레드 풀에서 CHUNK_SIZE 단위로 읽어 스트리밍
+      (uvicorn은 http.response.zerocopysend를 제공하지 않으므로 운영 환경의 실제 동작)
+    - 서버가 zerocopysend 확장을 제공하고 디스크 경로가 있으면 sendfile로 전송
+      (파일 열기/닫기는 스레드 풀에서 - 이벤트 루프를 막지 않음)
+    """
+
+    def __init__(
+        self, storage: StorageBackend, name: str, start: int, length: int,
+        status_code: int, headers: dict, media_type: str, head_only: bool = False
+    ):
+        self.storage = storage
+        self.name = name
+        self.start = start
+        self.length = length
+        self.head_only = head_only
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if self.head_only or self.length == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        path = self.storage.local_path(self.name)
+        if path is not None and "http.response.zerocopysend" in scope.get("extensions", {}):
+            try:
+                file = await run_in_threadpool(open, path, "rb")
+            except FileNotFoundError:
+                # stat 이후 삭제된 경우 - 아래 스트리밍 경로가 응답 종료 처리
+                file = None
+            if file is not None:
+                try:
+                    await send({
+                        "type": "http.response.zerocopysend", "file": file.fileno(),
+                        "offset": self.start, "count": self.length, "more_body": False
+                    })
+                finally:
+                    await run_in_threadpool(file.close)
+                return
+
+        position, end = self.start, self.start + self.length - 1
+        while position <= end:
+            chunk = await self.storage.read(self.name, position, min(position + CHUNK_SIZE, end + 1) - 1)
+            if not chunk:
+                break
+            position += len(chunk)
+            await send({"type": "http.response.body", "body": chunk, "more_body": position <= end})
+        if position <= end:
+            # 전송 도중 파일이 사라진 경우 - 응답 종료
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+async def _select_variant(request: Request, storage: StorageBackend, name: str):
+    accepted = accepted_encodings(request.headers.get("accept-encoding"))
+    for encoding, suffix in PRECOMPRESSED_VARIANTS:
+        if encoding in accepted:
+            stored = await storage.stat(name + suffix)
+            if stored is not None:
+                return stored, encoding
+    return None, None
+
+async def serve_media(request: Request, storage: StorageBackend, name: str) -> Response:
+    """업로드 파일 응답 (조건부 요청, Range, 미리 압축된 변형, 캐시 헤더)"""
+    if name.endswith(VARIANT_SUFFIXES) or name.endswith(".tmp"):
+        raise HTTPException(status_code=404, detail="File not found")
+    try:
+        original = await storage.stat(name)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="File not found")
+    if original is None:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    stored, encoding = await _select_variant(request, storage, name)
+    if stored is None:
+        stored = original
+
+    etag = entity_tag(name, stored, encoding)
+    last_modified = formatdate(stored.modified, usegmt=True)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if CONTENT_ADDRESSED.search(name) else REVALIDATE_CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+        "Vary": "Accept-Encoding",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    if is_not_modified(request, etag, stored.modified):
+        return Response(status_code=304, headers=headers)
+
+    media_type = original.content_type or mimetypes.guess_type(name)[0] or "application/octet-stream"
+    byte_range = parse_range(request.headers.get("range"), stored.size) if range_allowed(request, etag, last_modified) else None
+    if byte_range is None:
+        start, length, status_code = 0, stored.size, 200
+    else:
+        start, end = byte_range
+        length, status_code = end - start + 1, 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{stored.size}"
+    headers["Content-Length"] = str(length)
+    return MediaResponse(
+        storage, stored.name, start, length, status_code, headers, media_type,
+        head_only=request.method == "HEAD"
+    )
@@ -0,0 +1,27 @@
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+class ProcessTimeMiddleware:
+    """응답 헤더에 처리 시간(X-Process-Time) 추가
+
+    순수 ASGI 미들웨어 - 요청/응답 본문을 버퍼링하지 않고 메시지를 그대로 전달
+    (스트리밍, Range 응답, http.response.zerocopysend 전송이 중간에서 막히지 않도록)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+
+        async def send_with_process_time(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{time.perf_counter() - start:.6f}")
+            await send(message)
+
+        await self.app(scope, receive, send_with_process_time)
@@ -0,0 +1,175 @@
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from app.utils.profiler import propagate_route
+
+# bcrypt 해시 형식: $2b$<라운드 2자리>$<솔트 22자><해시 31자>
+BCRYPT_PREFIX_LENGTH = 7
+BCRYPT_SALT_LENGTH = 22
+
+def bcrypt_rounds(hashed_password: str) -> Optional[int]:
+    try:
+        return int(hashed_password.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+def bcrypt_salt(hashed_password: str) -> str:
+    return hashed_password[BCRYPT_PREFIX_LENGTH:BCRYPT_PREFIX_LENGTH + BCRYPT_SALT_LENGTH]
+
+class HashMetrics:
+    """해싱 연산별(hash/verify/rehash) · 라운드별 소요 시간 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, int], list] = {}
+
+    def record(self, operation: str, rounds: int, seconds: float) -> None:
+        with self._lock:
+            stat = self._stats.setdefault((operation, rounds), [0, 0.0, 0.0])
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], seconds)
+
+    def average_ms(self, operation: str, rounds: int) -> Optional[float]:
+        stat = self._stats.get((operation, rounds))
+        return stat[1] / stat[0] * 1000 if stat else None
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [
+                {"operation": operation, "rounds": rounds, "count": count,
+                 "avg_ms": round(total / count * 1000, 3), "max_ms": round(peak * 1000, 3)}
+                for (operation, rounds), (count, total, peak) in sorted(self._stats.items())
+            ]
+
+def calibrate_rounds(target_ms: float, min_rounds: int = 4, max_rounds: int = 15,
+                     samples: int = 3, timer: Callable[[int], float] = None) -> Tuple[int, Dict[int, float]]:
+    """목표 검증 시간(ms)을 넘지 않는 가장 큰 bcrypt 라운드 선택
+
+    라운드가 1 오를 때마다 비용이 두 배이므로 낮은 라운드부터 재며 목표를 넘으면 중단
+    반환값: (선택한 라운드, {라운드: 검증 ms 중앙값})
+    """
+    timer = timer or _time_verify
+    chosen = min_rounds
+    table: Dict[int, float] = {}
+    for rounds in range(min_rounds, max_rounds + 1):
+        table[rounds] = statistics.median(timer(rounds) for _ in range(samples)) * 1000
+        if table[rounds] > target_ms:
+            break
+        chosen = rounds
+    return chosen, table
+
+def _time_verify(rounds: int) -> float:
+    from passlib.hash import bcrypt
+    hashed = bcrypt.using(rounds=rounds).hash("calibration")
+    start = time.perf_counter()
+    bcrypt.verify("calibration", hashed)
+    return time.perf_counter() - start
+
+class PasswordHasher:
+    """bcrypt 해싱/검증 + 전용 스레드 풀 + 지표
+
+    - rounds 미만으로 저장된 해시는 needs_update → 로그인 성공 시 백그라운드에서 재해싱
+    - 재해싱은 기존 솔트를 유지 (토큰의 비밀번호 지문이 바뀌지 않도록)
+    - 비동기 연산은 max_workers 크기의 풀에서 실행 (이벤트 루프 차단 방지, 동시 해싱 수 제한)
+    """
+
+    def __init__(self, rounds: int, max_workers: int = 2):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.metrics = HashMetrics()
+        self.calibration: Dict[int, float] = {}
+        self._context = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def context(self):
+        """passlib/bcrypt는 첫 해싱 시점에 로드 (서버 시작 시간 단축)"""
+        if self._context is None:
+            from passlib.context import CryptContext
+            self._context = CryptContext(
+                schemes=["bcrypt"], deprecated="auto",
+                bcrypt__default_rounds=self.rounds, bcrypt__min_rounds=self.rounds,
+            )
+        return self._context
+
+    def configure(self, rounds: int, calibration: Optional[Dict[int, float]] = None) -> None:
+        self.rounds = rounds
+        self._context = None
+        if calibration is not None:
+            self.calibration = dict(calibration)
+
+    def calibrate(self, target_ms: float, **kwargs) -> int:
+        """목표 검증 시간에 맞춰 라운드 상향 (설정된 라운드 아래로는 내리지 않음)"""
+        kwargs["min_rounds"] = max(kwargs.get("min_rounds", self.rounds), self.rounds)
+        rounds, table = calibrate_rounds(target_ms, **kwargs)
+        self.configure(rounds, table)
+        return rounds
+
+    def _timed(self, operation: str, rounds: Optional[int], func, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.metrics.record(operation, rounds or 0, time.perf_counter() - start)
+
+    def hash(self, password: str) -> str:
+        return self._timed("hash", self.rounds, self.context.hash, password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._timed("verify", bcrypt_rounds(hashed_password), self.context.verify, password, hashed_password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        return self.context.needs_update(hashed_password)
+
+    def rehash(self, password: str, hashed_password: str) -> str:
+        """현재 라운드로 재해싱 (솔트 유지)"""
+        handler = self.context.handler("bcrypt").using(salt=bcrypt_salt(hashed_password), rounds=self.rounds)
+        return self._timed("rehash", self.rounds, handler.hash, password)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="myfc-hash")
+            return self._executor
+
+    def submit(self, func, *args) -> Future:
+        def run():
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+        with self._lock:
+            self._in_flight += 1
+        return self._pool().submit(propagate_route(run))
+
+    async def hash_async(self, password: str) -> str:
+        return await asyncio.wrap_future(self.submit(self.hash, password))
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        return await asyncio.wrap_future(self.submit(self.verify, password, hashed_password))
+
+    def stats(self) -> dict:
+        """해싱 비용 대비 지연 - 풀 크기 산정용 (verify 평균으로 초당 처리 가능 로그인 수 추정)"""
+        verify_ms = self.metrics.average_ms("verify", self.rounds) or self.calibration.get(self.rounds)
+        return {
+            "rounds": self.rounds,
+            "workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "calibration_ms": {str(rounds): round(ms, 3) for rounds, ms in self.calibration.items()},
+            "verify_capacity_per_second": round(self.max_workers * 1000 / verify_ms, 1) if verify_ms else None,
+            "operations": self.metrics.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,220 @@
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# 대기 중인 스레드(스레드풀 유휴 워커, 이벤트 루프 select)는 CPU를 쓰지 않으므로 샘플에서 제외
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+def endpoint_routes(routes: Iterable, path: Optional[str] = None) -> Dict[object, str]:
+    """엔드포인트 함수의 code 객체 → "METHOD /경로" (path를 주면 해당 라우트만)"""
+    tags = {}
+    for route in routes:
+        if isinstance(route, APIRoute) and (path is None or route.path == path):
+            methods = ",".join(sorted(route.methods))
+            tags[route.endpoint.__code__] = f"{methods} {route.path}"
+    return tags
+
+# 스레드 id → 실행 중인 작업을 제출한 요청의 엔드포인트 code 객체
+# (해시 풀/스레드풀로 넘긴 작업은 스택에 엔드포인트 프레임이 없으므로 제출 시점에 전달)
+_thread_endpoints: Dict[int, object] = {}
+# 현재 요청의 ASGI scope (라우팅 후 scope["endpoint"]가 채워짐)
+_request_scope: ContextVar[Optional[dict]] = ContextVar("myfc_profiler_scope", default=None)
+
+def current_endpoint():
+    """현재 요청(또는 태그된 작업 스레드)의 엔드포인트 code 객체"""
+    scope = _request_scope.get()
+    endpoint = scope.get("endpoint") if scope is not None else None
+    if endpoint is not None:
+        return getattr(endpoint, "__code__", None)
+    return _thread_endpoints.get(threading.get_ident())
+
+def propagate_route(func: Callable) -> Callable:
+    """다른 스레드에서 실행할 func에 현재 요청의 라우트 태그를 실어 보냄 (태그가 없으면 func 그대로)"""
+    code = current_endpoint()
+    if code is None:
+        return func
+
+    @functools.wraps(func)
+    def tagged(*args, **kwargs):
+        ident = threading.get_ident()
+        previous = _thread_endpoints.get(ident)
+        _thread_endpoints[ident] = code
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if previous is None:
+                _thread_endpoints.pop(ident, None)
+            else:
+                _thread_endpoints[ident] = previous
+    return tagged
+
+def _frame_name(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class SamplingProfiler:
+    """sys._current_frames() 기반 샘플링 프로파일러
+
+    - 실행 중일 때만 샘플링 스레드가 돌고, 꺼져 있으면 요청 경로에 추가 비용 없음
+    - 스택에서 엔드포인트 함수의 code 객체를 찾아 라우트로 태깅 (route 지정 시 해당 라우트 스택만 수집),
+      스택에 없으면 스레드별 태그(propagate_route로 제출한 스레드풀/해시 풀 작업)로 태깅
+    - 결과는 collapsed stacks(flamegraph.pl, speedscope 모두 읽음) 또는 speedscope JSON
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._samples: Counter = Counter()
+        self._endpoints: Dict[object, str] = {}
+        self._only_tagged = False
+        self._idle: Dict[object, bool] = {}
+        self.interval = 0.005
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.sample_count = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration: float, interval: float = 0.005, endpoints: Dict[object, str] = None,
+              only_tagged: bool = False) -> bool:
+        """duration초 동안 샘플링 (이미 실행 중이면 False)"""
+        with self._lock:
+            if self.running:
+                return False
+            self._samples = Counter()
+            self._endpoints = dict(endpoints or {})
+            self._only_tagged = only_tagged
+            self.interval = interval
+            self.sample_count = 0
+            self.started_at = self.clock()
+            self.finished_at = None
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(duration,), name="myfc-profiler", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self, duration: float) -> None:
+        own_ident = threading.get_ident()
+        deadline = self.clock() + duration
+        try:
+            while not self._stop.is_set() and self.clock() < deadline:
+                self._sample(own_ident)
+                self._stop.wait(self.interval)
+        finally:
+            self.finished_at = self.clock()
+
+    def _is_idle(self, code) -> bool:
+        idle = self._idle.get(code)
+        if idle is None:
+            idle = self._idle[code] = (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES
+        return idle
+
+    def _sample(self, own_ident: int) -> None:
+        self.sample_count += 1
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_ident or self._is_idle(frame.f_code):
+                continue
+            codes = []
+            route = None
+            while frame is not None:
+                code = frame.f_code
+                if route is None:
+                    route = self._endpoints.get(code)
+                codes.append(code)
+                frame = frame.f_back
+            if route is None:
+                route = self._endpoints.get(_thread_endpoints.get(thread_id))
+            if route is None and self._only_tagged:
+                continue
+            codes.reverse()
+            self._samples[(route, tuple(codes))] += 1
+
+    def stacks(self) -> List[Tuple[List[str], int]]:
+        """(루트부터 프레임 이름 목록, 샘플 수) - 라우트 태그는 맨 앞 프레임으로"""
+        result = []
+        for (route, codes), count in sorted(list(self._samples.items()), key=lambda item: -item[1]):
+            names = [_frame_name(code) for code in codes]
+            result.append(([f"[{route}]"] + names if route else names, count))
+        return result
+
+    def collapsed(self) -> str:
+        return "".join(f"{';'.join(names)} {count}\n" for names, count in self.stacks())
+
+    def speedscope(self, name: str = "myfc") -> dict:
+        frames: List[dict] = []
+        index: Dict[str, int] = {}
+        samples, weights = [], []
+        for names, count in self.stacks():
+            stack = []
+            for frame_name in names:
+                if frame_name not in index:
+                    index[frame_name] = len(frames)
+                    frames.append({"name": frame_name})
+                stack.append(index[frame_name])
+            samples.append(stack)
+            weights.append(round(count * self.interval, 6))
+        total = round(sum(weights), 6)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled", "name": name, "unit": "seconds",
+                "startValue": 0, "endValue": total, "samples": samples, "weights": weights,
+            }],
+            "name": name,
+            "exporter": "myfc-profiler",
+        }
+
+    def status(self) -> dict:
+        end = self.finished_at if self.finished_at is not None else self.clock()
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "routes": sorted(set(self._endpoints.values())) if self._only_tagged else None,
+            "duration": round(end - self.started_at, 3) if self.started_at is not None else 0,
+            "samples": self.sample_count,
+            "stacks": len(self._samples),
+        }
+
+# 관리용 엔드포인트(/admin/profiler)로 켜고 끄는 프로세스 단위 프로파일러
+profiler = SamplingProfiler()
+
+class RouteTagMiddleware:
+    """프로파일러 실행 중에만 요청 scope를 컨텍스트에 보관 (propagate_route가 라우트 태그를 찾는 곳)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not profiler.running:
+            await self.app(scope, receive, send)
+            return
+        token = _request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
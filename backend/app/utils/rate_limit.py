@@ -0,0 +1,226 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app import config
+from app.utils.profiler import propagate_route
+
+# 라우트별 비용 (토큰 수) - 경로 템플릿 기준, 앞에서부터 가장 먼저 일치하는 접두사 적용
+ROUTE_COSTS = (
+    ("GET", "/analytics/team/{team_id}/player-contributions", 10),
+    ("GET", "/analytics/", 5),
+    ("GET", "/leaderboard", 3),
+    ("GET", "/search", 2),
+)
+DEFAULT_READ_COST = 1
+DEFAULT_WRITE_COST = 2
+
+def route_cost(method: str, path: str) -> int:
+    """요청 비용 - 비싼 분석 라우트일수록 버킷에서 많은 토큰을 소모"""
+    for route_method, prefix, cost in ROUTE_COSTS:
+        if method == route_method and path.startswith(prefix):
+            return cost
+    return DEFAULT_READ_COST if method in ("GET", "HEAD") else DEFAULT_WRITE_COST
+
+def request_cost(request: Request) -> int:
+    route = request.scope.get("route")
+    return route_cost(request.method, getattr(route, "path", request.url.path))
+
+class MemoryBucketStore:
+    """프로세스 내 버킷 상태 (키 → (남은 토큰, 갱신 시각))"""
+
+    # 잠금만 잡고 바로 끝나므로 이벤트 루프에서 직접 호출
+    blocking = False
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, cost: float, rate: float, burst: float, now: float) -> Tuple[bool, float]:
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            if key not in self._buckets and len(self._buckets) >= self.max_keys:
+                # 가득 차면 가장 오래된 키부터 제거 (오래된 버킷은 어차피 가득 찬 상태)
+                self._buckets.pop(next(iter(self._buckets)))
+            self._buckets[key] = (tokens, now)
+        return allowed, tokens
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+class SQLiteBucketStore:
+    """여러 워커 프로세스가 공유하는 버킷 상태 (Redis 등 외부 저장소의 로컬 대체)
+
+    BEGIN IMMEDIATE로 읽기-갱신을 원자적으로 처리, 시각은 time.time() 기준
+    (다른 워커의 쓰기 잠금을 최대 5초 기다리므로 async 경로에서는 스레드풀에서 실행)
+    """
+
+    blocking = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def take(self, key: str, cost: float, rate: float, burst: float, now: float) -> Tuple[bool, float]:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated FROM rate_buckets WHERE key = ?", (key,)).fetchone()
+            tokens, updated = row if row else (burst, now)
+            tokens = min(burst, tokens + max(0.0, now - updated) * rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            conn.execute(
+                "INSERT INTO rate_buckets (key, tokens, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                (key, tokens, now)
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed, tokens
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM rate_buckets")
+
+class RateLimiter:
+    """토큰 버킷 - 초당 rate개씩 채워지고 최대 burst개까지 쌓임"""
+
+    def __init__(self, name: str, rate: float, burst: float, store=None, clock=None):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.store = store or MemoryBucketStore()
+        self.clock = clock or (time.time if isinstance(self.store, SQLiteBucketStore) else time.monotonic)
+
+    def hit(self, key, cost: float = 1) -> None:
+        """허용되면 토큰 차감, 부족하면 429 (Retry-After: 필요한 토큰이 찰 때까지의 초)"""
+        if not config.RATE_LIMIT_ENABLED:
+            return
+        allowed, tokens = self.store.take(f"{self.name}:{key}", cost, self.rate, self.burst, self.clock())
+        if not allowed:
+            retry_after = max(1, int((min(cost, self.burst) - tokens) / self.rate + 0.999))
+            raise HTTPException(
+                status_code=429, detail="Too many requests",
+                headers={"Retry-After": str(retry_after)}
+            )
+
+    async def hit_async(self, key, cost: float = 1) -> None:
+        """async 의존성용 hit - 파일 잠금을 기다릴 수 있는 저장소는 이벤트 루프를 막지 않도록 스레드풀에서"""
+        if not config.RATE_LIMIT_ENABLED:
+            return
+        if self.store.blocking:
+            await run_in_threadpool(propagate_route(self.hit), key, cost)
+        else:
+            self.hit(key, cost)
+
+def _make_store():
+    if config.RATE_LIMIT_STORE_PATH:
+        return SQLiteBucketStore(config.RATE_LIMIT_STORE_PATH)
+    return MemoryBucketStore()
+
+_store = _make_store()
+
+# 팀(JWT sub) 단위 - 인증된 API 전체, 라우트 비용 가중
+team_limiter = RateLimiter("team", config.RATE_LIMIT_TEAM_RATE, config.RATE_LIMIT_TEAM_BURST, _store)
+# 클라이언트 IP 단위 - 로그인 시도 (비밀번호 대입 방지)
+login_limiter = RateLimiter("login", config.RATE_LIMIT_LOGIN_RATE, config.RATE_LIMIT_LOGIN_BURST, _store)
+
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+def limit_login(request: Request) -> None:
+    """로그인 라우트 의존성 - IP별 시도 횟수 제한"""
+    login_limiter.hit(client_ip(request))
+
+class AdmissionControlMiddleware:
+    """전역 동시 처리 수 제한 - 과부하 시 지연이 무너지기 전에 503으로 빠르게 거절
+
+    - max_concurrent개까지 즉시 처리, 초과분은 max_queue개까지 queue_timeout초 대기
+    - 대기열이 가득 찼거나 대기 시간을 넘기면 503 + Retry-After
+    """
+
+    def __init__(
+        self, app: ASGIApp, max_concurrent: int = 40, max_queue: int = 100,
+        queue_timeout: float = 2.0, exempt_paths: Tuple[str, ...] = ("/docs", "/openapi.json")
+    ):
+        self.app = app
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.exempt_paths = exempt_paths
+        self.in_flight = 0
+        self.waiting = 0
+        self.shed = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 세마포어는 이벤트 루프에 묶이므로 루프별로 생성 (워커 프로세스당 루프 하나)
+            self._semaphore, self._loop = asyncio.Semaphore(self.max_concurrent), loop
+
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                await self._reject(scope, receive, send)
+                return
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                await self._reject(scope, receive, send)
+                return
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.shed += 1
+        response = JSONResponse(
+            status_code=503, content={"detail": "Server is busy, retry later"},
+            headers={"Retry-After": str(max(1, int(self.queue_timeout)))}
+        )
+        await response(scope, receive, send)
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": self.in_flight, "waiting": self.waiting, "shed": self.shed}
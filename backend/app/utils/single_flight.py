@@ -0,0 +1,109 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from fastapi import Request
+
+from app import config
+
+def route_key(request: Request, *scope: Hashable) -> tuple:
+    """라우트 템플릿 + 경로/쿼리 파라미터 기준 키 (scope로 요청자 등 결과에 영향을 주는 값 추가)"""
+    route = request.scope.get("route")
+    return (
+        request.method,
+        getattr(route, "path", request.url.path),
+        tuple(sorted(request.path_params.items())),
+        tuple(sorted(request.query_params.multi_items())),
+        *scope,
+    )
+
+class SingleFlight:
+    """같은 키의 동시 계산을 하나로 합침 (첫 호출자만 계산하고 대기자에게 같은 결과/예외 전달)
+
+    - 동기(스레드풀 라우트)와 비동기(이벤트 루프 라우트) 호출이 진행 중인 계산을 함께 공유
+    - 대기는 timeout까지만, 넘으면 대기자가 직접 계산 (느린 계산 하나에 요청이 줄줄이 묶이지 않도록)
+    - 결과는 보관하지 않음 (계산이 끝난 뒤의 재사용은 캐시 몫)
+    """
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.followers = 0
+        self.timeouts = 0
+
+    def _join(self, key: Hashable):
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                self.leaders += 1
+                return future, True
+            self.followers += 1
+            return future, False
+
+    def _release(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def _settle(self, key: Hashable, future: Future, result: Any = None, error: BaseException = None) -> None:
+        self._release(key, future)
+        if error is None:
+            future.set_result(result)
+        elif isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            # 리더가 취소됨 → 대기자는 각자 계산
+            future.cancel()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        future, leader = self._join(key)
+        if not leader:
+            try:
+                return future.result(timeout=self.timeout)
+            except TimeoutError:
+                self.timeouts += 1
+                return fn()
+            except CancelledError:
+                return fn()
+        try:
+            result = fn()
+        except BaseException as error:
+            self._settle(key, future, error=error)
+            raise
+        self._settle(key, future, result)
+        return result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future, leader = self._join(key)
+        if not leader:
+            try:
+                return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), self.timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                return await fn()
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                return await fn()
+        try:
+            result = await fn()
+        except BaseException as error:
+            self._settle(key, future, error=error)
+            raise
+        self._settle(key, future, result)
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "timeouts": self.timeouts,
+        }
+
+# 비싼 GET 요청 합치기 (분석, 경기 상세)
+request_coalescer = SingleFlight(config.COALESCE_TIMEOUT)
@@ -0,0 +1,403 @@
+import abc
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app import config
+from app.utils.profiler import propagate_route
+
+class StoredObject:
+    """저장된 파일 메타데이터 (미디어 응답의 Content-Length/ETag/Last-Modified용)"""
+
+    def __init__(self, name: str, size: int, modified: float, content_type: Optional[str] = None, etag: Optional[str] = None):
+        self.name = name
+        self.size = size
+        self.modified = modified
+        self.content_type = content_type
+        self.etag = etag
+
+class StorageBackend(abc.ABC):
+    """업로드 파일 저장소 인터페이스
+
+    - 모든 메서드는 async, 블로킹 파일 시스템 호출은 제한된 스레드 풀에서 실행
+    - 이름(name)은 업로드 디렉터리 기준 파일 이름 (URL은 /uploads/{name})
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="storage")
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, propagate_route(func), *args)
+
+    @abc.abstractmethod
+    async def save(self, name: str, data: bytes, content_type: Optional[str] = None) -> StoredObject:
+        ...
+
+    @abc.abstractmethod
+    async def stat(self, name: str) -> Optional[StoredObject]:
+        ...
+
+    @abc.abstractmethod
+    async def read(self, name: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        ...
+
+    @abc.abstractmethod
+    async def delete_many(self, names: Iterable[str]) -> int:
+        ...
+
+    async def delete(self, name: str) -> bool:
+        return await self.delete_many([name]) == 1
+
+    async def exists(self, name: str) -> bool:
+        return await self.stat(name) is not None
+
+    @abc.abstractmethod
+    async def list_names(self) -> List[str]:
+        ...
+
+    def local_path(self, name: str) -> Optional[str]:
+        """디스크 경로가 있는 백엔드면 경로 반환 (sendfile 등 제로 카피 전송용)"""
+        return None
+
+    def url(self, name: str) -> str:
+        return f"/{config.UPLOAD_URL_PREFIX}/{name}"
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+def _check_name(name: str) -> str:
+    # 경로 탈출 방지 - 저장소 이름은 단일 파일 이름만 허용
+    if not name or name != os.path.basename(name) or name.startswith("."):
+        raise ValueError(f"invalid storage name: {name!r}")
+    return name
+
+def _read_range(path: str, start: int, end: Optional[int]) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read() if end is None else f.read(end - start + 1)
+
+class LocalStorage(StorageBackend):
+    """업로드 디렉터리에 파일 그대로 저장 (디렉터리는 최초 1회만 생성)"""
+
+    def __init__(self, root: str, max_workers: int = 4):
+        super().__init__(max_workers)
+        self.root = root
+        self._root_ready = False
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.root, _check_name(name))
+
+    def local_path(self, name: str) -> Optional[str]:
+        return self._path(name)
+
+    def _ensure_root(self) -> None:
+        if not self._root_ready:
+            os.makedirs(self.root, exist_ok=True)
+            self._root_ready = True
+
+    def _save(self, name: str, data: bytes) -> StoredObject:
+        self._ensure_root()
+        path = self._path(name)
+        # 임시 파일에 쓴 뒤 교체 - 읽는 쪽이 쓰다 만 파일을 보지 않도록
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return self._stat(name)
+
+    def _stat(self, name: str) -> Optional[StoredObject]:
+        try:
+            st = os.stat(self._path(name))
+        except FileNotFoundError:
+            return None
+        return StoredObject(name, st.st_size, st.st_mtime)
+
+    def _delete_many(self, names: List[str]) -> int:
+        deleted = 0
+        for name in names:
+            try:
+                os.remove(self._path(name))
+                deleted += 1
+            except FileNotFoundError:
+                continue
+        return deleted
+
+    def _list_names(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return [entry.name for entry in os.scandir(self.root) if entry.is_file() and not entry.name.endswith(".tmp")]
+
+    async def save(self, name: str, data: bytes, content_type: Optional[str] = None) -> StoredObject:
+        stored = await self._run(self._save, name, data)
+        stored.content_type = content_type
+        return stored
+
+    async def stat(self, name: str) -> Optional[StoredObject]:
+        return await self._run(self._stat, name)
+
+    async def read(self, name: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        return await self._run(_read_range, self._path(name), start, end)
+
+    async def delete_many(self, names: Iterable[str]) -> int:
+        return await self._run(self._delete_many, list(names))
+
+    async def list_names(self) -> List[str]:
+        return await self._run(self._list_names)
+
+class ObjectStoreStorage(StorageBackend):
+    """오브젝트 스토리지(S3 등) 동작을 흉내 내는 로컬 대체 구현
+
+    - 키마다 본문(objects/)과 메타데이터(meta/, content_type/etag) 분리 저장
+    - 키 해시 앞 2자리로 디렉터리 분산, 일괄 삭제는 batch_size 단위 요청으로 처리
+    - 실제 디스크 경로를 노출하지 않음 (local_path는 None, 미디어는 read로 스트리밍)
+    """
+
+    def __init__(self, root: str, max_workers: int = 4, batch_size: int = 1000):
+        super().__init__(max_workers)
+        self.root = root
+        self.batch_size = batch_size
+        # 요청 횟수 (일괄 삭제가 묶여서 호출되는지 확인용)
+        self.request_count = 0
+
+    def _paths(self, name: str):
+        shard = hashlib.sha1(_check_name(name).encode()).hexdigest()[:2]
+        return (
+            os.path.join(self.root, "objects", shard, name),
+            os.path.join(self.root, "meta", shard, f"{name}.json"),
+        )
+
+    def _put(self, name: str, data: bytes, content_type: Optional[str]) -> StoredObject:
+        self.request_count += 1
+        object_path, meta_path = self._paths(name)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        meta = {"content_type": content_type, "etag": hashlib.md5(data).hexdigest(), "size": len(data)}
+        tmp_path = f"{object_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, object_path)
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+        return StoredObject(name, len(data), os.stat(object_path).st_mtime, content_type, meta["etag"])
+
+    def _head(self, name: str) -> Optional[StoredObject]:
+        self.request_count += 1
+        object_path, meta_path = self._paths(name)
+        try:
+            st = os.stat(object_path)
+            with open(meta_path) as f:
+                meta: Dict = json.load(f)
+        except FileNotFoundError:
+            return None
+        return StoredObject(name, st.st_size, st.st_mtime, meta.get("content_type"), meta.get("etag"))
+
+    def _get(self, name: str, start: int, end: Optional[int]) -> bytes:
+        self.request_count += 1
+        return _read_range(self._paths(name)[0], start, end)
+
+    def _delete_objects(self, names: List[str]) -> int:
+        """DeleteObjects 한 번에 해당 (batch_size 이하 키)"""
+        self.request_count += 1
+        deleted = 0
+        for name in names:
+            object_path, meta_path = self._paths(name)
+            try:
+                os.remove(object_path)
+                deleted += 1
+            except FileNotFoundError:
+                pass
+            try:
+                os.remove(meta_path)
+            except FileNotFoundError:
+                pass
+        return deleted
+
+    def _list(self) -> List[str]:
+        self.request_count += 1
+        objects_dir = os.path.join(self.root, "objects")
+        names = []
+        if os.path.isdir(objects_dir):
+            for shard in os.scandir(objects_dir):
+                names.extend(entry.name for entry in os.scandir(shard.path) if not entry.name.endswith(".tmp"))
+        return names
+
+    async def save(self, name: str, data: bytes, content_type: Optional[str] = None) -> StoredObject:
+        return await self._run(self._put, name, data, content_type)
+
+    async def stat(self, name: str) -> Optional[StoredObject]:
+        return await self._run(self._head, name)
+
+    async def read(self, name: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        return await self._run(self._get, name, start, end)
+
+    async def delete_many(self, names: Iterable[str]) -> int:
+        names = list(names)
+        deleted = 0
+        for i in range(0, len(names), self.batch_size):
+            deleted += await self._run(self._delete_objects, names[i:i + self.batch_size])
+        return deleted
+
+    async def list_names(self) -> List[str]:
+        return await self._run(self._list)
+
+class OrphanCleaner:
+    """더 이상 참조되지 않는 업로드 파일을 모아서 일괄 삭제
+
+    - schedule: 어느 스레드에서든 호출 가능 (동기 서비스 메서드 포함), 즉시 반환
+    - 백그라운드 태스크가 interval마다 또는 batch_size가 차면 delete_many 한 번으로 삭제
+    - 대기 목록은 프로세스별이라 다른 워커의 재업로드는 cancel이 닿지 않음
+      → 삭제 직전에 DB 참조를 다시 확인하고, 삭제 대상이 된 뒤 다시 저장된 파일은 남김
+    """
+
+    def __init__(
+        self, storage: StorageBackend, interval: float = 5.0, batch_size: int = 100,
+        referenced: Optional[Callable[[List[str]], Set[str]]] = None
+    ):
+        self.storage = storage
+        self.interval = interval
+        self.batch_size = batch_size
+        # 삭제 직전에 아직 DB가 참조하는 이름을 돌려주는 함수 (블로킹, 스레드 풀에서 호출)
+        self.referenced = referenced
+        # 이름 → 삭제 대상이 된 시각 (time.time)
+        self._pending: Dict[str, float] = {}
+        # 삭제 중인 이름과 삭제가 끝나면 완료되는 Future
+        self._deleting: Optional[Tuple[Set[str], Future]] = None
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def schedule(self, names: Iterable[str]) -> None:
+        now = time.time()
+        with self._lock:
+            self._pending.update((name, now) for name in names if name)
+            full = len(self._pending) >= self.batch_size
+        if full and self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def cancel(self, names: Iterable[str]) -> Optional[Future]:
+        """다시 참조되는 파일(같은 내용 재업로드)을 삭제 대상에서 제외
+
+        이미 삭제 중이면 삭제가 끝날 때 완료되는 Future 반환 (끝난 뒤에 저장해야 파일이 남음)
+        """
+        names = {name for name in names if name}
+        with self._lock:
+            for name in names:
+                self._pending.pop(name, None)
+            if self._deleting is not None and names & self._deleting[0]:
+                return self._deleting[1]
+        return None
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    async def flush(self) -> int:
+        with self._lock:
+            scheduled, self._pending = self._pending, {}
+            if not scheduled:
+                return 0
+            done = Future()
+            self._deleting = (set(scheduled), done)
+        try:
+            names = await self._orphans(scheduled)
+            return await self.storage.delete_many(names) if names else 0
+        finally:
+            with self._lock:
+                self._deleting = None
+            done.set_result(None)
+
+    async def _orphans(self, scheduled: Dict[str, float]) -> List[str]:
+        """삭제해도 되는 이름 - 다시 참조되었거나 삭제 대상이 된 뒤 다시 저장된 파일(다른 워커의 재업로드) 제외"""
+        names = list(scheduled)
+        if self.referenced is not None:
+            kept = await asyncio.get_running_loop().run_in_executor(None, self.referenced, names)
+            names = [name for name in names if name not in kept]
+        orphans = []
+        for name in names:
+            stored = await self.storage.stat(name)
+            if stored is not None and stored.modified < scheduled[name]:
+                orphans.append(name)
+        return orphans
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except OSError:
+                # 삭제 실패는 다음 정리(manage cleanup-uploads)에서 다시 수거
+                continue
+
+_storage: Optional[StorageBackend] = None
+_cleaner: Optional[OrphanCleaner] = None
+
+def get_storage() -> StorageBackend:
+    """설정(MYFC_STORAGE_BACKEND)에 따른 저장소 싱글턴"""
+    global _storage
+    if _storage is None:
+        if config.STORAGE_BACKEND == "object":
+            _storage = ObjectStoreStorage(config.UPLOAD_DIR, max_workers=config.STORAGE_MAX_WORKERS)
+        else:
+            _storage = LocalStorage(config.UPLOAD_DIR, max_workers=config.STORAGE_MAX_WORKERS)
+    return _storage
+
+def get_orphan_cleaner() -> OrphanCleaner:
+    global _cleaner
+    if _cleaner is None:
+        from app.database import SessionLocal
+        storage = get_storage()
+        _cleaner = OrphanCleaner(storage, referenced=functools.partial(referenced_names, SessionLocal, storage))
+    return _cleaner
+
+def referenced_names(session_factory, storage: StorageBackend, names: Iterable[str]) -> Set[str]:
+    """names 중 팀 로고/이미지로 참조되는 파일 (압축 변형은 원본 기준)"""
+    from sqlalchemy import or_
+    from app.models import Team
+    from app.utils.media import original_name
+
+    names = list(names)
+    urls = {storage.url(original_name(name)) for name in names}
+    db = session_factory()
+    try:
+        rows = db.query(Team.logo_url, Team.image_url).filter(
+            or_(Team.logo_url.in_(urls), Team.image_url.in_(urls))
+        ).all()
+    finally:
+        db.close()
+    referenced = {name_from_url(url) for row in rows for url in row if url}
+    return {name for name in names if original_name(name) in referenced}
+
+def name_from_url(url: Optional[str]) -> Optional[str]:
+    """/uploads/{name} 형태 URL에서 저장소 이름 추출"""
+    if not url:
+        return None
+    return os.path.basename(url)
@@ -0,0 +1,122 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Set, Tuple
+
+class TokenPrincipal(NamedTuple):
+    """검증이 끝난 액세스 토큰의 내용"""
+    team_id: int
+    exp: float
+    password_fingerprint: Optional[str] = None
+
+class TeamPrincipal(NamedTuple):
+    """DB에서 확인한 인증 팀 스냅샷 (get_current_team 반환값, 라우트는 id만 사용)"""
+    id: int
+    name: str
+    password_fingerprint: Optional[str] = None
+
+class VerifiedTokenCache:
+    """서명 검증을 마친 토큰 캐시 (토큰 다이제스트 → TokenPrincipal)
+
+    - 같은 bearer 토큰이 만료 전까지 반복 제시되므로 HMAC 검증/클레임 파싱을 한 번만 수행
+    - 원문 토큰 대신 SHA-256 다이제스트를 키로 저장
+    - 만료(exp)된 항목은 조회 시 제거, 가득 차면 만료 항목부터 정리 후 LRU 제거
+    - DB에서 확인한 팀(존재 여부, 비밀번호 지문)도 잠시 보관 → 적중 시 인증에 DB 세션이 필요 없음
+    - 비밀번호 변경/팀 삭제 시 invalidate_team으로 해당 팀 항목 전체 삭제
+    """
+
+    def __init__(self, max_entries: int = 10000, clock=time.time):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[bytes, TokenPrincipal]" = OrderedDict()
+        self._by_team: Dict[int, Set[bytes]] = {}
+        self._teams: Dict[int, Tuple[float, TeamPrincipal]] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[TokenPrincipal]:
+        if self.max_entries <= 0:
+            return None
+        key = self.digest(token)
+        with self._lock:
+            principal = self._entries.get(key)
+            if principal is None:
+                self.misses += 1
+                return None
+            if principal.exp <= self.clock():
+                self._remove(key, principal)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return principal
+
+    def put(self, token: str, principal: TokenPrincipal) -> None:
+        if self.max_entries <= 0:
+            return
+        key = self.digest(token)
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                self._evict()
+            self._entries[key] = principal
+            self._entries.move_to_end(key)
+            self._by_team.setdefault(principal.team_id, set()).add(key)
+
+    def get_team(self, team_id: int, max_age: float) -> Optional[TeamPrincipal]:
+        """max_age초 안에 DB에서 확인한 팀 (다른 워커의 비밀번호 변경은 최대 max_age 동안 반영되지 않음)"""
+        entry = self._teams.get(team_id)
+        if entry is None or self.clock() - entry[0] >= max_age:
+            return None
+        return entry[1]
+
+    def put_team(self, team: TeamPrincipal) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._teams.pop(team.id, None)
+            if len(self._teams) >= self.max_entries:
+                # 가장 오래전에 확인한 팀부터 제거
+                self._teams.pop(next(iter(self._teams)))
+            self._teams[team.id] = (self.clock(), team)
+
+    def invalidate_team(self, team_id: int) -> None:
+        with self._lock:
+            for key in self._by_team.pop(team_id, ()):
+                self._entries.pop(key, None)
+            self._teams.pop(team_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_team.clear()
+            self._teams.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: bytes, principal: TokenPrincipal) -> None:
+        self._entries.pop(key, None)
+        keys = self._by_team.get(principal.team_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_team[principal.team_id]
+
+    def _evict(self) -> None:
+        now = self.clock()
+        # 만료 항목 전체 정리는 최대 1분에 한 번 (가득 찬 상태에서 매 삽입마다 전체 순회하지 않도록)
+        if now - self._last_sweep >= 60:
+            self._last_sweep = now
+            expired = [(key, principal) for key, principal in self._entries.items() if principal.exp <= now]
+            for key, principal in expired:
+                self._remove(key, principal)
+        if len(self._entries) >= self.max_entries:
+            key, principal = next(iter(self._entries.items()))
+            self._remove(key, principal)
@@ -0,0 +1,221 @@
+import functools
+import inspect
+import json
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import config
+
+# W3C Trace Context: traceparent = 00-<trace_id 32hex>-<parent span_id 16hex>-<flags 2hex>
+TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+SQL_STATEMENT_MAX_LENGTH = 500
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "kind", "attributes", "start_ns", "end_ns", "error")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str] = None,
+                 kind: str = "INTERNAL", attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def child(self, name: str, kind: str = "INTERNAL", **attributes) -> "Span":
+        return Span(name, self.trace_id, self.span_id, kind, attributes)
+
+    def to_dict(self) -> dict:
+        """OpenTelemetry 콘솔 exporter와 같은 형태의 JSON"""
+        return {
+            "name": self.name,
+            "context": {"trace_id": f"0x{self.trace_id}", "span_id": f"0x{self.span_id}"},
+            "kind": f"SpanKind.{self.kind}",
+            "parent_id": f"0x{self.parent_id}" if self.parent_id else None,
+            "start_time": _isoformat(self.start_ns),
+            "end_time": _isoformat(self.end_ns),
+            "status": {"status_code": "ERROR", "description": self.error} if self.error else {"status_code": "UNSET"},
+            "attributes": self.attributes,
+        }
+
+def _isoformat(ns: Optional[int]) -> Optional[str]:
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+
+class ConsoleExporter:
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+class FileExporter(ConsoleExporter):
+    """스팬마다 JSON 한 줄 (JSON Lines) 추가"""
+
+    def __init__(self, path: str):
+        super().__init__(open(path, "a", encoding="utf-8", buffering=1))
+
+# 현재 요청의 활성 스팬 (샘플링되지 않은 요청은 None → 계측 코드가 바로 통과)
+_current_span: ContextVar[Optional[Span]] = ContextVar("myfc_current_span", default=None)
+
+class Tracer:
+    """경량 스팬 추적 - 샘플링된 요청만 스팬을 만들고 끝날 때 exporter로 내보냄"""
+
+    def __init__(self, sample_rate: float = 0.0, exporter: Optional[Callable[[Span], None]] = None):
+        self.sample_rate = sample_rate
+        self.exporter = exporter or ConsoleExporter()
+
+    def should_sample(self, parent_flags: Optional[str]) -> bool:
+        if parent_flags is not None:
+            # 상위 서비스의 샘플링 결정을 따름
+            return int(parent_flags, 16) & 1 == 1
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def end(self, span: Span, error: Optional[BaseException] = None) -> None:
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        self.exporter(span)
+
+tracer = Tracer(
+    config.TRACE_SAMPLE_RATE,
+    FileExporter(config.TRACE_EXPORT_PATH) if config.TRACE_EXPORT_PATH else None,
+)
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+def start_child(name: str, kind: str = "INTERNAL", **attributes):
+    """현재 스팬의 자식 시작 → (스팬, 토큰), 추적 중이 아니면 (None, None)"""
+    parent = _current_span.get()
+    if parent is None:
+        return None, None
+    span = parent.child(name, kind, **attributes)
+    return span, _current_span.set(span)
+
+def end_child(span: Optional[Span], token, error: Optional[BaseException] = None) -> None:
+    if span is None:
+        return
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        # 다른 컨텍스트에서 시작된 스팬 (세션 이벤트 등) - 현재 컨텍스트는 그대로 둠
+        pass
+    tracer.end(span, error)
+
+class span:
+    """with span("이름"): ... - 추적 중이 아니면 아무 것도 하지 않음"""
+    __slots__ = ("name", "attributes", "_span", "_token")
+
+    def __init__(self, name: str, **attributes):
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        self._span, self._token = start_child(self.name, **self.attributes)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        end_child(self._span, self._token, exc)
+        return False
+
+def traced(name: str):
+    """함수 호출을 스팬으로 (동기/비동기 함수 모두, 시그니처 유지 - FastAPI 의존성에도 사용 가능)"""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await func(*args, **kwargs)
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def trace_methods(cls):
+    """클래스의 공개 메서드를 "클래스.메서드" 스팬으로 감쌈 (서비스 계층)"""
+    for attr_name, attr in list(vars(cls).items()):
+        if inspect.isfunction(attr) and not attr_name.startswith("_"):
+            setattr(cls, attr_name, traced(f"{cls.__name__}.{attr_name}")(attr))
+    return cls
+
+def start_sql_span(statement: str):
+    return start_child("sql", "CLIENT", **{"db.statement": statement[:SQL_STATEMENT_MAX_LENGTH]})
+
+class TracingMiddleware:
+    """요청마다 루트 스팬 생성 (traceparent 헤더로 상위 추적 이어받기, 응답에 traceparent 추가)
+
+    샘플링 비율이 0이면 그대로 통과, 샘플링되지 않은 요청은 헤더 확인 외에 추가 작업 없음
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or tracer.sample_rate <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        parent = TRACEPARENT.match(Headers(scope=scope).get("traceparent", ""))
+        if not tracer.should_sample(parent.group(3) if parent else None):
+            await self.app(scope, receive, send)
+            return
+
+        root = Span(
+            f"{scope['method']} {scope['path']}",
+            parent.group(1) if parent else secrets.token_hex(16),
+            parent.group(2) if parent else None,
+            "SERVER",
+            {"http.method": scope["method"], "http.target": scope["path"]},
+        )
+        token = _current_span.set(root)
+
+        async def send_with_traceparent(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                root.attributes["http.status_code"] = message["status"]
+                MutableHeaders(scope=message).append("traceparent", root.traceparent)
+            await send(message)
+
+        error = None
+        try:
+            await self.app(scope, receive, send_with_traceparent)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            route = scope.get("route")
+            if route is not None:
+                root.name = f"{scope['method']} {route.path}"
+                root.attributes["http.route"] = route.path
+            _current_span.reset(token)
+            tracer.end(root, error)
@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+CONFLICT_DETAIL = "Resource was modified by another request, reload and retry"
+# 세션 info 키 - 설정되어 있으면 서비스의 커밋을 flush로 대신 (호출한 쪽이 커밋)
+DEFER_COMMIT = "defer_commit"
+
+def parse_if_match(value: Optional[str]) -> Optional[int]:
+    """If-Match 헤더("3", "\"3\"", "W/\"3\"")를 버전 번호로 변환"""
+    if value is None or value.strip() == "*":
+        return None
+    tag = value.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    try:
+        return int(tag.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="If-Match must be a version number")
+
+def etag(version_id: int) -> str:
+    return f'"{version_id}"'
+
+def etag_matches(if_none_match: Optional[str], tag: str) -> bool:
+    """If-None-Match 헤더에 tag가 있는지 (약한 비교 - W/ 무시, "*"는 항상 일치)"""
+    if if_none_match is None:
+        return False
+    tags = [value.strip().removeprefix("W/") for value in if_none_match.split(",")]
+    return "*" in tags or tag in tags
+
+def check_version(db_obj, expected_version: Optional[int]) -> None:
+    """요청한 버전과 현재 버전이 다르면 쓰기 전에 바로 409"""
+    if expected_version is not None and db_obj.version_id != expected_version:
+        raise HTTPException(status_code=409, detail=CONFLICT_DETAIL)
+
+def bump_version(db: Session, db_obj) -> None:
+    """버전을 직접 관리하는 모델(version_id_generator=False)의 사용자 수정 - 값이 바뀐 경우에만 버전 증가"""
+    if db.is_modified(db_obj):
+        db_obj.version_id += 1
+
+@contextmanager
+def deferred_commit(db: Session) -> Iterator[None]:
+    """블록 안의 commit_versioned를 flush로 대신 - 블록의 쓰기를 호출한 쪽의 쓰기와 한 트랜잭션으로 커밋"""
+    db.info[DEFER_COMMIT] = True
+    try:
+        yield
+    finally:
+        db.info.pop(DEFER_COMMIT, None)
+
+def commit_versioned(db: Session) -> None:
+    """읽은 뒤 다른 요청이 먼저 커밋한 경우(UPDATE ... WHERE version_id = ? 0건) 409로 변환"""
+    try:
+        if db.info.get(DEFER_COMMIT):
+            db.flush()
+        else:
+            db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=CONFLICT_DETAIL)
@@ -0,0 +1,76 @@
+"""인증 의존성(get_current_team) 마이크로벤치마크 - 검증된 토큰 캐시 유무 비교
+
+사용법 (backend 디렉터리에서):
+    python benchmarks/auth_dependency.py [--iterations 20000] [--tokens 50]
+
+메모리 SQLite에 팀을 만들고 같은 토큰들을 반복 제시할 때의 요청당 시간을 잰다.
+- decode: 토큰 검증만 (jose 서명 검증/클레임 파싱 vs 캐시 조회)
+- dependency: get_current_team 전체 (토큰 검증 + 요청 제한 + 팀 조회)
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ["MYFC_DATABASE_URL"] = "sqlite://"
+os.environ["MYFC_RATE_LIMIT_ENABLED"] = "0"
+
+from fastapi import Request
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import auth
+from app.database import Base
+from app.models import Team
+from app.utils.token_cache import VerifiedTokenCache
+
+def make_request() -> Request:
+    return Request({
+        "type": "http", "method": "GET", "path": "/players/team/1", "headers": [],
+        "query_string": b"", "scheme": "http", "server": ("bench", 80)
+    })
+
+def bench_decode(tokens, iterations: int) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        auth.decode_access_token(tokens[i % len(tokens)])
+    return (time.perf_counter() - start) / iterations
+
+def bench_dependency(tokens, iterations: int, db) -> float:
+    request = make_request()
+
+    async def run():
+        for i in range(iterations):
+            await auth.get_current_team(request, tokens[i % len(tokens)], db)
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    return (time.perf_counter() - start) / iterations
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(Team(name=f"벤치 FC {i}", description="", type="AMATEUR") for i in range(args.tokens))
+    db.commit()
+    tokens = [auth.create_access_token({"sub": str(i + 1)}) for i in range(args.tokens)]
+
+    print(f"{'benchmark':>12} {'cache':>6} {'us/req':>9}")
+    for name, bench in (("decode", lambda: bench_decode(tokens, args.iterations)),
+                        ("dependency", lambda: bench_dependency(tokens, args.iterations, db))):
+        for cache_size in (0, 10000):
+            auth.verified_tokens = VerifiedTokenCache(cache_size)
+            per_request = bench()
+            print(f"{name:>12} {'on' if cache_size else 'off':>6} {per_request * 1e6:>9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""세션 혼합 시나리오에서 인증 CPU 비교 - 매번 로그인 vs 리프레시 토큰 회전
+
+사용법 (backend 디렉터리에서):
+    python benchmarks/auth_session_mix.py [--sessions 50] [--hours 8] [--rounds 12]
+
+액세스 토큰 만료(ACCESS_TOKEN_EXPIRE_MINUTES)마다 세션이 토큰을 다시 얻는 하루 사용 패턴을
+재현하고, 인증에 쓴 프로세스 CPU 시간(process_time)을 잰다.
+- login: 만료될 때마다 비밀번호로 다시 로그인 (bcrypt 검증 + 토큰 발급)
+- refresh: 처음 한 번 로그인 후 만료될 때마다 /teams/token/refresh (해시 조회 + 회전)
+--rounds는 운영에 가까운 bcrypt 비용 (테스트 설정은 4)
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ["MYFC_RATE_LIMIT_ENABLED"] = "0"
+
+from passlib.context import CryptContext
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import auth
+from app.database import Base
+from app.models import Team
+from app.schemas import TeamCreate
+from app.services.team_service import TeamService
+from app.services.token_service import TokenService
+
+PASSWORD = "bench-password"
+
+def setup(path: str, sessions: int, rounds: int):
+    auth._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    hashed = auth.get_password_hash(PASSWORD)
+    db.add_all(Team(name=f"벤치 FC {i}", description="", type="AMATEUR", password=hashed) for i in range(sessions))
+    db.commit()
+    return engine, db
+
+def run_login(db, sessions: int, renewals: int) -> int:
+    service = TeamService(db)
+    credentials = [TeamCreate(name=f"벤치 FC {i}", description="", type="AMATEUR", password=PASSWORD)
+                   for i in range(sessions)]
+
+    async def run():
+        for _ in range(renewals + 1):
+            for team in credentials:
+                await service.login_team(team)
+
+    asyncio.run(run())
+    return sessions * (renewals + 1)
+
+def run_refresh(db, sessions: int, renewals: int) -> int:
+    team_service = TeamService(db)
+    token_service = TokenService(db)
+
+    async def login_all():
+        return [await team_service.login_team(
+                    TeamCreate(name=f"벤치 FC {i}", description="", type="AMATEUR", password=PASSWORD))
+                for i in range(sessions)]
+
+    tokens = asyncio.run(login_all())
+    for _ in range(renewals):
+        tokens = [token_service.refresh(t["refresh_token"]) for t in tokens]
+    return sessions * (renewals + 1)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--hours", type=float, default=8)
+    parser.add_argument("--rounds", type=int, default=12)
+    args = parser.parse_args()
+    renewals = max(0, int(args.hours * 60 / auth.ACCESS_TOKEN_EXPIRE_MINUTES) - 1)
+
+    print(f"sessions={args.sessions} hours={args.hours} renewals/session={renewals} bcrypt rounds={args.rounds}")
+    print(f"{'flow':>8} {'tokens':>7} {'cpu s':>8} {'ms/token':>9}")
+    for name, flow in (("login", run_login), ("refresh", run_refresh)):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine, db = setup(os.path.join(tmp, "bench.db"), args.sessions, args.rounds)
+            start = time.process_time()
+            issued = flow(db, args.sessions, renewals)
+            elapsed = time.process_time() - start
+            db.close()
+            engine.dispose()
+        print(f"{name:>8} {issued:>7} {elapsed:>8.2f} {elapsed / issued * 1e3:>9.2f}")
+
+if __name__ == "__main__":
+    main()
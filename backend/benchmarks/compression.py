@@ -0,0 +1,77 @@
+"""응답 압축 효과 측정 - 전송 바이트와 요청당 CPU 시간
+
+사용법 (backend 디렉터리에서):
+    python benchmarks/compression.py [--requests 200] [--matches 60]
+
+임시 SQLite DB에 시드 데이터를 만들고 앱을 프로세스 안에서(ASGI 전송) 호출한다.
+인코딩(identity / gzip / br*)별로 경기 목록과 분석 API 응답의
+- wire: 전송되는 본문 바이트 (Content-Length)
+- cpu/req: 요청당 프로세스 CPU 시간 (직렬화 + 압축 포함)
+을 출력한다. 분석 API는 캐시에 미리 압축된 본문이 저장되므로 반복 요청에서 압축 비용이 없다.
+(* br은 brotli 패키지가 설치된 경우에만)
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from worker_scaling import seed
+
+PATHS = [
+    "/matches/team/1",
+    "/analytics/team/1/overview",
+    "/analytics/team/1/player-contributions",
+    "/analytics/team/1/opponents",
+    "/analytics/team/1/rolling-form?size=5",
+]
+
+async def measure(client, path: str, token: str, encoding: str, requests: int):
+    headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": encoding}
+    # 첫 요청(캐시 채우기)은 제외
+    response = await client.get(path, headers=headers)
+    response.raise_for_status()
+    wire = int(response.headers.get("content-length", len(response.content)))
+    start = time.process_time()
+    for _ in range(requests):
+        response = await client.get(path, headers=headers)
+        response.raise_for_status()
+    cpu = (time.process_time() - start) / requests
+    return wire, len(response.content), cpu
+
+async def run(token: str, requests: int) -> None:
+    import httpx
+    from app.main import app
+    from app.utils.compression import SUPPORTED_ENCODINGS
+
+    encodings = ["identity"] + list(reversed(SUPPORTED_ENCODINGS))
+    print(f"{'path':<42} {'encoding':>8} {'json':>9} {'wire':>9} {'ratio':>6} {'cpu/req':>9}")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for path in PATHS:
+            for encoding in encodings:
+                wire, decoded, cpu = await measure(client, path, token, encoding, requests)
+                print(f"{path:<42} {encoding:>8} {decoded:>9} {wire:>9} {wire / decoded:>6.2f} {cpu * 1000:>7.3f}ms")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--matches", type=int, default=60)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="myfc-compression-bench-")
+    os.environ["MYFC_DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+    # 단일 토큰으로 최대 처리량을 재므로 팀별 요청 제한은 끔
+    os.environ["MYFC_RATE_LIMIT_ENABLED"] = "0"
+    try:
+        token = seed(team_count=2, matches_per_team=args.matches)
+        asyncio.run(run(token, args.requests))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
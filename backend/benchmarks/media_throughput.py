@@ -0,0 +1,125 @@
+"""/uploads 미디어 라우트의 동시 다운로드 처리량 측정
+
+사용법 (backend 디렉터리에서):
+    python benchmarks/media_throughput.py [--workers 1] [--clients 16] [--duration 5] [--size-kb 1024] [--storage local]
+
+임시 업로드 디렉터리에 내용 기반 이름의 파일을 만든 뒤 `python -m app.manage serve`로 서버를 띄우고,
+클라이언트 프로세스들이 keep-alive 연결로 시나리오별 요청을 반복한다.
+- full: 파일 전체 다운로드
+- range: 64KB 임의 구간 (Range, 206)
+- revalidate: If-None-Match 재검증 (304, 본문 없음)
+- gzip: 미리 압축된 .gz 변형 (Accept-Encoding: gzip)
+서버가 http.response.zerocopysend 확장을 지원하면 본문은 sendfile로 전송된다 (현재 uvicorn은 미지원 → 청크 스트리밍).
+"""
+import argparse
+import asyncio
+import http.client
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from worker_scaling import free_port, wait_for_port
+
+RANGE_SIZE = 64 * 1024
+
+def seed(size: int) -> str:
+    """압축 가능한 파일 하나를 저장하고 .gz 변형까지 만든 뒤 URL 반환 (app 모듈은 업로드 경로 설정 후 임포트)"""
+    from app.utils.media import precompress
+    from app.utils.storage import get_storage
+
+    rng = random.Random(0)
+    # 절반은 반복 패턴 - gzip 변형이 의미 있는 크기로 줄어들도록
+    data = bytes(rng.getrandbits(8) for _ in range(size // 2)) + b"myfc" * (size // 8)
+    name = "1_image_00000000deadbeef.png"
+
+    async def run():
+        storage = get_storage()
+        await storage.save(name, data, "image/png")
+        await precompress(storage, name)
+        storage.shutdown()
+
+    asyncio.run(run())
+    return f"/uploads/{name}"
+
+def client_loop(port: int, path: str, scenario: str, size: int, duration: float, seed_value: int):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    rng = random.Random(seed_value)
+    etag = None
+    if scenario == "revalidate":
+        conn.request("HEAD", path)
+        response = conn.getresponse()
+        response.read()
+        etag = response.getheader("ETag")
+    expected = {"full": 200, "range": 206, "revalidate": 304, "gzip": 200}[scenario]
+    deadline = time.perf_counter() + duration
+    count = transferred = 0
+    while time.perf_counter() < deadline:
+        headers = {}
+        if scenario == "range":
+            start = rng.randrange(0, size - RANGE_SIZE)
+            headers["Range"] = f"bytes={start}-{start + RANGE_SIZE - 1}"
+        elif scenario == "revalidate":
+            headers["If-None-Match"] = etag
+        elif scenario == "gzip":
+            headers["Accept-Encoding"] = "gzip"
+        conn.request("GET", path, headers=headers)
+        response = conn.getresponse()
+        body = response.read()
+        if response.status != expected:
+            raise RuntimeError(f"{scenario} -> {response.status}")
+        count += 1
+        transferred += len(body)
+    conn.close()
+    return count, transferred
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--size-kb", type=int, default=1024)
+    parser.add_argument("--storage", choices=["local", "object"], default="local")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="myfc-media-bench-")
+    os.environ["MYFC_DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+    os.environ["MYFC_UPLOAD_DIR"] = os.path.join(tmp_dir, "uploads")
+    os.environ["MYFC_STORAGE_BACKEND"] = args.storage
+    size = args.size_kb * 1024
+    path = seed(size)
+
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.manage", "serve", "--workers", str(args.workers), "--port", str(port)],
+        cwd=BACKEND_DIR, env=os.environ.copy(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_port(port)
+        client_loop(port, path, "full", size, 0.5, 0)
+        print(f"{'scenario':>10} {'req/s':>10} {'MB/s':>10}")
+        for scenario in ("full", "range", "revalidate", "gzip"):
+            with ProcessPoolExecutor(max_workers=args.clients) as pool:
+                start = time.perf_counter()
+                results = list(pool.map(
+                    client_loop, [port] * args.clients, [path] * args.clients, [scenario] * args.clients,
+                    [size] * args.clients, [args.duration] * args.clients, range(args.clients)
+                ))
+                elapsed = time.perf_counter() - start
+            requests = sum(count for count, _ in results)
+            transferred = sum(total for _, total in results)
+            print(f"{scenario:>10} {requests / elapsed:>10.1f} {transferred / elapsed / 1024 / 1024:>10.1f}")
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""JSON vs MessagePack 응답 비교 - 인코딩 CPU, 본문 크기, 클라이언트 디코딩 시간
+
+사용법 (backend 디렉터리에서):
+    python benchmarks/msgpack_payloads.py [--requests 200] [--matches 60]
+
+임시 SQLite DB에 시드 데이터를 만들고 앱을 프로세스 안에서(ASGI 전송) 호출한다.
+경기 목록(/matches/team/{id})과 경기 상세(/matches/{id}/detail)에 대해 형식별로
+- encode: 같은 내용(jsonable 값)의 직렬화 시간 (JSONResponse.render vs msgpack)
+- cpu/req: 요청당 프로세스 CPU 시간 (조회 + 직렬화 포함)
+- raw / gzip: 본문 바이트와 gzip 압축 후 바이트
+- decode: 클라이언트 디코딩 시간 (json.loads vs msgpack.unpackb, compact는 키 복원 포함)
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from worker_scaling import seed
+
+PATHS = ["/matches/team/1", "/matches/1/detail"]
+FORMATS = [
+    ("json", "application/json"),
+    ("msgpack", "application/msgpack"),
+    ("compact", "application/msgpack; keys=compact"),
+]
+
+def per_call(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+async def run(token: str, requests: int) -> None:
+    import httpx
+    import msgpack
+    from fastapi.responses import JSONResponse
+    from app.main import app
+    from app.utils.content_negotiation import MSGPACK, MSGPACK_COMPACT, expand_keys, pack
+
+    encoders = {
+        "json": lambda content: JSONResponse(content).body,
+        "msgpack": lambda content: pack(content, MSGPACK),
+        "compact": lambda content: pack(content, MSGPACK_COMPACT),
+    }
+    decoders = {
+        "json": json.loads,
+        "msgpack": msgpack.unpackb,
+        "compact": lambda body: expand_keys(msgpack.unpackb(body)),
+    }
+
+    print(f"{'path':<18} {'format':>8} {'encode':>9} {'cpu/req':>9} {'raw':>8} {'gzip':>7} {'decode':>9}")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for path in PATHS:
+            content = None
+            for name, accept in FORMATS:
+                headers = {"Authorization": f"Bearer {token}", "Accept": accept, "Accept-Encoding": "identity"}
+                response = await client.get(path, headers=headers)
+                response.raise_for_status()
+                body = response.content
+                if content is None:
+                    content = json.loads(body)
+                assert decoders[name](body) == content
+
+                start = time.process_time()
+                for _ in range(requests):
+                    await client.get(path, headers=headers)
+                cpu = (time.process_time() - start) / requests
+                encode = per_call(lambda: encoders[name](content), requests)
+                decode = per_call(lambda: decoders[name](body), requests)
+                print(f"{path:<18} {name:>8} {encode * 1e6:>7.0f}us {cpu * 1000:>7.2f}ms "
+                      f"{len(body):>8} {len(gzip.compress(body, 6)):>7} {decode * 1e6:>7.0f}us")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--matches", type=int, default=60)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="myfc-msgpack-bench-")
+    os.environ["MYFC_DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+    # 단일 토큰으로 최대 처리량을 재므로 팀별 요청 제한은 끔
+    os.environ["MYFC_RATE_LIMIT_ENABLED"] = "0"
+    try:
+        token = seed(team_count=2, matches_per_team=args.matches)
+        asyncio.run(run(token, args.requests))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
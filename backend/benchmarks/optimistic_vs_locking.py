@@ -0,0 +1,118 @@
+"""낙관적 동시성 제어(version_id) vs 쓰기 잠금 직렬화 처리량 비교
+
+사용법 (backend 디렉터리에서):
+    python benchmarks/optimistic_vs_locking.py [--writers 8] [--ops 50] [--players 50] [--think-ms 2]
+
+각 작업은 선수 한 명을 읽고, 검증/계산(think time) 후 goal_count를 1 증가시킨다.
+- locking: BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡고 읽기~쓰기 전체를 직렬화
+- optimistic: 잠금 없이 읽고 계산한 뒤 PlayerService가 version_id 조건으로 쓰기, 409면 재시도
+두 방식 모두 유실된 갱신이 없는지(최종 합계 = 작업 수) 함께 확인한다.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, configure_sqlite
+from app.models import Team, Player
+from app.schemas import PlayerUpdate
+from app.services.player_service import PlayerService
+
+def make_engine(path: str, immediate: bool):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 60})
+    configure_sqlite(engine)
+    if immediate:
+        # pysqlite의 암묵적 BEGIN 대신 BEGIN IMMEDIATE로 트랜잭션 시작 시 쓰기 잠금 획득
+        @event.listens_for(engine, "connect")
+        def disable_implicit_begin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def begin_immediate(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+    return engine
+
+def seed(path: str, players: int) -> None:
+    engine = make_engine(path, immediate=False)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    team = Team(name="벤치 FC", description="", type="AMATEUR")
+    db.add(team)
+    db.flush()
+    db.add_all(Player(name=f"선수 {i}", number=i, position="FW", team_id=team.id, goal_count=0) for i in range(players))
+    db.commit()
+    db.close()
+    engine.dispose()
+
+def run(path: str, mode: str, writers: int, ops: int, players: int, think: float):
+    engine = make_engine(path, immediate=(mode == "locking"))
+    Session = sessionmaker(bind=engine, autoflush=False)
+    retries = [0]
+    lock = threading.Lock()
+
+    def writer(seed_value: int):
+        rng = random.Random(seed_value)
+        for _ in range(ops):
+            player_id = rng.randint(1, players)
+            while True:
+                db = Session()
+                try:
+                    team = db.get(Team, 1)
+                    player = db.get(Player, player_id)
+                    time.sleep(think)
+                    expected = player.version_id if mode == "optimistic" else None
+                    PlayerService(db).update_player_stats(
+                        player_id, PlayerUpdate(goal_count=player.goal_count + 1), team, expected_version=expected
+                    )
+                    break
+                except HTTPException as exc:
+                    if exc.status_code != 409:
+                        raise
+                    with lock:
+                        retries[0] += 1
+                finally:
+                    db.close()
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    with engine.connect() as conn:
+        total = conn.execute(text("SELECT sum(goal_count) FROM players")).scalar()
+    engine.dispose()
+    return elapsed, retries[0], total
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=50)
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--think-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    expected_total = args.writers * args.ops
+    print(f"{'mode':>10} {'ops/s':>8} {'retries':>8} {'lost':>5}")
+    for mode in ("locking", "optimistic"):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "bench.db")
+            seed(path, args.players)
+            elapsed, retries, total = run(path, mode, args.writers, args.ops, args.players, args.think_ms / 1000)
+        print(f"{mode:>10} {expected_total / elapsed:>8.1f} {retries:>8} {expected_total - total:>5}")
+
+if __name__ == "__main__":
+    main()
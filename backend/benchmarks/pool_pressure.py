@@ -0,0 +1,113 @@
+"""연결 풀 부하 비교 - 요청마다 세션/인증 조회 vs 지연 세션 + 인증 팀 캐시
+
+사용법 (backend 디렉터리에서):
+    python benchmarks/pool_pressure.py [--requests 400] [--concurrency 10]
+
+임시 SQLite DB에 시드 데이터를 만들고 앱을 프로세스 안에서(ASGI 전송) 동시 호출하며
+엔진 풀의 checkout 이벤트를 센다.
+- eager: 이전 방식 (요청마다 SessionLocal() 생성, 인증 때마다 팀 조회)
+- lazy: get_db의 지연 세션 + MYFC_AUTH_TEAM_CACHE_TTL 인증 팀 캐시
+경로별로 요청당 checkout 수, 동시에 빌린 연결 최대치(peak), 처리량을 출력한다.
+캐시된 분석 응답과 권한 거절(403)은 lazy에서 연결을 빌리지 않아야 한다.
+(eager에서 동시 요청 수가 풀 크기 + overflow를 넘으면 이벤트 루프에서 도는 인증 조회가
+ 연결을 기다리며 루프를 막아 풀 타임아웃까지 멈출 수 있으므로 --concurrency는 그보다 작게)
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from worker_scaling import seed
+
+PATHS = [
+    ("cached analytics", "/analytics/team/1/overview"),
+    ("forbidden (403)", "/analytics/team/2/overview"),
+    ("match list", "/matches/team/1"),
+]
+
+class PoolCounter:
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self.pool = engine.pool
+        self.checkouts = 0
+        self.peak = 0
+        event.listen(engine, "checkout", self.on_checkout)
+
+    def on_checkout(self, *args):
+        self.checkouts += 1
+        self.peak = max(self.peak, self.pool.checkedout())
+
+    def reset(self):
+        self.checkouts = 0
+        self.peak = 0
+
+def eager_db():
+    from app.database import SessionLocal
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def measure(client, path: str, token: str, requests: int, concurrency: int) -> float:
+    headers = {"Authorization": f"Bearer {token}"}
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            await client.get(path, headers=headers)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+async def run(token: str, requests: int, concurrency: int) -> None:
+    import httpx
+    from app import auth
+    from app.database import engine, get_db
+    from app.main import app
+
+    counter = PoolCounter(engine)
+    print(f"pool size={engine.pool.size()} requests={requests} concurrency={concurrency}")
+    print(f"{'path':<18} {'mode':>6} {'checkouts/req':>14} {'peak':>5} {'req/s':>8}")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for name, path in PATHS:
+            for mode in ("eager", "lazy"):
+                if mode == "eager":
+                    app.dependency_overrides[get_db] = eager_db
+                    auth.config.AUTH_TEAM_CACHE_TTL = 0
+                else:
+                    app.dependency_overrides.clear()
+                    auth.config.AUTH_TEAM_CACHE_TTL = 30
+                # 캐시 채우기(분석 응답, 인증 팀)는 측정에서 제외
+                await client.get(path, headers={"Authorization": f"Bearer {token}"})
+                counter.reset()
+                elapsed = await measure(client, path, token, requests, concurrency)
+                print(f"{name:<18} {mode:>6} {counter.checkouts / requests:>14.2f} {counter.peak:>5} "
+                      f"{requests / elapsed:>8.0f}")
+    app.dependency_overrides.clear()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="myfc-pool-bench-")
+    os.environ["MYFC_DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+    # 단일 토큰으로 동시 요청을 보내므로 팀별 요청 제한은 끔
+    os.environ["MYFC_RATE_LIMIT_ENABLED"] = "0"
+    try:
+        token = seed(team_count=2, matches_per_team=60)
+        asyncio.run(run(token, args.requests, args.concurrency))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""콜드 스타트 임포트 시간 프로파일
+
+사용법 (backend 디렉터리에서):
+    python benchmarks/startup_profile.py [--top 20] [--module app.main]
+
+새 인터프리터에서 `python -X importtime -c "import app.main"`을 실행하고
+누적 시간이 큰 모듈 순으로 출력한다. DB 파일이 생기지 않도록 임시 DB URL을 사용한다.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_importtime(module: str):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env = dict(os.environ, MYFC_DATABASE_URL=f"sqlite:///{os.path.join(tmp_dir, 'startup.db')}")
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+        )
+        wall = time.perf_counter() - start
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        entries.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return wall, entries
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    wall, entries = run_importtime(args.module)
+    print(f"{args.module}: wall {wall * 1000:.0f} ms (인터프리터 기동 포함), 모듈 {len(entries)}개")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative_us, self_us, name in sorted(entries, reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name.strip()} (depth {len(name) - len(name.lstrip()) - 1 >> 1})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""워커 수(1 → N)에 따른 읽기 위주 API 처리량 측정
+
+사용법 (backend 디렉터리에서):
+    python benchmarks/worker_scaling.py [--workers 1,2,4] [--clients 16] [--duration 5]
+
+임시 SQLite DB(WAL)에 시드 데이터를 만든 뒤 `python -m app.manage serve --workers N`으로
+서버를 띄우고, 클라이언트 프로세스들이 keep-alive 연결로 읽기 라우트를 반복 호출한다.
+코어 수가 워커 수 + 클라이언트 부하를 감당할 수 있어야 선형에 가까운 결과가 나온다.
+"""
+import argparse
+import http.client
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def seed(team_count: int = 20, players_per_team: int = 20, matches_per_team: int = 60) -> str:
+    """시드 데이터 생성 후 첫 팀의 액세스 토큰 반환 (app 모듈은 DB URL 설정 후 임포트)"""
+    sys.path.insert(0, BACKEND_DIR)
+    from datetime import datetime, timedelta
+    from app.database import SessionLocal, init_db
+    from app.models import Team, Player, Match, Goal
+    from app.auth import create_access_token, get_password_hash
+
+    init_db()
+    db = SessionLocal()
+    password = get_password_hash("benchmark")
+    for t in range(team_count):
+        team = Team(name=f"벤치 FC {t}", description=f"벤치마크 팀 {t}", type="AMATEUR", password=password)
+        db.add(team)
+        db.flush()
+        players = [Player(name=f"선수 {t}-{p}", number=p + 1, position="FW", team_id=team.id) for p in range(players_per_team)]
+        db.add_all(players)
+        db.flush()
+        for m in range(matches_per_team):
+            our, opp = m % 4, (m * 7) % 3
+            match = Match(
+                date=datetime(2024, 1, 1) + timedelta(days=m), opponent=f"상대 {m % 10}",
+                score=f"{our}:{opp}", team_id=team.id, players=players[:11]
+            )
+            db.add(match)
+            db.flush()
+            for g in range(our):
+                db.add(Goal(match_id=match.id, quarter=g % 4 + 1, player_id=players[g].id, assist_player_id=players[g + 1].id))
+    db.commit()
+    db.close()
+    return create_access_token({"sub": "1"})
+
+def client_loop(port: int, paths, token: str, duration: float) -> int:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    headers = {"Authorization": f"Bearer {token}"}
+    deadline = time.perf_counter() + duration
+    count = 0
+    while time.perf_counter() < deadline:
+        conn.request("GET", paths[count % len(paths)], headers=headers)
+        response = conn.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"{paths[count % len(paths)]} -> {response.status}")
+        count += 1
+    conn.close()
+    return count
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", default=f"1,2,{min(os.cpu_count() or 1, 4)}")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="myfc-bench-")
+    os.environ["MYFC_DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+    os.environ["MYFC_EVENT_BUS_PATH"] = os.path.join(tmp_dir, "bus.db")
+    # 단일 토큰으로 최대 처리량을 재므로 팀별 요청 제한은 끔
+    os.environ["MYFC_RATE_LIMIT_ENABLED"] = "0"
+    token = seed()
+    paths = [
+        "/analytics/team/1/overview",
+        "/analytics/team/1/player-contributions?last_n=20",
+        "/players/team/1",
+        "/matches/team/1/recent",
+        "/search/teams?q=%EB%B2%A4%EC%B9%98",
+    ]
+
+    try:
+        run_all(args, paths, token)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def run_all(args, paths, token: str) -> None:
+    baseline = None
+    print(f"{'workers':>7} {'req/s':>10} {'speedup':>8}")
+    for workers in sorted({int(value) for value in args.workers.split(",")}):
+        port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "app.manage", "serve", "--workers", str(workers), "--port", str(port)],
+            cwd=BACKEND_DIR, env=os.environ.copy(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            wait_for_port(port)
+            # 워커별 캐시/커넥션 워밍업
+            client_loop(port, paths, token, 1.0)
+            with ProcessPoolExecutor(max_workers=args.clients) as pool:
+                start = time.perf_counter()
+                counts = list(pool.map(
+                    client_loop, [port] * args.clients, [paths] * args.clients,
+                    [token] * args.clients, [args.duration] * args.clients
+                ))
+                elapsed = time.perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+        throughput = sum(counts) / elapsed
+        baseline = baseline or throughput
+        print(f"{workers:>7} {throughput:>10.1f} {throughput / baseline:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
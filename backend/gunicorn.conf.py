@@ -0,0 +1,21 @@
+"""gunicorn 다중 워커 설정
+
+사용법 (backend 디렉터리에서):
+    gunicorn app.main:app -c gunicorn.conf.py
+    MYFC_WORKERS=4 gunicorn app.main:app -c gunicorn.conf.py
+
+워커 간 상태는 SQLite 이벤트 버스(MYFC_EVENT_BUS_PATH)로 공유하고,
+DB는 WAL 모드로 열려 읽기 워커가 쓰기를 막지 않는다.
+"""
+import multiprocessing
+import os
+
+workers = int(os.getenv("MYFC_WORKERS", str(min(multiprocessing.cpu_count(), 4))))
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = os.getenv("MYFC_BIND", "0.0.0.0:8000")
+timeout = int(os.getenv("MYFC_WORKER_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+
+# 워커 프로세스가 app.config를 읽을 때 다중 워커 모드(이벤트 버스 사용)로 인식하도록
+os.environ["MYFC_WORKERS"] = str(workers)
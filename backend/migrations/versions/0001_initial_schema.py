@@ -0,0 +1,119 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'teams',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('type', sa.String(), nullable=True),
+        sa.Column('password', sa.String(), nullable=True),
+        sa.Column('logo_url', sa.String(), nullable=True),
+        sa.Column('image_url', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_teams_id', 'teams', ['id'], unique=False)
+    op.create_index('ix_teams_name', 'teams', ['name'], unique=True)
+    op.create_table(
+        'players',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=True),
+        sa.Column('number', sa.Integer(), nullable=True),
+        sa.Column('position', sa.String(), nullable=True),
+        sa.Column('team_id', sa.Integer(), nullable=True),
+        sa.Column('goal_count', sa.Integer(), nullable=True),
+        sa.Column('assist_count', sa.Integer(), nullable=True),
+        sa.Column('mom_count', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_players_id', 'players', ['id'], unique=False)
+    op.create_index('ix_players_name', 'players', ['name'], unique=False)
+    op.create_table(
+        'matches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('opponent', sa.String(), nullable=True),
+        sa.Column('score', sa.String(), nullable=True),
+        sa.Column('team_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_matches_id', 'matches', ['id'], unique=False)
+    op.create_table(
+        'match_player',
+        sa.Column('match_id', sa.Integer(), nullable=True),
+        sa.Column('player_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['match_id'], ['matches.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['player_id'], ['players.id'], ondelete='SET NULL')
+    )
+    op.create_table(
+        'goals',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('match_id', sa.Integer(), nullable=True),
+        sa.Column('player_id', sa.Integer(), nullable=True),
+        sa.Column('assist_player_id', sa.Integer(), nullable=True),
+        sa.Column('quarter', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('scorer_name', sa.String(), nullable=True),
+        sa.Column('assist_name', sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(['assist_player_id'], ['players.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['match_id'], ['matches.id']),
+        sa.ForeignKeyConstraint(['player_id'], ['players.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_goals_id', 'goals', ['id'], unique=False)
+    op.create_table(
+        'quarter_scores',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('match_id', sa.Integer(), nullable=True),
+        sa.Column('quarter', sa.Integer(), nullable=True),
+        sa.Column('our_score', sa.Integer(), nullable=True),
+        sa.Column('opponent_score', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['match_id'], ['matches.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_quarter_scores_id', 'quarter_scores', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quarter_scores_id', table_name='quarter_scores')
+    op.drop_table('quarter_scores')
+    op.drop_index('ix_goals_id', table_name='goals')
+    op.drop_table('goals')
+    op.drop_table('match_player')
+    op.drop_index('ix_matches_id', table_name='matches')
+    op.drop_table('matches')
+    op.drop_index('ix_players_name', table_name='players')
+    op.drop_index('ix_players_id', table_name='players')
+    op.drop_table('players')
+    op.drop_index('ix_teams_name', table_name='teams')
+    op.drop_index('ix_teams_id', table_name='teams')
+    op.drop_table('teams')
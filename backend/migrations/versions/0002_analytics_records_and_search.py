@@ -0,0 +1,159 @@
+"""analytics records and search index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models import SEARCH_INDEX_TABLE_DDL, SEARCH_INDEX_TRIGGERS, SEARCH_INDEX_BACKFILL
+from app.utils.match_utils import parse_score, get_match_result, normalize_opponent
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('opponent_records',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=True),
+    sa.Column('opponent_key', sa.String(), nullable=True),
+    sa.Column('opponent', sa.String(), nullable=True),
+    sa.Column('matches', sa.Integer(), nullable=True),
+    sa.Column('wins', sa.Integer(), nullable=True),
+    sa.Column('draws', sa.Integer(), nullable=True),
+    sa.Column('losses', sa.Integer(), nullable=True),
+    sa.Column('goals_for', sa.Integer(), nullable=True),
+    sa.Column('goals_against', sa.Integer(), nullable=True),
+    sa.Column('recent_form', sa.String(), nullable=True),
+    sa.Column('last_match_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('opponent_records', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_opponent_records_id'), ['id'], unique=False)
+        batch_op.create_index('ix_opponent_records_team_id_opponent_key', ['team_id', 'opponent_key'], unique=True)
+
+    op.create_table('team_records',
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('matches', sa.Integer(), nullable=True),
+    sa.Column('wins', sa.Integer(), nullable=True),
+    sa.Column('draws', sa.Integer(), nullable=True),
+    sa.Column('losses', sa.Integer(), nullable=True),
+    sa.Column('goals_for', sa.Integer(), nullable=True),
+    sa.Column('goals_against', sa.Integer(), nullable=True),
+    sa.Column('win_rate', sa.Float(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ),
+    sa.PrimaryKeyConstraint('team_id')
+    )
+    with op.batch_alter_table('team_records', schema=None) as batch_op:
+        batch_op.create_index('ix_team_records_win_rate', [sa.text('win_rate DESC'), sa.text('matches DESC'), 'team_id'], unique=False)
+
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('opponent_key', sa.String(), nullable=True))
+        batch_op.create_index('ix_matches_team_id_date', ['team_id', 'date'], unique=False)
+        batch_op.create_index('ix_matches_team_id_opponent_key', ['team_id', 'opponent_key'], unique=False)
+
+    with op.batch_alter_table('players', schema=None) as batch_op:
+        batch_op.create_index('ix_players_assist_count', [sa.text('assist_count DESC'), 'id'], unique=False)
+        batch_op.create_index('ix_players_goal_count', [sa.text('goal_count DESC'), 'id'], unique=False)
+        batch_op.create_index('ix_players_mom_count', [sa.text('mom_count DESC'), 'id'], unique=False)
+
+    with op.batch_alter_table('teams', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_teams_type'), ['type'], unique=False)
+
+    backfill_records()
+
+    for statement in [SEARCH_INDEX_TABLE_DDL] + SEARCH_INDEX_BACKFILL + SEARCH_INDEX_TRIGGERS:
+        op.execute(statement)
+
+
+def backfill_records() -> None:
+    """기존 경기의 opponent_key와 상대/통산 전적 채우기 (MatchService.rebuild_opponent_records와 같은 규칙)"""
+    bind = op.get_bind()
+    matches = bind.execute(sa.text(
+        "SELECT id, team_id, opponent, score, date FROM matches ORDER BY team_id, date, id"
+    )).all()
+
+    opponents = {}
+    teams = {}
+    for match_id, team_id, opponent, score, date in matches:
+        key = normalize_opponent(opponent)
+        bind.execute(sa.text("UPDATE matches SET opponent_key = :key WHERE id = :id"), {"key": key, "id": match_id})
+        our_score, opponent_score = parse_score(score)
+        result = get_match_result(our_score, opponent_score)
+        for record in (
+            opponents.setdefault((team_id, key), {"opponent": opponent, "form": "", "date": None, "counts": [0] * 6}),
+            teams.setdefault(team_id, {"counts": [0] * 6}),
+        ):
+            counts = record["counts"]
+            counts[0] += 1
+            counts[1] += result == 'WIN'
+            counts[2] += result == 'DRAW'
+            counts[3] += result == 'LOSE'
+            counts[4] += our_score
+            counts[5] += opponent_score
+        record = opponents[(team_id, key)]
+        record["opponent"] = opponent
+        record["form"] = (result[0] + record["form"])[:5]
+        record["date"] = date
+
+    for (team_id, key), record in opponents.items():
+        matches_count, wins, draws, losses, goals_for, goals_against = record["counts"]
+        bind.execute(sa.text(
+            "INSERT INTO opponent_records (team_id, opponent_key, opponent, matches, wins, draws, losses, "
+            "goals_for, goals_against, recent_form, last_match_date) "
+            "VALUES (:team_id, :key, :opponent, :matches, :wins, :draws, :losses, :goals_for, :goals_against, :form, :date)"
+        ), {
+            "team_id": team_id, "key": key, "opponent": record["opponent"], "matches": matches_count,
+            "wins": wins, "draws": draws, "losses": losses, "goals_for": goals_for,
+            "goals_against": goals_against, "form": record["form"], "date": record["date"],
+        })
+    for team_id, record in teams.items():
+        matches_count, wins, draws, losses, goals_for, goals_against = record["counts"]
+        bind.execute(sa.text(
+            "INSERT INTO team_records (team_id, matches, wins, draws, losses, goals_for, goals_against, win_rate) "
+            "VALUES (:team_id, :matches, :wins, :draws, :losses, :goals_for, :goals_against, :win_rate)"
+        ), {
+            "team_id": team_id, "matches": matches_count, "wins": wins, "draws": draws, "losses": losses,
+            "goals_for": goals_for, "goals_against": goals_against, "win_rate": wins / matches_count,
+        })
+
+
+def downgrade() -> None:
+    for table in ('teams', 'players', 'opponent_records'):
+        for action in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_search_{action}")
+    op.execute("DROP TABLE IF EXISTS search_index")
+    with op.batch_alter_table('teams', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_teams_type'))
+
+    with op.batch_alter_table('players', schema=None) as batch_op:
+        batch_op.drop_index('ix_players_mom_count')
+        batch_op.drop_index('ix_players_goal_count')
+        batch_op.drop_index('ix_players_assist_count')
+
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.drop_index('ix_matches_team_id_opponent_key')
+        batch_op.drop_index('ix_matches_team_id_date')
+        batch_op.drop_column('opponent_key')
+
+    with op.batch_alter_table('team_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_team_records_win_rate')
+
+    op.drop_table('team_records')
+    with op.batch_alter_table('opponent_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_opponent_records_team_id_opponent_key')
+        batch_op.drop_index(batch_op.f('ix_opponent_records_id'))
+
+    op.drop_table('opponent_records')
@@ -0,0 +1,31 @@
+"""row versions
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:03
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 낙관적 동시성 제어용 행 버전 (기존 행은 1부터 시작)
+    for table in ('teams', 'players', 'matches'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('version_id', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    # batch 모드의 테이블 재생성은 검색 인덱스 트리거를 지우므로 SQLite(3.35+) 기본 DROP COLUMN 사용
+    for table in ('matches', 'players', 'teams'):
+        op.execute(f"ALTER TABLE {table} DROP COLUMN version_id")
@@ -0,0 +1,56 @@
+"""hot path indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:04
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 팀/경기 단위 조회의 외래 키 컬럼 인덱스 (tests/test_query_plans.py가 풀 스캔 회귀를 검사)
+    with op.batch_alter_table('goals', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_goals_assist_player_id'), ['assist_player_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_goals_match_id'), ['match_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_goals_player_id'), ['player_id'], unique=False)
+
+    with op.batch_alter_table('match_player', schema=None) as batch_op:
+        batch_op.create_index('ix_match_player_match_id_player_id', ['match_id', 'player_id'], unique=False)
+        batch_op.create_index('ix_match_player_player_id', ['player_id'], unique=False)
+
+    with op.batch_alter_table('players', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_players_team_id'), ['team_id'], unique=False)
+
+    with op.batch_alter_table('quarter_scores', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_quarter_scores_match_id'), ['match_id'], unique=False)
+
+    # 새 인덱스 기준으로 플래너 통계 갱신
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('quarter_scores', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_quarter_scores_match_id'))
+
+    with op.batch_alter_table('players', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_players_team_id'))
+
+    with op.batch_alter_table('match_player', schema=None) as batch_op:
+        batch_op.drop_index('ix_match_player_player_id')
+        batch_op.drop_index('ix_match_player_match_id_player_id')
+
+    with op.batch_alter_table('goals', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_goals_player_id'))
+        batch_op.drop_index(batch_op.f('ix_goals_match_id'))
+        batch_op.drop_index(batch_op.f('ix_goals_assist_player_id'))
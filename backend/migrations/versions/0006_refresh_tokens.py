@@ -0,0 +1,49 @@
+"""refresh tokens
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 00:00:05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'refresh_tokens',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('family_id', sa.String(length=32), nullable=False),
+        sa.Column('token_hash', sa.LargeBinary(length=32), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('used_at', sa.DateTime(), nullable=True),
+        sa.Column('revoked_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('refresh_tokens', schema=None) as batch_op:
+        batch_op.create_index('ix_refresh_tokens_expires_at', ['expires_at'], unique=False)
+        batch_op.create_index('ix_refresh_tokens_family_id', ['family_id'], unique=False)
+        batch_op.create_index('ix_refresh_tokens_team_id', ['team_id'], unique=False)
+        batch_op.create_index('ix_refresh_tokens_token_hash', ['token_hash'], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('refresh_tokens', schema=None) as batch_op:
+        batch_op.drop_index('ix_refresh_tokens_token_hash')
+        batch_op.drop_index('ix_refresh_tokens_team_id')
+        batch_op.drop_index('ix_refresh_tokens_family_id')
+        batch_op.drop_index('ix_refresh_tokens_expires_at')
+
+    op.drop_table('refresh_tokens')
@@ -0,0 +1,53 @@
+"""change log
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 00:00:06
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 기존 데이터는 첫 동기화(since=0)에서 내려가도록 변경 기록으로 적재
+BACKFILL = [
+    "INSERT INTO change_log (team_id, entity, entity_id, deleted) SELECT id, 'team', id, 0 FROM teams ORDER BY id",
+    "INSERT INTO change_log (team_id, entity, entity_id, deleted) "
+    "SELECT team_id, 'player', id, 0 FROM players WHERE team_id IS NOT NULL ORDER BY id",
+    "INSERT INTO change_log (team_id, entity, entity_id, deleted) "
+    "SELECT team_id, 'match', id, 0 FROM matches WHERE team_id IS NOT NULL ORDER BY id",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'change_log',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('entity', sa.String(length=16), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('deleted', sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sqlite_autoincrement=True
+    )
+    with op.batch_alter_table('change_log', schema=None) as batch_op:
+        batch_op.create_index('ix_change_log_team_id_entity_entity_id', ['team_id', 'entity', 'entity_id'], unique=True)
+        batch_op.create_index('ix_change_log_team_id_id', ['team_id', 'id'], unique=False)
+    for statement in BACKFILL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('change_log', schema=None) as batch_op:
+        batch_op.drop_index('ix_change_log_team_id_id')
+        batch_op.drop_index('ix_change_log_team_id_entity_entity_id')
+
+    op.drop_table('change_log')
@@ -0,0 +1,4 @@
+import os
+
+# 테스트에서만 최소 bcrypt 비용 사용 (app.config는 임포트 시점에 환경 변수를 읽음)
+os.environ.setdefault("MYFC_BCRYPT_ROUNDS", "4")
@@ -1,5 +1,7 @@
 import pytest
 from app.services.analytics_service import AnalyticsService
+from app.services.match_service import MatchService
+from app.schemas import AnalyticsWindow
 from app.models import Team, Player, Match
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -90,4 +92,57 @@ def test_get_player_contributions(db_session, test_team, test_players, test_matc
     assert len(result.players) == 3
     assert result.top_contributor["name"] != ""
     assert result.most_reliable["name"] != ""
-    assert result.most_reliable["win_rate"] != "0" 
\ No newline at end of file
+    assert result.most_reliable["win_rate"] != "0" 
+
+def test_get_opponent_records(db_session, test_team, test_matches):
+    service = AnalyticsService(db_session)
+    # 조회는 집계 테이블만 읽음 - 서비스를 거치지 않고 넣은 경기는 재구성 전까지 보이지 않음
+    assert service.get_opponent_records(test_team.id).opponents == []
+    assert MatchService(db_session).rebuild_stale_records() == [test_team.id]
+    result = service.get_opponent_records(test_team.id)
+    
+    assert len(result.opponents) == 3
+    team_a = service.get_opponent_records(test_team.id, opponent=" team a ").opponents
+    assert len(team_a) == 1
+    assert team_a[0].opponent == "Team A"
+    assert team_a[0].wins == 1
+    assert team_a[0].goals_for == 2
+    assert team_a[0].goals_against == 1
+    assert team_a[0].recent_form == "W"
+
+    # 일부만 집계된 팀도 경기 수 불일치로 감지
+    db_session.add(Match(date=datetime.date(2024, 1, 22), opponent="TEAM A", score="0:1", team_id=test_team.id))
+    db_session.commit()
+    assert MatchService(db_session).rebuild_stale_records() == [test_team.id]
+    assert MatchService(db_session).stale_record_team_ids() == []
+    team_a = service.get_opponent_records(test_team.id, opponent="Team A").opponents
+    assert (team_a[0].matches, team_a[0].recent_form) == (2, "LW")
+
+def test_analytics_window(db_session, test_team, test_matches):
+    service = AnalyticsService(db_session)
+    
+    # 최근 2경기 (1:1, 3:0)
+    result = service.get_team_analytics_overview(test_team.id, AnalyticsWindow(last_n=2))
+    assert result.total_matches == 2
+    assert (result.wins, result.draws) == (1, 1)
+    
+    # 날짜 범위는 양 끝 포함
+    window = AnalyticsWindow(date_from=datetime.date(2024, 1, 1), date_to=datetime.date(2024, 1, 8))
+    result = service.get_team_analytics_overview(test_team.id, window)
+    assert result.total_matches == 2
+    assert result.avg_goals_scored == 1.5
+    
+    contributions = service.get_player_contributions(test_team.id, window)
+    assert all(p.matches_played == 2 for p in contributions.players)
+    
+    opponents = service.get_opponent_records(test_team.id, window=window)
+    assert [o.opponent for o in opponents.opponents] == ["Team A", "Team B"]
+
+def test_get_rolling_form(db_session, test_team, test_matches):
+    service = AnalyticsService(db_session)
+    result = service.get_rolling_form(test_team.id, window_size=2)
+    
+    assert [p.result for p in result.points] == ["WIN", "DRAW", "WIN"]
+    assert [p.win_rate for p in result.points] == [100.0, 50.0, 50.0]
+    assert [p.goal_difference for p in result.points] == [1, 1, 3]
+
@@ -0,0 +1,86 @@
+import pytest
+import random
+import datetime
+from app.services.analytics_service import AnalyticsService
+from app.models import Team, Player, Match, Goal
+from app.schemas import AnalyticsWindow
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def seeded_team(db_session):
+    """무작위 경기/출전/골 기록이 있는 팀 (잘못된 스코어 문자열 포함)"""
+    rng = random.Random(2024)
+    team = Team(name="Engine Team", description="Differential", type="AMATEUR")
+    other = Team(name="Other Team", description="Other", type="AMATEUR")
+    db_session.add_all([team, other])
+    db_session.commit()
+    
+    players = [
+        Player(name=f"Player {i}", team_id=team.id, position="FW", number=i,
+               goal_count=rng.randint(0, 20), assist_count=rng.randint(0, 10), mom_count=rng.randint(0, 5))
+        for i in range(15)
+    ]
+    outsider = Player(name="Outsider", team_id=other.id, position="MF", number=99)
+    db_session.add_all(players + [outsider])
+    db_session.commit()
+    
+    start = datetime.datetime(2023, 1, 1)
+    scores = ["x:y", "", "10:0", "-1:2"]
+    for i in range(120):
+        if i % 30 == 7:
+            score = scores[(i // 30) % len(scores)]
+        else:
+            score = f"{rng.randint(0, 5)}:{rng.randint(0, 5)}"
+        match = Match(
+            date=start + datetime.timedelta(days=rng.randint(0, 500)),
+            opponent=f"Team {rng.randint(1, 8)}",
+            score=score,
+            team_id=team.id
+        )
+        match.players = rng.sample(players, rng.randint(0, 11))
+        if i % 17 == 0:
+            match.players.append(outsider)
+        db_session.add(match)
+        db_session.flush()
+        for _ in range(rng.randint(0, 4)):
+            scorer = rng.choice(players)
+            assist = rng.choice(players + [None])
+            db_session.add(Goal(match_id=match.id, player_id=scorer.id,
+                                assist_player_id=assist.id if assist else None, quarter=rng.randint(1, 4)))
+    db_session.commit()
+    return team
+
+WINDOWS = [
+    None,
+    AnalyticsWindow(last_n=10),
+    AnalyticsWindow(date_from=datetime.date(2023, 3, 1), date_to=datetime.date(2023, 9, 30)),
+    AnalyticsWindow(date_from=datetime.date(2030, 1, 1)),
+]
+
+@pytest.mark.parametrize("window", WINDOWS)
+def test_engine_matches_legacy_implementation(db_session, seeded_team, window):
+    engine_service = AnalyticsService(db_session, use_engine=True)
+    legacy_service = AnalyticsService(db_session, use_engine=False)
+    
+    for method in ["get_team_analytics_overview", "get_goals_win_correlation",
+                   "get_conceded_loss_correlation", "get_player_contributions"]:
+        expected = getattr(legacy_service, method)(seeded_team.id, window)
+        actual = getattr(engine_service, method)(seeded_team.id, window)
+        assert actual.model_dump() == expected.model_dump(), method
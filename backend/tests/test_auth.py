@@ -0,0 +1,153 @@
+import pytest
+from datetime import timedelta
+from fastapi import HTTPException, Request
+from jose import JWTError, jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app import auth
+from app.database import Base, LazySession, get_db
+from app.models import Team
+from app.schemas import TeamCreate, TeamUpdate
+from app.services.team_service import TeamService
+from app.utils.token_cache import TokenPrincipal, VerifiedTokenCache
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture(autouse=True)
+def fresh_token_cache(monkeypatch):
+    monkeypatch.setattr(auth, "verified_tokens", VerifiedTokenCache(100))
+
+def make_request() -> Request:
+    return Request({
+        "type": "http", "method": "GET", "path": "/teams/1", "headers": [],
+        "query_string": b"", "scheme": "http", "server": ("test", 80)
+    })
+
+def test_verified_tokens_are_cached(monkeypatch):
+    token = auth.create_access_token({"sub": "7"}, timedelta(minutes=5))
+    decode_calls = []
+    original_decode = jwt.decode
+    monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: decode_calls.append(1) or original_decode(*args, **kwargs))
+
+    first = auth.decode_access_token(token)
+    second = auth.decode_access_token(token)
+    assert first == second
+    assert first.team_id == 7
+    assert len(decode_calls) == 1
+    assert (auth.verified_tokens.hits, auth.verified_tokens.misses) == (1, 1)
+
+def test_cache_evicts_expired_and_least_recent_entries():
+    now = [1000.0]
+    cache = VerifiedTokenCache(max_entries=2, clock=lambda: now[0])
+    cache.put("a", TokenPrincipal(1, exp=1010))
+    cache.put("b", TokenPrincipal(2, exp=2000))
+    assert cache.get("a") is not None
+    cache.put("c", TokenPrincipal(3, exp=2000))
+    # "b"가 가장 오래전에 사용됨
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    now[0] = 1010
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+    cache.invalidate_team(3)
+    assert cache.get("c") is None
+
+def test_signing_key_rotation(monkeypatch):
+    monkeypatch.setattr(auth, "SIGNING_KEYS", {"old": "old-secret"})
+    monkeypatch.setattr(auth, "ACTIVE_KID", "old")
+    old_token = auth.create_access_token({"sub": "1"})
+    assert jwt.get_unverified_header(old_token)["kid"] == "old"
+
+    # 새 키로 교체, 이전 키는 검증용으로 유지
+    monkeypatch.setattr(auth, "SIGNING_KEYS", {"new": "new-secret", "old": "old-secret"})
+    monkeypatch.setattr(auth, "ACTIVE_KID", "new")
+    new_token = auth.create_access_token({"sub": "2"})
+    assert jwt.get_unverified_header(new_token)["kid"] == "new"
+    assert auth.decode_access_token(old_token).team_id == 1
+    assert auth.decode_access_token(new_token).team_id == 2
+
+    # kid가 없는 토큰은 현재 키로 검증
+    legacy = jwt.encode({"sub": "3", "exp": 4102444800}, "new-secret", algorithm=auth.ALGORITHM)
+    assert auth.decode_access_token(legacy).team_id == 3
+
+    # 이전 키를 제거하면 그 키로 서명된 토큰은 거부
+    auth.verified_tokens.clear()
+    monkeypatch.setattr(auth, "SIGNING_KEYS", {"new": "new-secret"})
+    with pytest.raises(JWTError):
+        auth.decode_access_token(old_token)
+
+@pytest.mark.asyncio
+async def test_password_change_revokes_existing_tokens(db_session):
+    service = TeamService(db_session)
+    team_data = TeamCreate(name="Test Team", description="d", type="AMATEUR", password="first")
+    await service.create_team(team_data)
+    token = (await service.login_team(team_data))["access_token"]
+
+    team = await auth.get_current_team(make_request(), token, db_session)
+    assert len(auth.verified_tokens) == 1
+
+    service.update_team(team.id, TeamUpdate(password="second"), team)
+    assert len(auth.verified_tokens) == 0
+    with pytest.raises(HTTPException) as exc_info:
+        await auth.get_current_team(make_request(), token, db_session)
+    assert exc_info.value.status_code == 401
+
+    new_token = (await service.login_team(TeamCreate(name="Test Team", description="d", type="AMATEUR", password="second")))["access_token"]
+    assert (await auth.get_current_team(make_request(), new_token, db_session)).id == team.id
+
+    # 비밀번호 이외의 수정은 토큰에 영향 없음
+    service.update_team(team.id, TeamUpdate(description="new"), team)
+    assert (await auth.get_current_team(make_request(), new_token, db_session)).id == team.id
+
+@pytest.mark.asyncio
+async def test_cached_team_skips_db_session(db_session, monkeypatch):
+    team = Team(name="Test Team", description="d", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    token = auth.create_access_token({"sub": str(team.id)})
+
+    # 요청용 세션은 사용 전까지 만들어지지 않음
+    request_db = next(get_db())
+    assert isinstance(request_db, LazySession) and not request_db.materialized
+
+    first = LazySession(TestingSessionLocal)
+    assert (await auth.get_current_team(make_request(), token, first)).id == team.id
+    assert first.materialized
+    first.close()
+
+    # 확인된 팀은 세션 없이 인증
+    second = LazySession(TestingSessionLocal)
+    principal = await auth.get_current_team(make_request(), token, second)
+    assert (principal.id, principal.name) == (team.id, "Test Team")
+    assert not second.materialized
+
+    # 팀 삭제 시 무효화 → 다시 조회해서 거부
+    db_session.delete(team)
+    db_session.commit()
+    auth.verified_tokens.invalidate_team(team.id)
+    with pytest.raises(HTTPException):
+        await auth.get_current_team(make_request(), token, LazySession(TestingSessionLocal))
+
+    # TTL 0이면 매 요청 조회
+    monkeypatch.setattr(auth.config, "AUTH_TEAM_CACHE_TTL", 0)
+    auth.verified_tokens.put_team(principal)
+    third = LazySession(TestingSessionLocal)
+    with pytest.raises(HTTPException):
+        await auth.get_current_team(make_request(), token, third)
+    assert third.materialized
+    third.close()
@@ -0,0 +1,116 @@
+import httpx
+import pytest
+import pytest_asyncio
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.auth import get_current_team
+from app.database import Base, get_db
+from app.main import app
+from app.models import Team
+from app.schemas import GoalCreate, MatchCreate, PlayerCreate, PlayerUpdate
+from app.services.match_service import MatchService
+from app.services.player_service import PlayerService
+from app.utils.cache import analytics_cache
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        analytics_cache.clear()
+
+@pytest.fixture
+def test_team(db_session):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    service = PlayerService(db_session)
+    players = [
+        service.create_player(PlayerCreate(name=f"Player {n}", number=n, position="FW", team_id=team.id), team)
+        for n in (1, 2)
+    ]
+    MatchService(db_session, team).create_match(MatchCreate(
+        date=date(2024, 1, 1), opponent="Team A", score="2:1", team_id=team.id,
+        player_ids=[p.id for p in players], quarter_scores=[{"quarter": 1, "our_score": 2, "opponent_score": 1}]
+    ), team)
+    return team, players
+
+@pytest_asyncio.fixture
+async def client(db_session, test_team):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_team] = lambda: test_team[0]
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+@pytest.mark.asyncio
+async def test_bootstrap_bundles_home_screen(client, test_team):
+    team, players = test_team
+    response = await client.get(f"/teams/{team.id}/bootstrap")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["team"]["name"] == "Test Team"
+    assert [p["name"] for p in body["players"]] == ["Player 1", "Player 2"]
+    assert [m["opponent"] for m in body["recent_matches"]] == ["Team A"]
+    assert (body["overview"]["total_matches"], body["overview"]["wins"]) == (1, 1)
+    assert body["version"] > 0
+    assert response.headers["etag"].startswith(f'"{team.id}-{body["version"]}-')
+
+    # 다른 팀 묶음은 거부
+    assert (await client.get(f"/teams/{team.id + 1}/bootstrap")).status_code == 403
+
+@pytest.mark.asyncio
+async def test_bootstrap_honors_if_none_match(client, db_session, test_team):
+    team, players = test_team
+    tag = (await client.get(f"/teams/{team.id}/bootstrap")).headers["etag"]
+
+    response = await client.get(f"/teams/{team.id}/bootstrap", headers={"If-None-Match": f"W/{tag}"})
+    assert response.status_code == 304
+    assert response.content == b"" and response.headers["etag"] == tag
+
+    # 선수 수정 → 새 태그
+    PlayerService(db_session).update_player(players[1].id, PlayerUpdate(name="Renamed"), team)
+    response = await client.get(f"/teams/{team.id}/bootstrap", headers={"If-None-Match": tag})
+    assert response.status_code == 200
+    assert response.json()["players"][1]["name"] == "Renamed"
+    tag = response.headers["etag"]
+
+    # 골 추가 → 경기와 선수 통계가 바뀌므로 새 태그
+    match_id = response.json()["recent_matches"][0]["id"]
+    MatchService(db_session, team).add_goal(
+        match_id, GoalCreate(match_id=match_id, player_id=players[0].id, quarter=2), team
+    )
+    response = await client.get(f"/teams/{team.id}/bootstrap", headers={"If-None-Match": tag})
+    assert response.status_code == 200
+    assert response.json()["players"][0]["goal_count"] == 1
+
+@pytest.mark.asyncio
+async def test_bootstrap_query_count(client, test_team):
+    team, players = test_team
+    await client.get(f"/teams/{team.id}/bootstrap")
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # 분석 개요가 캐시에 있으면 버전, 팀+선수, 최근 경기 세 번
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = await client.get(f"/teams/{team.id}/bootstrap")
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert response.status_code == 200
+    assert len(response.json()["players"]) == 2
+    assert len(statements) == 3
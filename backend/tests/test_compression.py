@@ -0,0 +1,173 @@
+import datetime
+import gzip
+import json
+import pytest
+import pytest_asyncio
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.auth import get_current_team
+from app.database import Base, get_db
+from app.main import app
+from app.models import Team, Player, Match
+from app.schemas import AnalyticsWindow, TeamAnalyticsOverview
+from app.services.analytics_service import AnalyticsService
+from app.utils.cache import analytics_cache
+from app.utils.compression import CompressionMiddleware, CompressedPayload, negotiate_encoding
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+LARGE = [{"scorer_name": "Player", "assist_name": "Other", "created_at": "2024-01-01T00:00:00"}] * 50
+
+def build_app() -> FastAPI:
+    test_app = FastAPI()
+    test_app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @test_app.get("/large")
+    def large():
+        return LARGE
+
+    @test_app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @test_app.get("/image")
+    def image():
+        return Response(b"\x89PNG" * 500, media_type="image/png")
+
+    @test_app.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(b"x" * 1000), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+    @test_app.get("/stream")
+    def stream():
+        return StreamingResponse((b"line %d\n" % i for i in range(200)), media_type="text/plain")
+
+    @test_app.get("/text")
+    def text():
+        return PlainTextResponse("a" * 1000)
+
+    return test_app
+
+@pytest_asyncio.fixture
+async def client():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=build_app()), base_url="http://test") as client:
+        yield client
+
+def test_negotiate_encoding():
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("br, gzip", available=("gzip",)) == "gzip"
+    assert negotiate_encoding("br, gzip", available=("br", "gzip")) == "br"
+    assert negotiate_encoding("*", available=("gzip",)) == "gzip"
+
+@pytest.mark.asyncio
+async def test_large_json_is_compressed(client):
+    response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(json.dumps(LARGE))
+    assert response.json() == LARGE
+
+    response = await client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == LARGE
+
+@pytest.mark.asyncio
+async def test_small_and_incompressible_responses_pass_through(client):
+    response = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == {"ok": True}
+
+    response = await client.get("/image", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+    # 이미 인코딩된 본문은 이중 압축하지 않음
+    response = await client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == b"x" * 1000
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_compressed_incrementally(client):
+    response = await client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == "".join(f"line {i}\n" for i in range(200))
+
+    response = await client.get("/text", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == "a" * 1000
+
+def test_compressed_payload_variants(monkeypatch):
+    from app import config
+    monkeypatch.setattr(config, "COMPRESSION_MIN_SIZE", 100)
+    body = json.dumps(LARGE).encode()
+    payload = CompressedPayload(body)
+    assert gzip.decompress(payload.variants["gzip"]) == body
+    assert CompressedPayload(b"{}").variants == {}
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest_asyncio.fixture
+async def analytics_client(db_session, monkeypatch):
+    from app import config
+    monkeypatch.setattr(config, "COMPRESSION_MIN_SIZE", 100)
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    players = [Player(name=f"Player {i}", team_id=team.id, position="FW", number=i) for i in range(3)]
+    db_session.add_all(players)
+    for day, score in enumerate(("2:1", "1:1", "0:3")):
+        db_session.add(Match(
+            date=datetime.date(2024, 1, day + 1), opponent=f"Team {day}", score=score,
+            team_id=team.id, players=players
+        ))
+    db_session.commit()
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_team] = lambda: team
+    analytics_cache.clear()
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client, team
+    finally:
+        app.dependency_overrides.clear()
+        analytics_cache.clear()
+
+@pytest.mark.asyncio
+async def test_cached_analytics_payload_is_precompressed(analytics_client, db_session):
+    client, team = analytics_client
+    url = f"/analytics/team/{team.id}/overview"
+
+    plain = await client.get(url, headers={"Accept-Encoding": "identity"})
+    expected = TeamAnalyticsOverview.model_validate(
+        AnalyticsService(db_session).get_team_analytics_overview(team.id, AnalyticsWindow())
+    ).model_dump(mode="json")
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == expected
+
+    # 캐시에는 직렬화/압축이 끝난 본문이 저장되고, 적중 시 같은 바이트를 그대로 응답
+    payload = analytics_cache.get(team.id, ("overview", (None, None, None)))
+    assert isinstance(payload, CompressedPayload)
+    compressed = await client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert int(compressed.headers["content-length"]) == len(payload.variants["gzip"])
+    assert compressed.json() == expected
@@ -0,0 +1,108 @@
+import httpx
+import msgpack
+import pytest
+import pytest_asyncio
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.auth import get_current_team
+from app.database import Base, get_db
+from app.main import app
+from app.models import Team
+from app.schemas import GoalCreate, MatchCreate, PlayerCreate
+from app.services.match_service import MatchService
+from app.services.player_service import PlayerService
+from app.utils.cache import analytics_cache
+from app.utils.content_negotiation import (
+    MSGPACK, MSGPACK_COMPACT, compact_keys, expand_keys, negotiate_format
+)
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        analytics_cache.clear()
+
+@pytest.fixture
+def test_team(db_session):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    service = PlayerService(db_session)
+    players = [
+        service.create_player(PlayerCreate(name=f"Player {n}", number=n, position="FW", team_id=team.id), team)
+        for n in (1, 2)
+    ]
+    matches = MatchService(db_session, team)
+    for day in (1, 2):
+        match = matches.create_match(MatchCreate(
+            date=date(2024, 1, day), opponent="Team A", score="2:1", team_id=team.id,
+            player_ids=[p.id for p in players], quarter_scores=[{"quarter": 1, "our_score": 2, "opponent_score": 1}]
+        ), team)
+        for player in players:
+            matches.add_goal(match.id, GoalCreate(match_id=match.id, player_id=player.id, quarter=1), team)
+    return team
+
+@pytest_asyncio.fixture
+async def client(db_session, test_team):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_team] = lambda: test_team
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+def test_negotiate_format():
+    assert negotiate_format(None) is None
+    assert negotiate_format("application/json") is None
+    assert negotiate_format("*/*") is None
+    assert negotiate_format("application/msgpack") == MSGPACK
+    assert negotiate_format("application/msgpack, application/json") == MSGPACK
+    assert negotiate_format("application/json, application/msgpack;q=0.5") is None
+    assert negotiate_format("application/x-msgpack; keys=compact, */*;q=0.1") == MSGPACK_COMPACT
+
+def test_compact_keys_round_trip():
+    value = {"items": [{"a": 1, "b": [{"c": 1}, {"c": 2}]}, {"a": 2, "b": []}], "single": [{"a": 1}]}
+    compacted = compact_keys(value)
+    assert compacted["items"]["$keys"] == ["a", "b"]
+    assert compacted["items"]["$rows"][0] == [1, {"$keys": ["c"], "$rows": [[1], [2]]}]
+    assert compacted["single"] == [{"a": 1}]
+    assert expand_keys(compacted) == value
+
+@pytest.mark.asyncio
+async def test_routes_serialize_same_schema_as_msgpack(client, test_team):
+    for path in (f"/matches/team/{test_team.id}", "/matches/1/detail", f"/analytics/team/{test_team.id}/overview"):
+        expected = (await client.get(path)).json()
+        # 분석 API는 캐시된 본문에서 변환 (두 번째 요청)
+        for _ in range(2):
+            response = await client.get(path, headers={"Accept": "application/msgpack"})
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/msgpack"
+            assert "Accept" in response.headers["vary"]
+            assert msgpack.unpackb(response.content) == expected
+
+        compact = await client.get(path, headers={"Accept": "application/msgpack; keys=compact"})
+        assert compact.headers["content-type"] == "application/msgpack; keys=compact"
+        assert expand_keys(msgpack.unpackb(compact.content)) == expected
+
+    listing = await client.get(f"/matches/team/{test_team.id}", headers={"Accept": "application/msgpack; keys=compact"})
+    plain = await client.get(f"/matches/team/{test_team.id}", headers={"Accept": "application/msgpack"})
+    assert len(listing.content) < len(plain.content) < len((await client.get(f"/matches/team/{test_team.id}")).content)
+
+@pytest.mark.asyncio
+async def test_error_responses_are_transcoded(client):
+    response = await client.get("/matches/999/detail", headers={"Accept": "application/msgpack"})
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == {"detail": "Match not found"}
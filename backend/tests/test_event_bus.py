@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+import threading
+
+from sqlalchemy import create_engine, text
+
+from app.database import configure_sqlite
+from app.utils.cache import TeamCache
+from app.utils.event_bus import EventBus
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_event_bus_delivers_to_other_instances(tmp_path):
+    path = str(tmp_path / "bus.db")
+    worker_a = EventBus(path)
+    worker_b = EventBus(path)
+    received_a, received_b = [], []
+    worker_a.subscribe("news", received_a.append)
+    worker_b.subscribe("news", received_b.append)
+
+    worker_a.publish("news", {"value": 1})
+    worker_a.publish("other", {"value": 2})
+
+    # 발행한 프로세스에는 즉시, 다른 프로세스에는 poll 시 전달 (자기 이벤트는 중복 전달 안 함)
+    assert received_a == [{"value": 1}]
+    assert worker_b.poll() == 2
+    assert received_b == [{"value": 1}]
+    assert worker_a.poll() == 0
+    assert received_a == [{"value": 1}]
+
+def test_event_bus_skips_history_for_new_instance(tmp_path):
+    path = str(tmp_path / "bus.db")
+    EventBus(path).publish("news", {"value": 1})
+
+    late_worker = EventBus(path)
+    received = []
+    late_worker.subscribe("news", received.append)
+    assert late_worker.poll() == 0
+    assert received == []
+
+def test_cache_invalidation_across_processes(tmp_path):
+    path = str(tmp_path / "bus.db")
+    bus = EventBus(path)
+    cache = TeamCache("analytics")
+    cache.attach(bus)
+    cache.get_or_set(1, "overview", lambda: "team-1")
+    cache.get_or_set(2, "overview", lambda: "team-2")
+
+    # 다른 워커 프로세스에서 팀 1 데이터 변경
+    script = (
+        "import sys\n"
+        "from app.utils.cache import TeamCache\n"
+        "from app.utils.event_bus import EventBus\n"
+        "cache = TeamCache('analytics')\n"
+        "cache.attach(EventBus(sys.argv[1]))\n"
+        "cache.invalidate_team(1)\n"
+    )
+    subprocess.run([sys.executable, "-c", script, path], cwd=BACKEND_DIR, check=True)
+
+    assert cache.get(1, "overview") == "team-1"
+    bus.poll()
+    assert cache.get(1, "overview") is None
+    assert cache.get(2, "overview") == "team-2"
+
+def test_cache_does_not_store_result_invalidated_during_compute():
+    cache = TeamCache("analytics")
+
+    def compute():
+        # 계산 도중 다른 요청이 데이터를 변경
+        cache.invalidate_team(1)
+        return "stale"
+
+    assert cache.get_or_set(1, "overview", compute) == "stale"
+    assert cache.get(1, "overview") is None
+    assert cache.get_or_set(1, "overview", lambda: "fresh") == "fresh"
+    assert cache.get(1, "overview") == "fresh"
+
+def test_sqlite_wal_allows_reads_during_write(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'wal.db'}", connect_args={"timeout": 1})
+    configure_sqlite(engine)
+    with engine.begin() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+    writer = engine.connect()
+    writer.begin()
+    writer.execute(text("INSERT INTO items (id) VALUES (2)"))
+
+    # 쓰기 트랜잭션이 열려 있는 동안 다른 연결(워커)의 읽기가 막히지 않음
+    result = []
+    reader = threading.Thread(
+        target=lambda: result.append(engine.connect().execute(text("SELECT count(*) FROM items")).scalar())
+    )
+    reader.start()
+    reader.join(timeout=5)
+    assert result == [1]
+
+    writer.commit()
+    writer.close()
+    engine.dispose()
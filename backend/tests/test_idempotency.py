@@ -0,0 +1,207 @@
+import pytest
+import json
+import threading
+import time
+from datetime import date, datetime, timedelta
+from app.services.idempotency_service import IdempotencyService
+from app.services.match_service import MatchService
+from app.models import Team, Player, Match, Goal, IdempotencyKey
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.schemas import MatchCreate, GoalCreate, Match as MatchSchema, Goal as GoalSchema
+from fastapi import HTTPException
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False, "timeout": 10})
+# 앱 세션과 같이 커밋 후 만료하지 않음
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def test_team(db_session):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    return team
+
+@pytest.fixture
+def test_players(db_session, test_team):
+    players = [
+        Player(name="Player 1", team_id=test_team.id, position="FW", number=10, goal_count=0, assist_count=0, mom_count=0),
+        Player(name="Player 2", team_id=test_team.id, position="MF", number=8, goal_count=0, assist_count=0, mom_count=0)
+    ]
+    db_session.add_all(players)
+    db_session.commit()
+    return players
+
+def make_match(test_team, test_players):
+    return MatchCreate(
+        date=date(2024, 1, 1), opponent="Team A", score="1:0", team_id=test_team.id,
+        player_ids=[p.id for p in test_players], quarter_scores=[]
+    )
+
+def test_replay_returns_original_response(db_session, test_team, test_players):
+    service = MatchService(db_session, test_team)
+    idempotency = IdempotencyService(db_session)
+    match = make_match(test_team, test_players)
+    request_hash = idempotency.fingerprint("POST", "/matches/create", match)
+
+    def create():
+        return MatchSchema.model_validate(service.create_match(match, test_team))
+
+    first = idempotency.run(test_team.id, "key-1", request_hash, create)
+    replay = idempotency.run(test_team.id, "key-1", request_hash, create)
+
+    # 재시도는 경기를 다시 만들지 않고 저장된 응답을 그대로 반환
+    assert db_session.query(Match).count() == 1
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert json.loads(replay.body) == first
+
+    # 키가 없으면 매번 실행
+    idempotency.run(test_team.id, None, request_hash, create)
+    assert db_session.query(Match).count() == 2
+
+def test_goal_replay_does_not_double_count(db_session, test_team, test_players):
+    service = MatchService(db_session, test_team)
+    idempotency = IdempotencyService(db_session)
+    db_match = service.create_match(make_match(test_team, test_players), test_team)
+    goal = GoalCreate(match_id=db_match.id, quarter=1, player_id=test_players[0].id, assist_player_id=test_players[1].id)
+    request_hash = idempotency.fingerprint("POST", f"/matches/{db_match.id}/goals", goal)
+
+    for _ in range(3):
+        idempotency.run(
+            test_team.id, "goal-1", request_hash,
+            lambda: GoalSchema.model_validate(service.add_goal(db_match.id, goal, test_team))
+        )
+
+    db_session.refresh(test_players[0])
+    db_session.refresh(test_players[1])
+    assert db_session.query(Goal).count() == 1
+    assert test_players[0].goal_count == 1
+    assert test_players[1].assist_count == 1
+
+def test_key_reuse_with_different_request_is_rejected(db_session, test_team):
+    idempotency = IdempotencyService(db_session)
+    idempotency.run(test_team.id, "key-1", "hash-a", lambda: {"ok": True})
+
+    with pytest.raises(HTTPException) as exc_info:
+        idempotency.run(test_team.id, "key-1", "hash-b", lambda: {"ok": True})
+    assert exc_info.value.status_code == 422
+
+    # 키는 팀 단위로 구분
+    assert idempotency.run(test_team.id + 1, "key-1", "hash-b", lambda: {"team": 2}) == {"team": 2}
+
+def test_failed_request_releases_key(db_session, test_team):
+    idempotency = IdempotencyService(db_session)
+
+    def fail():
+        raise HTTPException(status_code=400, detail="bad request")
+
+    with pytest.raises(HTTPException):
+        idempotency.run(test_team.id, "key-1", "hash-a", fail)
+    assert db_session.query(IdempotencyKey).count() == 0
+    assert idempotency.run(test_team.id, "key-1", "hash-a", lambda: {"ok": True}) == {"ok": True}
+
+def test_expired_key_is_treated_as_new(db_session, test_team):
+    idempotency = IdempotencyService(db_session)
+    idempotency.run(test_team.id, "key-1", "hash-a", lambda: {"run": 1})
+    record = db_session.query(IdempotencyKey).one()
+    record.expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+
+    assert idempotency.run(test_team.id, "key-1", "hash-a", lambda: {"run": 2}) == {"run": 2}
+
+def test_concurrent_duplicates_execute_once(db_session, test_team):
+    calls = []
+    results = []
+    errors = []
+
+    def handler():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"created": True}
+
+    def worker():
+        db = TestingSessionLocal()
+        try:
+            results.append(IdempotencyService(db).run(test_team.id, "key-1", "hash-a", handler))
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 동시에 들어온 중복 요청은 최초 요청 완료를 기다렸다가 같은 응답을 재생
+    assert errors == []
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert sum(1 for result in results if result == {"created": True}) == 1
+    assert all(result.headers["Idempotent-Replayed"] == "true" for result in results if result != {"created": True})
+
+def test_failed_request_does_not_keep_partial_writes(db_session, test_team, test_players):
+    service = MatchService(db_session, test_team)
+    idempotency = IdempotencyService(db_session)
+    match = make_match(test_team, test_players)
+
+    def create_then_fail():
+        service.create_match(match, test_team)
+        raise RuntimeError("connection lost")
+
+    # 서비스 커밋은 응답 저장과 함께 하므로 실패하면 경기도 남지 않음 → 재시도해도 한 번만 생성
+    with pytest.raises(RuntimeError):
+        idempotency.run(test_team.id, "key-1", "hash-a", create_then_fail)
+    assert db_session.query(Match).count() == 0
+    assert db_session.query(IdempotencyKey).count() == 0
+
+    idempotency.run(test_team.id, "key-1", "hash-a", lambda: MatchSchema.model_validate(service.create_match(match, test_team)))
+    assert db_session.query(Match).count() == 1
+
+def test_stale_in_progress_key_is_taken_over(db_session, test_team):
+    # 선점한 요청이 응답을 저장하지 못하고 죽음
+    now = datetime.utcnow()
+    db_session.add(IdempotencyKey(
+        team_id=test_team.id, key="key-1", request_hash="hash-a",
+        locked_until=now - timedelta(seconds=1), created_at=now, expires_at=now + timedelta(hours=1)
+    ))
+    db_session.commit()
+
+    idempotency = IdempotencyService(db_session)
+    assert idempotency.run(test_team.id, "key-1", "hash-a", lambda: {"run": 2}) == {"run": 2}
+    replay = idempotency.run(test_team.id, "key-1", "hash-a", lambda: {"run": 3})
+    assert json.loads(replay.body) == {"run": 2}
+
+def test_request_that_lost_its_lease_is_discarded(db_session, test_team, test_players):
+    service = MatchService(db_session, test_team)
+    idempotency = IdempotencyService(db_session)
+    match = make_match(test_team, test_players)
+
+    def slow_create():
+        # 처리 중에 기한이 지나 다른 요청이 이어받음
+        db = TestingSessionLocal()
+        try:
+            db.query(IdempotencyKey).update({IdempotencyKey.locked_until: datetime.utcnow() + timedelta(minutes=1)})
+            db.commit()
+        finally:
+            db.close()
+        return MatchSchema.model_validate(service.create_match(match, test_team))
+
+    with pytest.raises(HTTPException) as exc_info:
+        idempotency.run(test_team.id, "key-1", "hash-a", slow_create)
+    assert exc_info.value.status_code == 409
+    assert db_session.query(Match).count() == 0
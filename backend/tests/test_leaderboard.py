@@ -0,0 +1,98 @@
+import pytest
+from app.services.leaderboard_service import LeaderboardService
+from app.services.match_service import MatchService
+from app.models import Team, Player, Match
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from datetime import date
+from app.schemas import MatchCreate
+from fastapi import HTTPException
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def test_teams(db_session):
+    teams = [
+        Team(name="Amateur FC", description="A", type="AMATEUR"),
+        Team(name="Pro FC", description="P", type="PRO")
+    ]
+    db_session.add_all(teams)
+    db_session.commit()
+    db_session.add_all([
+        Player(name="A1", team_id=teams[0].id, position="FW", number=9, goal_count=5, assist_count=1, mom_count=0),
+        Player(name="A2", team_id=teams[0].id, position="MF", number=8, goal_count=7, assist_count=4, mom_count=2),
+        Player(name="P1", team_id=teams[1].id, position="FW", number=9, goal_count=7, assist_count=0, mom_count=1),
+        Player(name="P2", team_id=teams[1].id, position="DF", number=4, goal_count=0, assist_count=2, mom_count=0)
+    ])
+    db_session.commit()
+    return teams
+
+def test_get_player_leaderboard(db_session, test_teams):
+    service = LeaderboardService(db_session)
+    
+    result = service.get_player_leaderboard("goals")
+    # 동점(7골)이면 먼저 등록된 선수 우선, 0골 선수는 제외
+    assert [e.name for e in result.entries] == ["A2", "P1", "A1"]
+    assert [e.rank for e in result.entries] == [1, 2, 3]
+    
+    page = service.get_player_leaderboard("goals", limit=1, offset=1)
+    assert [e.name for e in page.entries] == ["P1"]
+    assert page.entries[0].rank == 2
+    assert page.has_more
+    
+    pro = service.get_player_leaderboard("assists", team_type="PRO")
+    assert [e.name for e in pro.entries] == ["P2"]
+    assert pro.entries[0].team_name == "Pro FC"
+    
+    with pytest.raises(HTTPException) as exc_info:
+        service.get_player_leaderboard("tackles")
+    assert exc_info.value.status_code == 400
+
+def test_get_team_leaderboard(db_session, test_teams):
+    for team, scores in zip(test_teams, [["1:0", "0:2"], ["3:1", "2:2"]]):
+        match_service = MatchService(db_session, team)
+        for i, score in enumerate(scores):
+            match_service.create_match(MatchCreate(
+                date=date(2024, 1, 1 + i), opponent="Rival", score=score,
+                team_id=team.id, player_ids=[], quarter_scores=[]
+            ), team)
+    
+    service = LeaderboardService(db_session)
+    result = service.get_team_leaderboard()
+    
+    # 승률/경기 수가 같으면 먼저 등록된 팀 우선
+    assert [e.team_name for e in result.entries] == ["Amateur FC", "Pro FC"]
+    assert all(e.win_rate == 50.0 for e in result.entries)
+    
+    pro = service.get_team_leaderboard(team_type="PRO")
+    assert len(pro.entries) == 1
+    assert (pro.entries[0].wins, pro.entries[0].draws) == (1, 1)
+    
+    assert service.get_team_leaderboard(min_matches=3).entries == []
+
+def test_team_leaderboard_after_records_rebuild(db_session, test_teams):
+    # 집계 테이블이 생기기 전에 등록된 경기 (create_all로 만든 DB에는 마이그레이션 백필이 없음)
+    team = test_teams[0]
+    db_session.add(Match(date=date(2024, 1, 1), opponent="Rival", score="0:3", team_id=team.id))
+    db_session.commit()
+    MatchService(db_session, team).create_match(MatchCreate(
+        date=date(2024, 1, 8), opponent="Rival", score="2:0", team_id=team.id, player_ids=[], quarter_scores=[]
+    ), team)
+
+    assert MatchService(db_session).rebuild_stale_records() == [team.id]
+    entry = LeaderboardService(db_session).get_team_leaderboard().entries[0]
+    assert (entry.matches, entry.wins, entry.losses, entry.win_rate) == (2, 1, 1, 50.0)
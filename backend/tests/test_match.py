@@ -1,11 +1,12 @@
 import pytest
 from app.services.match_service import MatchService
-from app.models import Team, Player, Match, Goal
+from app.models import Team, Player, Match, Goal, OpponentRecord
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.database import Base
-from datetime import date
-from app.schemas import MatchCreate, GoalCreate
+from datetime import date, timedelta
+from app.schemas import MatchCreate, GoalCreate, MatchUpdate, GoalBatchCreate
+from fastapi import HTTPException
 
 # 테스트용 DB 설정
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -97,6 +98,49 @@ def test_add_goal(db_session, test_team, test_players):
     assert goal.assist_player_id == test_players[1].id
     assert goal.quarter == 1
 
+def test_add_goals_batch(db_session, test_team, test_players):
+    service = MatchService(db_session, test_team)
+    
+    match_data = {
+        "date": date(2024, 1, 1),
+        "opponent": "Team A",
+        "score": "3:1",
+        "team_id": test_team.id,
+        "player_ids": [p.id for p in test_players],
+        "quarter_scores": []
+    }
+    match = service.create_match(MatchCreate(**match_data), test_team)
+    
+    # 3골 일괄 입력: 선수1 2골 1도움, 선수2 1골 1도움
+    batch = GoalBatchCreate(goals=[
+        {"player_id": test_players[0].id, "assist_player_id": test_players[1].id, "quarter": 1},
+        {"player_id": test_players[0].id, "quarter": 2},
+        {"player_id": test_players[1].id, "assist_player_id": test_players[0].id, "quarter": 3}
+    ])
+    goals = service.add_goals_batch(match.id, batch, test_team)
+    
+    assert [goal.quarter for goal in goals] == [1, 2, 3]
+    assert all(goal.match_id == match.id and goal.created_at for goal in goals)
+    assert goals[0].scorer_name == "Player 1"
+    assert goals[0].assist_name == "Player 2"
+    
+    for player in test_players:
+        db_session.refresh(player)
+    assert (test_players[0].goal_count, test_players[0].assist_count) == (2, 1)
+    assert (test_players[1].goal_count, test_players[1].assist_count) == (1, 1)
+    # MOM은 배치당 한 번만 선정
+    assert [p.mom_count for p in test_players] == [1, 0, 0]
+    
+    # 팀 외 선수가 하나라도 있으면 배치 전체 거부
+    with pytest.raises(HTTPException) as exc_info:
+        service.add_goals_batch(match.id, GoalBatchCreate(goals=[
+            {"player_id": test_players[2].id, "quarter": 4},
+            {"player_id": 9999, "quarter": 4}
+        ]), test_team)
+    assert exc_info.value.status_code == 400
+    db_session.rollback()
+    assert db_session.query(Goal).filter(Goal.match_id == match.id).count() == 3
+
 def test_get_match_detail(db_session, test_team, test_players):
     service = MatchService(db_session, test_team)
     
@@ -159,4 +203,61 @@ def test_get_recent_matches(db_session, test_team, test_players):
     recent_dates = [m.date.date() for m in recent_matches]
     # 생성한 날짜 중 3개가 recent_dates에 포함되어 있는지 확인
     assert set(recent_dates).issubset(set(dates))
-    assert len(recent_dates) == 3 
\ No newline at end of file
+    assert len(recent_dates) == 3
+
+def test_recent_matches_prefer_upcoming_then_latest_past(db_session, test_team, test_players):
+    service = MatchService(db_session, test_team)
+    today = date.today()
+    offsets = [-30, -20, -10, 5, 15]
+    for days in offsets:
+        service.create_match(MatchCreate(
+            date=today + timedelta(days=days), opponent=f"Team {days}", score="1:0", team_id=test_team.id,
+            player_ids=[p.id for p in test_players], quarter_scores=[]
+        ), test_team)
+
+    # 미래 경기(가까운 순) 뒤에 가장 최근 과거 경기들(날짜순)
+    recent = service.get_recent_matches(test_team.id, test_team, limit=4)
+    assert [m.opponent for m in recent] == ["Team 5", "Team 15", "Team -20", "Team -10"]
+    assert [m.opponent for m in service.get_recent_matches(test_team.id, test_team, limit=1)] == ["Team 5"]
+
+def test_opponent_records_incremental(db_session, test_team, test_players):
+    service = MatchService(db_session, test_team)
+    
+    matches = []
+    for d, opponent, score in [(date(2024, 1, 1), "Team A", "2:1"), (date(2024, 1, 8), " team  a", "0:3"), (date(2024, 1, 15), "Team B", "1:1")]:
+        match_data = {
+            "date": d,
+            "opponent": opponent,
+            "score": score,
+            "team_id": test_team.id,
+            "player_ids": [p.id for p in test_players],
+            "quarter_scores": []
+        }
+        matches.append(service.create_match(MatchCreate(**match_data), test_team))
+    
+    def record(key):
+        return db_session.query(OpponentRecord).filter(
+            OpponentRecord.team_id == test_team.id, OpponentRecord.opponent_key == key
+        ).first()
+    
+    team_a = record("team a")
+    assert (team_a.matches, team_a.wins, team_a.losses) == (2, 1, 1)
+    assert (team_a.goals_for, team_a.goals_against) == (2, 4)
+    assert team_a.recent_form == "LW"
+    
+    # 스코어 수정 시 이전 결과를 빼고 새 결과 반영
+    service.update_match(matches[1].id, MatchUpdate(score="1:1"), test_team)
+    team_a = record("team a")
+    assert (team_a.wins, team_a.draws, team_a.losses) == (1, 1, 0)
+    assert team_a.recent_form == "DW"
+    
+    # 상대팀 변경 시 기존 상대 전적에서 이동
+    service.update_match(matches[2].id, MatchUpdate(opponent="Team A"), test_team)
+    assert record("team b") is None
+    assert record("team a").matches == 3
+    
+    service.delete_match(matches[0].id, test_team)
+    team_a = record("team a")
+    assert (team_a.matches, team_a.wins, team_a.draws) == (2, 0, 2)
+    assert team_a.recent_form == "DD"
+
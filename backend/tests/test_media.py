@@ -0,0 +1,159 @@
+import gzip
+import os
+import pytest
+import pytest_asyncio
+import httpx
+from email.utils import formatdate
+from app.main import app
+from app.utils import storage as storage_module
+from app.utils.media import parse_range, precompress, IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL
+from app.utils.storage import LocalStorage, ObjectStoreStorage, OrphanCleaner
+from fastapi import HTTPException
+
+HASHED_NAME = "1_logo_0123456789abcdef.png"
+PLAIN_NAME = "1_logo_20240101_120000.png"
+BODY = bytes(range(256)) * 40
+
+@pytest.fixture(params=["local", "object"])
+def storage(request, tmp_path, monkeypatch):
+    if request.param == "local":
+        backend = LocalStorage(str(tmp_path / "uploads"), max_workers=2)
+    else:
+        backend = ObjectStoreStorage(str(tmp_path / "objects"), max_workers=2)
+    monkeypatch.setattr(storage_module, "_storage", backend)
+    monkeypatch.setattr(storage_module, "_cleaner", OrphanCleaner(backend))
+    yield backend
+    backend.shutdown()
+
+@pytest_asyncio.fixture
+async def client(storage):
+    await storage.save(HASHED_NAME, BODY, "image/png")
+    await storage.save(PLAIN_NAME, BODY, "image/png")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+def test_parse_range():
+    assert parse_range(None, 100) is None
+    assert parse_range("bytes=0-9", 100) == (0, 9)
+    assert parse_range("bytes=90-", 100) == (90, 99)
+    assert parse_range("bytes=-10", 100) == (90, 99)
+    assert parse_range("bytes=50-1000", 100) == (50, 99)
+    # 다중 범위/형식 오류는 전체 응답
+    assert parse_range("bytes=0-1,5-6", 100) is None
+    assert parse_range("items=0-1", 100) is None
+    assert parse_range("bytes=9-1", 100) is None
+    with pytest.raises(HTTPException) as exc_info:
+        parse_range("bytes=100-", 100)
+    assert exc_info.value.status_code == 416
+
+@pytest.mark.asyncio
+async def test_full_and_head_responses(client):
+    response = await client.get(f"/uploads/{HASHED_NAME}")
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["content-length"] == str(len(BODY))
+    assert response.headers["etag"] == '"0123456789abcdef"'
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["accept-ranges"] == "bytes"
+
+    # 내용 기반이 아닌 이름은 매번 재검증
+    response = await client.get(f"/uploads/{PLAIN_NAME}")
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+    response = await client.head(f"/uploads/{HASHED_NAME}")
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["content-length"] == str(len(BODY))
+
+    assert (await client.get("/uploads/missing.png")).status_code == 404
+    assert (await client.get("/uploads/..%2Fmyfc.db")).status_code == 404
+
+@pytest.mark.asyncio
+async def test_range_requests(client):
+    response = await client.get(f"/uploads/{HASHED_NAME}", headers={"Range": "bytes=100-199"})
+    assert response.status_code == 206
+    assert response.content == BODY[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(BODY)}"
+    assert response.headers["content-length"] == "100"
+
+    response = await client.get(f"/uploads/{HASHED_NAME}", headers={"Range": "bytes=-16"})
+    assert response.content == BODY[-16:]
+
+    response = await client.get(f"/uploads/{HASHED_NAME}", headers={"Range": f"bytes={len(BODY)}-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(BODY)}"
+
+    # If-Range가 현재 ETag와 다르면 전체 응답
+    response = await client.get(f"/uploads/{HASHED_NAME}", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert response.status_code == 200
+    assert response.content == BODY
+
+@pytest.mark.asyncio
+async def test_conditional_requests(client):
+    first = await client.get(f"/uploads/{PLAIN_NAME}")
+    etag = first.headers["etag"]
+
+    response = await client.get(f"/uploads/{PLAIN_NAME}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await client.get(f"/uploads/{PLAIN_NAME}", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+    response = await client.get(f"/uploads/{PLAIN_NAME}", headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert response.status_code == 304
+    response = await client.get(f"/uploads/{PLAIN_NAME}", headers={"If-Modified-Since": formatdate(0, usegmt=True)})
+    assert response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_precompressed_variant(client, storage):
+    assert await precompress(storage, HASHED_NAME) == [f"{HASHED_NAME}.gz"]
+
+    response = await client.get(f"/uploads/{HASHED_NAME}", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == '"0123456789abcdef-gzip"'
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(BODY)
+    # httpx가 Content-Encoding에 따라 풀어서 돌려줌
+    assert response.content == BODY
+
+    response = await client.get(f"/uploads/{HASHED_NAME}", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "content-encoding" not in response.headers
+    assert response.content == BODY
+
+    # 변형 파일을 직접 요청할 수는 없음
+    assert (await client.get(f"/uploads/{HASHED_NAME}.gz")).status_code == 404
+    assert gzip.decompress(await storage.read(f"{HASHED_NAME}.gz")) == BODY
+
+@pytest.mark.asyncio
+async def test_zerocopysend_when_server_supports_it(storage):
+    await storage.save(HASHED_NAME, BODY, "image/png")
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            # 서버 대신 파일 디스크립터에서 요청 구간을 읽음
+            message = dict(message, body=os.pread(message["file"], message["count"], message["offset"]))
+        messages.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": f"/uploads/{HASHED_NAME}", "raw_path": f"/uploads/{HASHED_NAME}".encode(), "root_path": "",
+        "query_string": b"", "headers": [(b"range", b"bytes=10-19")], "server": ("test", 80), "client": ("test", 1),
+        "extensions": {"http.response.zerocopysend": {}},
+    }
+    await app(scope, receive, send)
+
+    assert messages[0]["status"] == 206
+    body_types = [message["type"] for message in messages[1:]]
+    if storage.local_path(HASHED_NAME) is not None:
+        assert body_types == ["http.response.zerocopysend"]
+    else:
+        # 디스크 경로가 없는 저장소는 일반 본문 전송
+        assert body_types == ["http.response.body"]
+    assert messages[1]["body"] == BODY[10:20]
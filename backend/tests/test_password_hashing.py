@@ -0,0 +1,96 @@
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app import auth, config
+from app.database import Base
+from app.main import app
+from app.models import Team
+from app.schemas import TeamCreate
+from app.services.team_service import TeamService
+from app.utils.password_hashing import PasswordHasher, bcrypt_rounds, calibrate_rounds
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+TEAM = TeamCreate(name="Test Team", description="Test Description", type="AMATEUR", password="test123")
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+def make_request():
+    from fastapi import Request
+    return Request({
+        "type": "http", "method": "GET", "path": "/teams/1", "headers": [],
+        "query_string": b"", "scheme": "http", "server": ("test", 80)
+    })
+
+def test_calibration_picks_largest_rounds_within_target():
+    # 라운드마다 두 배: 4 → 1ms, 8 → 16ms, 9 → 32ms
+    timer = lambda rounds: 2 ** (rounds - 4) / 1000
+    rounds, table = calibrate_rounds(20, timer=timer, samples=1)
+    assert rounds == 8
+    assert table[9] == 32
+    assert 10 not in table
+
+    # 가장 낮은 라운드도 목표를 넘으면 최소 라운드 유지
+    assert calibrate_rounds(0.5, timer=timer, samples=1)[0] == 4
+
+def test_calibration_never_lowers_configured_rounds():
+    timer = lambda rounds: 2 ** (rounds - 4) / 1000
+    hasher = PasswordHasher(rounds=10)
+    # 목표(20ms)로는 8이지만 설정된 10 아래로 내리지 않음
+    assert hasher.calibrate(20, timer=timer, samples=1) == 10
+    assert min(hasher.calibration) == 10
+    # 목표가 더 크면 상향
+    assert hasher.calibrate(300, timer=timer, samples=1) == 12
+
+@pytest.mark.asyncio
+async def test_login_rehashes_weaker_hash_in_background(db_session, monkeypatch):
+    monkeypatch.setattr(auth, "password_hasher", PasswordHasher(rounds=4))
+    service = TeamService(db_session)
+    team = await service.create_team(TEAM)
+    old_hash = team.password
+    assert bcrypt_rounds(old_hash) == 4
+
+    # 비용 상향 후 로그인 → 응답은 바로, 재해싱은 해싱 풀에서
+    hasher = PasswordHasher(rounds=5)
+    monkeypatch.setattr(auth, "password_hasher", hasher)
+    token = (await service.login_team(TEAM))["access_token"]
+    hasher.shutdown()
+    stats = hasher.stats()
+    assert stats["rounds"] == 5
+    assert {(op["operation"], op["rounds"]) for op in stats["operations"]} == {("verify", 4), ("rehash", 5)}
+
+    db_session.expire_all()
+    new_hash = db_session.get(Team, team.id).password
+    assert bcrypt_rounds(new_hash) == 5
+    assert auth.verify_password(TEAM.password, new_hash)
+    assert not hasher.needs_update(new_hash)
+    # 솔트 유지 → 로그인 때 받은 토큰의 비밀번호 지문 그대로
+    assert auth.password_fingerprint(new_hash) == auth.password_fingerprint(old_hash)
+    assert (await auth.get_current_team(make_request(), token, db_session)).id == team.id
+    # 현재 라운드의 검증 평균으로 풀 처리량 추정
+    assert hasher.stats()["verify_capacity_per_second"] > 0
+
+@pytest.mark.asyncio
+async def test_admin_hashing_metrics(monkeypatch):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        monkeypatch.setattr(config, "ADMIN_TOKEN", None)
+        assert (await client.get("/admin/metrics/hashing")).status_code == 404
+
+        monkeypatch.setattr(config, "ADMIN_TOKEN", "secret")
+        assert (await client.get("/admin/metrics/hashing", headers={"X-Admin-Token": "wrong"})).status_code == 403
+        response = await client.get("/admin/metrics/hashing", headers={"X-Admin-Token": "secret"})
+        assert response.status_code == 200
+        assert response.json()["rounds"] == auth.password_hasher.rounds
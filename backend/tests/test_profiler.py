@@ -0,0 +1,115 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import pytest
+from app import config
+from app.main import app
+from app.utils.profiler import (
+    SamplingProfiler, _request_scope, _thread_endpoints, endpoint_routes, profiler, propagate_route
+)
+
+def busy_endpoint(stop):
+    while not stop.is_set():
+        busy_work()
+
+def busy_work():
+    sum(i * i for i in range(1000))
+
+def other_work(stop):
+    while not stop.is_set():
+        sum(i for i in range(1000))
+
+def run_profile(endpoints, only_tagged):
+    stop = threading.Event()
+    workers = [threading.Thread(target=busy_endpoint, args=(stop,)), threading.Thread(target=other_work, args=(stop,))]
+    for worker in workers:
+        worker.start()
+    sampler = SamplingProfiler()
+    try:
+        assert sampler.start(0.3, interval=0.002, endpoints=endpoints, only_tagged=only_tagged)
+        assert not sampler.start(1)
+        time.sleep(0.3)
+        sampler.stop()
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+    return sampler
+
+def test_samples_are_tagged_by_endpoint():
+    sampler = run_profile({busy_endpoint.__code__: "GET /busy"}, only_tagged=False)
+    assert not sampler.running
+    assert sampler.status()["samples"] > 10
+    lines = sampler.collapsed().splitlines()
+    tagged = [line for line in lines if line.startswith("[GET /busy];")]
+    assert tagged and all("busy_endpoint (test_profiler.py" in line for line in tagged)
+    assert any("busy_work" in line for line in tagged)
+    # 태그 없는 다른 스레드 스택도 수집
+    assert any("other_work" in line and not line.startswith("[") for line in lines)
+
+def test_route_filter_and_speedscope_output():
+    sampler = run_profile({busy_endpoint.__code__: "GET /busy"}, only_tagged=True)
+    profile = sampler.speedscope()
+    assert all(not line.startswith("other") and "other_work" not in line for line in sampler.collapsed().splitlines())
+    frames = [frame["name"] for frame in profile["shared"]["frames"]]
+    assert frames[0] == "[GET /busy]"
+    data = profile["profiles"][0]
+    assert data["type"] == "sampled"
+    assert len(data["samples"]) == len(data["weights"]) > 0
+    assert all(frames[stack[0]] == "[GET /busy]" for stack in data["samples"])
+
+def test_pool_work_is_tagged_with_submitting_route():
+    # 요청 안에서 풀로 넘긴 작업은 스택에 엔드포인트가 없어도 제출한 요청의 라우트로 태깅
+    token = _request_scope.set({"endpoint": busy_endpoint})
+    try:
+        task = propagate_route(other_work)
+    finally:
+        _request_scope.reset(token)
+    assert propagate_route(other_work) is other_work
+
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(task, stop)
+    sampler = SamplingProfiler()
+    try:
+        assert sampler.start(0.3, interval=0.002, endpoints={busy_endpoint.__code__: "GET /busy"}, only_tagged=True)
+        time.sleep(0.3)
+        sampler.stop()
+    finally:
+        stop.set()
+        future.result()
+        executor.shutdown()
+    lines = sampler.collapsed().splitlines()
+    assert lines and all(line.startswith("[GET /busy];") for line in lines)
+    assert any("other_work" in line for line in lines)
+    assert _thread_endpoints == {}
+
+def test_endpoint_routes_resolves_path_templates():
+    tags = endpoint_routes(app.routes, "/analytics/team/{team_id}/player-contributions")
+    assert list(tags.values()) == ["GET /analytics/team/{team_id}/player-contributions"]
+    assert endpoint_routes(app.routes, "/missing") == {}
+
+@pytest.mark.asyncio
+async def test_admin_profiler_endpoints(monkeypatch):
+    monkeypatch.setattr(config, "ADMIN_TOKEN", "secret")
+    headers = {"X-Admin-Token": "secret"}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.post("/admin/profiler/start")).status_code == 403
+        missing = await client.post("/admin/profiler/start", params={"route": "/missing"}, headers=headers)
+        assert missing.status_code == 404
+        too_long = await client.post("/admin/profiler/start", params={"duration": 3600}, headers=headers)
+        assert too_long.status_code == 400
+
+        started = await client.post("/admin/profiler/start", params={"duration": 5, "route": "/teams/{team_id}"}, headers=headers)
+        assert started.status_code == 200
+        assert "GET /teams/{team_id}" in started.json()["routes"]
+        assert (await client.post("/admin/profiler/start", headers=headers)).status_code == 409
+
+        stopped = await client.post("/admin/profiler/stop", headers=headers)
+        assert stopped.json()["running"] is False
+        collapsed = await client.get("/admin/profiler", params={"format": "collapsed"}, headers=headers)
+        assert collapsed.headers["content-type"].startswith("text/plain")
+        speedscope = (await client.get("/admin/profiler", params={"format": "speedscope"}, headers=headers)).json()
+        assert speedscope["profiles"][0]["type"] == "sampled"
+    assert not profiler.running
@@ -0,0 +1,179 @@
+import asyncio
+import re
+import pytest
+from datetime import datetime, timedelta, date
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models import Team, Player, Match, Goal, QuarterScore, match_player
+from app.schemas import (
+    TeamCreate, TeamUpdate, PlayerCreate, PlayerUpdate, MatchCreate, MatchUpdate,
+    GoalCreate, GoalBatchCreate, AnalyticsWindow
+)
+from app.services.team_service import TeamService
+from app.services.token_service import TokenService
+from app.services.player_service import PlayerService
+from app.services.match_service import MatchService
+from app.services.analytics_service import AnalyticsService
+from app.services.sync_service import SyncService
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 대용량 시드 규모 (풀 스캔이면 체감되는 크기)
+TEAMS = 40
+PLAYERS_PER_TEAM = 25
+MATCHES_PER_TEAM = 60
+
+# "SCAN 테이블"(또는 SQLAlchemy 별칭 테이블_N)만 풀 스캔으로 판정
+# (LIMIT로 제한된 서브쿼리 결과 anon_N, 상수 행 SCAN은 허용)
+SCAN_PATTERN = re.compile(r"\bSCAN (\w+)")
+TABLE_ALIAS = re.compile(r"_\d+$")
+
+@pytest.fixture(scope="module")
+def seeded_engine():
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Team), [
+            {"id": t, "name": f"Team {t}", "description": f"Team {t}", "type": "AMATEUR", "password": "x"}
+            for t in range(1, TEAMS + 1)
+        ])
+        conn.execute(insert(Player), [
+            {
+                "id": (t - 1) * PLAYERS_PER_TEAM + p, "name": f"Player {t}-{p}", "number": p,
+                "position": "FW", "team_id": t, "goal_count": 0, "assist_count": 0, "mom_count": 0
+            }
+            for t in range(1, TEAMS + 1) for p in range(1, PLAYERS_PER_TEAM + 1)
+        ])
+        matches, appearances, goals, quarters = [], [], [], []
+        for t in range(1, TEAMS + 1):
+            first_player = (t - 1) * PLAYERS_PER_TEAM + 1
+            for m in range(MATCHES_PER_TEAM):
+                match_id = (t - 1) * MATCHES_PER_TEAM + m + 1
+                our, opponent = m % 4, (m * 7) % 3
+                matches.append({
+                    "id": match_id, "team_id": t, "date": datetime(2024, 1, 1) + timedelta(days=m),
+                    "opponent": f"Opponent {m % 8}", "opponent_key": f"opponent {m % 8}", "score": f"{our}:{opponent}"
+                })
+                appearances.extend({"match_id": match_id, "player_id": first_player + p} for p in range(11))
+                goals.extend(
+                    {"match_id": match_id, "player_id": first_player + g, "assist_player_id": first_player + g + 1, "quarter": g % 4 + 1}
+                    for g in range(our)
+                )
+                quarters.extend(
+                    {"match_id": match_id, "quarter": q, "our_score": 0, "opponent_score": 0} for q in range(1, 5)
+                )
+        conn.execute(insert(Match), matches)
+        conn.execute(insert(match_player), appearances)
+        conn.execute(insert(Goal), goals)
+        conn.execute(insert(QuarterScore), quarters)
+        conn.execute(text("ANALYZE"))
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def captured_queries(seeded_engine):
+    """실행된 SQL 문과 파라미터 수집"""
+    queries = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            queries.append((statement, parameters))
+
+    event.listen(seeded_engine, "before_cursor_execute", capture)
+    yield queries
+    event.remove(seeded_engine, "before_cursor_execute", capture)
+
+def full_scans(queries):
+    """EXPLAIN QUERY PLAN 결과에서 테이블 풀 스캔(SCAN 테이블) 찾기"""
+    offenders = {}
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for statement, parameters in queries:
+            plan = cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            for row in plan:
+                detail = row[-1]
+                match = SCAN_PATTERN.search(detail)
+                if match and TABLE_ALIAS.sub("", match.group(1)) in Base.metadata.tables:
+                    offenders.setdefault(" ".join(statement.split()), []).append(detail)
+    finally:
+        raw.close()
+    return offenders
+
+def assert_no_full_scans(queries):
+    assert queries, "no queries captured"
+    offenders = full_scans(queries)
+    assert offenders == {}, "\n".join(f"{plans}: {statement}" for statement, plans in offenders.items())
+
+def test_team_service_query_plans(captured_queries):
+    db = TestingSessionLocal()
+    try:
+        service = TeamService(db)
+        team = service.get_team(1)
+        asyncio.run(service.create_team(TeamCreate(name="New Team", description="d", type="AMATEUR", password="pw")))
+        tokens = asyncio.run(service.login_team(TeamCreate(name="New Team", description="d", type="AMATEUR", password="pw")))
+        TokenService(db).refresh(tokens["refresh_token"])
+        service.update_team(1, TeamUpdate(description="updated"), team)
+        new_team = db.query(Team).filter(Team.name == "New Team").first()
+        service.delete_team(new_team.id, new_team)
+    finally:
+        db.close()
+    assert_no_full_scans(captured_queries)
+
+def test_player_service_query_plans(captured_queries):
+    db = TestingSessionLocal()
+    try:
+        team = db.get(Team, 2)
+        service = PlayerService(db)
+        service.get_team_players(2, team)
+        player = service.create_player(PlayerCreate(name="New", number=99, position="DF", team_id=2), team)
+        service.get_player(player.id, team)
+        service.update_player(player.id, PlayerUpdate(name="Renamed"), team)
+        service.update_player_stats(player.id, PlayerUpdate(goal_count=1), team)
+        service.delete_player(player.id, team)
+    finally:
+        db.close()
+    assert_no_full_scans(captured_queries)
+
+def test_match_service_query_plans(captured_queries):
+    db = TestingSessionLocal()
+    try:
+        team = db.get(Team, 3)
+        player_ids = [p.id for p in db.query(Player).filter(Player.team_id == 3).limit(11)]
+        service = MatchService(db, team)
+        service.get_team_matches(3, team)
+        service.get_recent_matches(3, team)
+        match = service.create_match(MatchCreate(
+            date=date(2024, 6, 1), opponent="Opponent 1", score="2:1", team_id=3, player_ids=player_ids,
+            quarter_scores=[{"quarter": 1, "our_score": 2, "opponent_score": 1}]
+        ), team)
+        service.add_goal(match.id, GoalCreate(match_id=match.id, player_id=player_ids[0], assist_player_id=player_ids[1], quarter=1), team)
+        service.add_goals_batch(match.id, GoalBatchCreate(goals=[{"player_id": player_ids[1], "quarter": 2}]), team)
+        service.get_match_detail(match.id)
+        service.update_match(match.id, MatchUpdate(score="3:1", opponent="Opponent 2"), team)
+        service.delete_match(match.id, team)
+        service.rebuild_opponent_records(3)
+        SyncService(db).changes_since(3, 0, team)
+    finally:
+        db.close()
+    assert_no_full_scans(captured_queries)
+
+@pytest.mark.parametrize("use_engine", [True, False])
+def test_analytics_service_query_plans(captured_queries, use_engine):
+    db = TestingSessionLocal()
+    try:
+        service = AnalyticsService(db, use_engine=use_engine)
+        for window in (None, AnalyticsWindow(last_n=10), AnalyticsWindow(date_from=date(2024, 1, 10), date_to=date(2024, 2, 10))):
+            service.get_team_analytics_overview(4, window)
+            service.get_goals_win_correlation(4, window)
+            service.get_conceded_loss_correlation(4, window)
+            service.get_player_contributions(4, window)
+            service.get_opponent_records(4, None, window)
+            service.get_opponent_records(4, "Opponent 1", window)
+            service.get_rolling_form(4, 5, window)
+    finally:
+        db.close()
+    assert_no_full_scans(captured_queries)
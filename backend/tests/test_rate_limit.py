@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import pytest
+import pytest_asyncio
+import httpx
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.auth import create_access_token, get_password_hash
+from app.database import Base, get_db
+from app.main import app
+from app.models import Team
+from app.utils import rate_limit
+from app.utils.rate_limit import (
+    RateLimiter, MemoryBucketStore, SQLiteBucketStore, AdmissionControlMiddleware, route_cost
+)
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    limiter = RateLimiter("test", rate=2, burst=4, store=MemoryBucketStore(), clock=clock)
+    for _ in range(4):
+        limiter.hit("a")
+    with pytest.raises(HTTPException) as exc_info:
+        limiter.hit("a")
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers["Retry-After"] == "1"
+
+    # 다른 키는 별도 버킷
+    limiter.hit("b")
+
+    clock.now += 1.0  # 2개 충전
+    limiter.hit("a", cost=2)
+    with pytest.raises(HTTPException):
+        limiter.hit("a")
+
+    # 비용이 큰 요청은 그만큼 오래 기다려야 함
+    with pytest.raises(HTTPException) as exc_info:
+        limiter.hit("a", cost=4)
+    assert exc_info.value.headers["Retry-After"] == "2"
+
+def test_route_cost_weights():
+    assert route_cost("GET", "/analytics/team/{team_id}/player-contributions") == 10
+    assert route_cost("GET", "/analytics/team/{team_id}/overview") == 5
+    assert route_cost("GET", "/players/team/{team_id}") == 1
+    assert route_cost("POST", "/matches/create") == 2
+
+def test_sqlite_store_is_shared_between_limiters(tmp_path):
+    """워커 프로세스마다 limiter가 따로 있어도 같은 버킷을 공유"""
+    path = str(tmp_path / "buckets.db")
+    clock = FakeClock()
+    first = RateLimiter("team", rate=1, burst=3, store=SQLiteBucketStore(path), clock=clock)
+    second = RateLimiter("team", rate=1, burst=3, store=SQLiteBucketStore(path), clock=clock)
+    first.hit(1)
+    second.hit(1)
+    first.hit(1)
+    with pytest.raises(HTTPException):
+        second.hit(1)
+
+@pytest.mark.asyncio
+async def test_sqlite_store_runs_off_the_event_loop(tmp_path, monkeypatch):
+    """파일 잠금을 기다리는 저장소는 스레드풀에서, 메모리 저장소는 이벤트 루프에서 바로 실행"""
+    monkeypatch.setattr(rate_limit.config, "RATE_LIMIT_ENABLED", True)
+    threads = []
+    for store in (SQLiteBucketStore(str(tmp_path / "buckets.db")), MemoryBucketStore()):
+        take = store.take
+        def recording_take(*args, take=take):
+            threads.append(threading.get_ident())
+            return take(*args)
+        monkeypatch.setattr(store, "take", recording_take)
+        await RateLimiter("team", rate=1, burst=3, store=store).hit_async(1)
+    assert threads[0] != threading.get_ident()
+    assert threads[1] == threading.get_ident()
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest_asyncio.fixture
+async def client(db_session, monkeypatch):
+    store = MemoryBucketStore()
+    monkeypatch.setattr(rate_limit, "team_limiter", RateLimiter("team", rate=0.001, burst=20, store=store))
+    monkeypatch.setattr(rate_limit, "login_limiter", RateLimiter("login", rate=0.001, burst=3, store=store))
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+@pytest.mark.asyncio
+async def test_team_requests_are_weighted_by_route_cost(client, db_session):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    other = Team(name="Other Team", description="Other", type="AMATEUR")
+    db_session.add_all([team, other])
+    db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(team.id)})}"}
+
+    # 버킷 20 = 가장 비싼 분석 라우트(10) 2번
+    for _ in range(2):
+        response = await client.get(f"/analytics/team/{team.id}/player-contributions", headers=headers)
+        assert response.status_code == 200
+    response = await client.get(f"/analytics/team/{team.id}/player-contributions", headers=headers)
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) > 0
+    response = await client.get(f"/players/team/{team.id}", headers=headers)
+    assert response.status_code == 429
+
+    # 다른 팀은 영향 없음
+    other_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(other.id)})}"}
+    response = await client.get(f"/players/team/{other.id}", headers=other_headers)
+    assert response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_login_is_limited_per_ip(client, db_session):
+    db_session.add(Team(name="Test Team", description="d", type="AMATEUR", password=get_password_hash("secret")))
+    db_session.commit()
+    body = {"name": "Test Team", "description": "d", "type": "AMATEUR", "password": "wrong"}
+    statuses = [(await client.post("/teams/login", json=body)).status_code for _ in range(4)]
+    assert statuses[:3] == [401, 401, 401]
+    assert statuses[3] == 429
+
+@pytest.mark.asyncio
+async def test_admission_control_sheds_excess_load():
+    release = asyncio.Event()
+    test_app = FastAPI()
+
+    @test_app.get("/slow")
+    async def slow():
+        await release.wait()
+        return {"ok": True}
+
+    admission = AdmissionControlMiddleware(test_app, max_concurrent=2, max_queue=1, queue_timeout=0.2)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=admission), base_url="http://test") as client:
+        tasks = [asyncio.create_task(client.get("/slow")) for _ in range(5)]
+        # 2개 처리 중, 1개 대기, 2개는 대기열이 가득 차 즉시 503
+        await asyncio.sleep(0.05)
+        assert admission.stats() == {"in_flight": 2, "waiting": 1, "shed": 2}
+        # 대기 중인 요청은 queue_timeout 후 503
+        await asyncio.sleep(0.3)
+        release.set()
+        responses = await asyncio.gather(*tasks)
+
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses == [200, 200, 503, 503, 503]
+    assert all(response.headers["retry-after"] == "1" for response in responses if response.status_code == 503)
+    assert admission.stats() == {"in_flight": 0, "waiting": 0, "shed": 3}
@@ -0,0 +1,99 @@
+import pytest
+from app.services.search_service import SearchService
+from app.services.match_service import MatchService
+from app.models import Team, Player
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from datetime import date
+from app.schemas import MatchCreate
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def test_teams(db_session):
+    teams = [
+        Team(name="서울 유나이티드", description="주말 조기축구회", type="AMATEUR"),
+        Team(name="부산 FC", description="서울 유나이티드 라이벌", type="AMATEUR")
+    ]
+    db_session.add_all(teams)
+    db_session.commit()
+    db_session.add_all([
+        Player(name="김민준", team_id=teams[0].id, position="FW", number=9),
+        Player(name="김민서", team_id=teams[0].id, position="MF", number=8),
+        Player(name="김민준호", team_id=teams[1].id, position="DF", number=4)
+    ])
+    db_session.commit()
+    MatchService(db_session, teams[0]).create_match(MatchCreate(
+        date=date(2024, 1, 1), opponent="강남 레인저스", score="2:1",
+        team_id=teams[0].id, player_ids=[], quarter_scores=[]
+    ), teams[0])
+    return teams
+
+def test_search_teams(db_session, test_teams):
+    service = SearchService(db_session)
+    
+    # 이름 일치가 설명 일치보다 먼저
+    result = service.search("유나이티드", kinds=["team"])
+    assert [r.title for r in result.results] == ["서울 유나이티드", "부산 FC"]
+    
+    # 3글자 미만은 이름 접두어 검색
+    result = service.search("부산", kinds=["team"])
+    assert [r.title for r in result.results] == ["부산 FC"]
+
+def test_search_team_scope(db_session, test_teams):
+    service = SearchService(db_session)
+    team = test_teams[0]
+    
+    # 다른 팀 선수(김민준호)는 검색되지 않음
+    result = service.search("김민준", team.id, ["player"])
+    assert [r.title for r in result.results] == ["김민준"]
+    
+    # 3글자 미만은 이름 접두어 검색
+    result = service.search("김민", team.id, ["player"])
+    assert sorted(r.title for r in result.results) == ["김민서", "김민준"]
+    
+    result = service.search("레인저스", team.id, ["opponent"])
+    assert [r.title for r in result.results] == ["강남 레인저스"]
+    assert service.search("레인저스", test_teams[1].id, ["opponent"]).results == []
+
+def test_search_kind_filter_applies_before_limit(db_session, test_teams):
+    service = SearchService(db_session)
+    team = test_teams[0]
+    # 같은 범위에서 더 높은 순위의 선수 결과가 많아도 요청한 종류는 빠지지 않음
+    db_session.add_all([
+        Player(name=f"레인저스 {n}", team_id=team.id, position="FW", number=n) for n in range(1, 6)
+    ])
+    db_session.commit()
+    
+    result = service.search("레인저스", team.id, ["opponent"], limit=1)
+    assert [r.title for r in result.results] == ["강남 레인저스"]
+    result = service.search("레인저스", team.id, ["player"], limit=3)
+    assert [r.kind for r in result.results] == ["player"] * 3
+
+def test_search_index_sync(db_session, test_teams):
+    service = SearchService(db_session)
+    team = test_teams[0]
+    player = db_session.query(Player).filter(Player.name == "김민서").first()
+    
+    player.name = "박지성"
+    db_session.commit()
+    assert [r.id for r in service.search("박지성", team.id).results] == [player.id]
+    assert service.search("김민서", team.id).results == []
+    
+    db_session.delete(player)
+    db_session.commit()
+    assert service.search("박지성", team.id).results == []
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.auth import get_current_team
+from app.database import Base, get_db
+from app.main import app
+from app.models import Team, Player
+from app.services.analytics_service import AnalyticsService
+from app.utils.cache import analytics_cache
+from app.utils.single_flight import SingleFlight, request_coalescer
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+CALLERS = 8
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+def test_threads_share_one_computation():
+    flight = SingleFlight(timeout=5)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        wait_for(lambda: flight.followers == CALLERS - 1)
+        return {"value": 42}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", compute))) for _ in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [{"value": 42}] * CALLERS
+    assert flight.stats() == {"in_flight": 0, "leaders": 1, "followers": CALLERS - 1, "timeouts": 0}
+
+@pytest.mark.asyncio
+async def test_coroutines_share_result_and_error():
+    flight = SingleFlight(timeout=5)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(flight.do_async("key", compute) for _ in range(CALLERS)), return_exceptions=True)
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    # 완료된 계산은 보관하지 않음 - 다음 호출은 새로 계산
+    with pytest.raises(ValueError):
+        await flight.do_async("key", compute)
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_wait_is_bounded():
+    flight = SingleFlight(timeout=0.05)
+    release = asyncio.Event()
+    calls = []
+
+    async def slow():
+        calls.append("slow")
+        await release.wait()
+        return "slow"
+
+    async def fast():
+        calls.append("fast")
+        return "fast"
+
+    leader = asyncio.create_task(flight.do_async("key", slow))
+    await asyncio.sleep(0)
+    # 대기 상한을 넘기면 직접 계산
+    assert await flight.do_async("key", fast) == "fast"
+    assert flight.timeouts == 1
+    release.set()
+    assert await leader == "slow"
+
+@pytest_asyncio.fixture
+async def analytics_client(db_session):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    db_session.add_all(Player(name=f"Player {i}", team_id=team.id, position="FW", number=i) for i in range(3))
+    db_session.commit()
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_team] = lambda: team
+    analytics_cache.clear()
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client, team
+    finally:
+        app.dependency_overrides.clear()
+        analytics_cache.clear()
+
+@pytest.mark.asyncio
+async def test_concurrent_analytics_requests_compute_once(analytics_client, monkeypatch):
+    client, team = analytics_client
+    original = AnalyticsService.get_player_contributions
+    calls = []
+    followers_before = request_coalescer.followers
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        # 나머지 요청이 모두 진행 중인 계산에 합류할 때까지 계산을 붙잡아 둠
+        wait_for(lambda: request_coalescer.followers - followers_before >= CALLERS - 1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(AnalyticsService, "get_player_contributions", counting)
+    url = f"/analytics/team/{team.id}/player-contributions?last_n=5"
+    responses = await asyncio.gather(*(client.get(url) for _ in range(CALLERS)))
+    assert [response.status_code for response in responses] == [200] * CALLERS
+    assert len({response.content for response in responses}) == 1
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_request_after_invalidation_does_not_join_stale_computation(analytics_client, monkeypatch):
+    client, team = analytics_client
+    original = AnalyticsService.get_player_contributions
+    calls = []
+    release = threading.Event()
+    followers_before = request_coalescer.followers
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            # 무효화 이전에 시작한 계산
+            release.wait(5)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(AnalyticsService, "get_player_contributions", counting)
+    url = f"/analytics/team/{team.id}/player-contributions"
+    leader = asyncio.create_task(client.get(url))
+    await asyncio.to_thread(wait_for, lambda: len(calls) == 1)
+    analytics_cache.invalidate_team(team.id)
+
+    # 무효화 이후 요청은 진행 중인 계산을 기다리지 않고 새로 계산해 캐시에 저장
+    assert (await client.get(url)).status_code == 200
+    release.set()
+    assert (await leader).status_code == 200
+    assert len(calls) == 2
+    assert request_coalescer.followers == followers_before
+    assert (await client.get(url)).status_code == 200
+    assert len(calls) == 2
@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 콜드 스타트 예산 (인터프리터 기동 + app.main 임포트, CI 편차 감안)
+COLD_START_BUDGET_SECONDS = 3.0
+
+# 요청 경로에서만 필요한 무거운 모듈 - 임포트 시점에 로드되면 안 됨
+LAZY_MODULES = ["jose", "passlib", "numpy", "aiofiles", "alembic"]
+
+COLD_START_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+def run_cold_start(tmp_path):
+    db_path = tmp_path / "startup.db"
+    env = dict(os.environ, MYFC_DATABASE_URL=f"sqlite:///{db_path}")
+    env.pop("MYFC_AUTO_CREATE_SCHEMA", None)
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    return db_path, json.loads(result.stdout.strip().splitlines()[-1])
+
+def test_cold_start_budget(tmp_path):
+    db_path, report = run_cold_start(tmp_path)
+
+    assert report["elapsed"] < COLD_START_BUDGET_SECONDS
+    # 임포트만으로 DB 파일이 생성/변경되지 않음
+    assert not db_path.exists()
+
+def test_heavy_modules_loaded_lazily(tmp_path):
+    _, report = run_cold_start(tmp_path)
+    loaded = set(report["modules"])
+
+    for module in LAZY_MODULES:
+        assert module not in loaded, f"{module} is imported at startup"
+
+def test_lifespan_creates_schema_when_enabled(tmp_path):
+    db_path = tmp_path / "lifespan.db"
+    env = dict(os.environ, MYFC_DATABASE_URL=f"sqlite:///{db_path}", MYFC_AUTO_CREATE_SCHEMA="1")
+    script = (
+        "import asyncio\n"
+        "from app.main import app\n"
+        "async def start():\n"
+        "    async with app.router.lifespan_context(app):\n"
+        "        pass\n"
+        "asyncio.run(start())\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=BACKEND_DIR, env=env, check=True)
+
+    assert db_path.exists()
+
+def test_init_db_rebuilds_missing_team_records(tmp_path):
+    db_path = tmp_path / "records.db"
+    env = dict(os.environ, MYFC_DATABASE_URL=f"sqlite:///{db_path}")
+    script = (
+        "from app.database import engine, init_db\n"
+        "init_db()\n"
+        "with engine.begin() as conn:\n"
+        "    conn.exec_driver_sql(\"INSERT INTO teams (id, name, type) VALUES (1, 'A', 'AMATEUR')\")\n"
+        "    conn.exec_driver_sql(\"INSERT INTO matches (date, opponent, score, team_id) VALUES ('2024-01-01', 'B', '0:1', 1)\")\n"
+        "init_db()\n"
+        "with engine.connect() as conn:\n"
+        "    print(conn.exec_driver_sql('SELECT matches, losses, win_rate FROM team_records').all())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+
+    # 기존 경기가 통산 전적에 반영됨 (첫 새 경기로 1전 1승이 되지 않음)
+    assert result.stdout.strip().splitlines()[-1] == "[(1, 1, 0.0)]"
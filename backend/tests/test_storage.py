@@ -0,0 +1,190 @@
+import asyncio
+import functools
+import io
+import os
+import pytest
+from fastapi import UploadFile, HTTPException
+from starlette.datastructures import Headers
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models import Team
+from app.services.team_service import TeamService
+from app.utils import storage as storage_module
+from app.utils.file_handler import save_upload_file, delete_file
+from app.utils.storage import LocalStorage, ObjectStoreStorage, OrphanCleaner, StorageBackend, referenced_names
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"logo" * 100
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture(params=["local", "object"])
+def storage(request, tmp_path, monkeypatch):
+    """업로드 저장소/정리기를 임시 디렉터리 기반으로 교체"""
+    if request.param == "local":
+        backend = LocalStorage(str(tmp_path / "uploads"), max_workers=2)
+    else:
+        backend = ObjectStoreStorage(str(tmp_path / "objects"), max_workers=2, batch_size=2)
+    monkeypatch.setattr(storage_module, "_storage", backend)
+    monkeypatch.setattr(storage_module, "_cleaner", make_cleaner(backend))
+    yield backend
+    backend.shutdown()
+
+def make_cleaner(backend: StorageBackend) -> OrphanCleaner:
+    """워커 하나의 정리기 - 삭제 직전 참조 확인은 테스트 DB로"""
+    return OrphanCleaner(backend, referenced=functools.partial(referenced_names, TestingSessionLocal, backend))
+
+def make_upload(data: bytes, content_type: str = "image/png", filename: str = "logo.png") -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), filename=filename, headers=Headers({"content-type": content_type}))
+
+@pytest.mark.asyncio
+async def test_save_is_content_addressed(storage):
+    url = await save_upload_file(make_upload(PNG), 1, "logo")
+    name = url.rsplit("/", 1)[1]
+    assert url.startswith("/uploads/1_logo_") and name.endswith(".png")
+
+    # 같은 내용은 같은 이름, 다른 내용은 다른 이름
+    assert await save_upload_file(make_upload(PNG, filename="other.gif"), 1, "logo") == url
+    assert await save_upload_file(make_upload(PNG + b"x"), 1, "logo") != url
+
+    stored = await storage.stat(name)
+    assert stored.size == len(PNG)
+    assert await storage.read(name) == PNG
+    assert await storage.read(name, 0, 7) == PNG[:8]
+
+    assert await delete_file(url) is True
+    assert await storage.exists(name) is False
+    assert await delete_file(url) is False
+
+@pytest.mark.asyncio
+async def test_upload_validation(storage):
+    with pytest.raises(HTTPException) as exc_info:
+        await save_upload_file(make_upload(b"text", "text/plain"), 1, "logo")
+    assert exc_info.value.status_code == 400
+    with pytest.raises(HTTPException) as exc_info:
+        await save_upload_file(make_upload(b"x" * (5 * 1024 * 1024 + 1)), 1, "logo")
+    assert exc_info.value.status_code == 400
+    assert await storage.list_names() == []
+
+@pytest.mark.asyncio
+async def test_invalid_names_are_rejected(storage):
+    for name in ("../escape.png", "a/b.png", ".hidden", ""):
+        with pytest.raises(ValueError):
+            await storage.save(name, b"x")
+
+def test_incomplete_backend_fails_at_construction():
+    class ReadOnlyStorage(StorageBackend):
+        async def stat(self, name):
+            return None
+
+    with pytest.raises(TypeError):
+        ReadOnlyStorage()
+
+@pytest.mark.asyncio
+async def test_object_store_batches_deletes(tmp_path):
+    backend = ObjectStoreStorage(str(tmp_path), max_workers=2, batch_size=2)
+    for i in range(5):
+        await backend.save(f"{i}.png", b"x", "image/png")
+    assert (await backend.stat("0.png")).content_type == "image/png"
+
+    backend.request_count = 0
+    assert await backend.delete_many(f"{i}.png" for i in range(5)) == 5
+    # 5개 키 / 배치 2 = 3번의 일괄 삭제 요청
+    assert backend.request_count == 3
+    assert await backend.list_names() == []
+    backend.shutdown()
+
+@pytest.mark.asyncio
+async def test_replaced_and_deleted_team_files_are_cleaned(db_session, storage):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    service = TeamService(db_session)
+    cleaner = storage_module.get_orphan_cleaner()
+
+    first = (await service.upload_logo(team.id, make_upload(PNG), team))["file_path"]
+    # 같은 파일 재업로드는 현재 로고를 삭제 대상으로 만들지 않음
+    await service.upload_logo(team.id, make_upload(PNG), team)
+    assert cleaner.pending == 0
+
+    second = (await service.upload_logo(team.id, make_upload(PNG + b"2"), team))["file_path"]
+    image = (await service.upload_image(team.id, make_upload(PNG + b"img"), team))["file_path"]
+    # 교체된 로고와 그 압축 변형(.gz/.br)이 삭제 대상
+    assert cleaner.pending == 3
+    assert await cleaner.flush() == 1
+    assert sorted(await storage.list_names()) == sorted(os.path.basename(url) for url in (second, image))
+    assert first not in (second, image)
+
+    service.delete_team(team.id, team)
+    assert cleaner.pending == 6
+    assert await cleaner.flush() == 2
+    assert await storage.list_names() == []
+
+@pytest.mark.asyncio
+async def test_reuploaded_file_is_not_deleted(db_session, storage):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    service = TeamService(db_session)
+    cleaner = storage_module.get_orphan_cleaner()
+
+    first = (await service.upload_logo(team.id, make_upload(PNG), team))["file_path"]
+    await service.upload_logo(team.id, make_upload(PNG + b"2"), team)
+    # 정리 전에 처음 로고를 다시 업로드 → 삭제 대기에서 제외
+    assert (await service.upload_logo(team.id, make_upload(PNG), team))["file_path"] == first
+    await cleaner.flush()
+    assert await storage.exists(os.path.basename(first))
+
+    # 삭제가 진행 중이면 끝난 뒤에 저장
+    cleaner.schedule([os.path.basename(first)])
+    flushing = asyncio.ensure_future(cleaner.flush())
+    await asyncio.sleep(0)
+    await save_upload_file(make_upload(PNG), team.id, "logo")
+    await flushing
+    assert await storage.exists(os.path.basename(first))
+
+@pytest.mark.asyncio
+async def test_reupload_on_another_worker_is_not_deleted(db_session, storage, monkeypatch):
+    """삭제 대기 목록은 워커마다 따로 있어 다른 워커의 재업로드는 cancel이 닿지 않음"""
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    service = TeamService(db_session)
+    worker_a = storage_module.get_orphan_cleaner()
+    worker_b = make_cleaner(storage)
+
+    first = (await service.upload_logo(team.id, make_upload(PNG), team))["file_path"]
+    second = (await service.upload_logo(team.id, make_upload(PNG + b"2"), team))["file_path"]
+    assert worker_a.pending == 3
+
+    # 워커 B가 처음 로고를 다시 업로드하고 커밋 - 워커 A는 모름
+    monkeypatch.setattr(storage_module, "_cleaner", worker_b)
+    await service.upload_logo(team.id, make_upload(PNG), team)
+    assert worker_a.pending == 3
+    assert await worker_a.flush() == 0
+    assert await storage.exists(os.path.basename(first))
+
+    # 커밋 전이라 DB는 아직 참조하지 않지만 삭제 대상이 된 뒤 다시 저장된 파일
+    worker_a.schedule([os.path.basename(second)])
+    await asyncio.sleep(0.05)
+    await save_upload_file(make_upload(PNG + b"2"), team.id, "logo")
+    assert await worker_a.flush() == 0
+    assert await storage.exists(os.path.basename(second))
+
+    # 어느 워커도 다시 쓰지 않은 파일은 그대로 삭제
+    worker_a.schedule([os.path.basename(second)])
+    assert await worker_a.flush() == 1
+    assert not await storage.exists(os.path.basename(second))
@@ -0,0 +1,142 @@
+import httpx
+import pytest
+from datetime import date
+from app import auth
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, get_db
+from app.main import app
+from app.models import ChangeLog, Team, Player
+from app.schemas import TeamUpdate
+from app.services.team_service import TeamService
+from app.schemas import GoalCreate, MatchCreate, PlayerCreate, PlayerUpdate, SyncResponse
+from app.services.match_service import MatchService
+from app.services.player_service import PlayerService
+from app.services.sync_service import SyncService
+from fastapi import HTTPException
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def test_team(db_session):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    return team
+
+@pytest.fixture
+def test_players(db_session, test_team):
+    service = PlayerService(db_session)
+    return [
+        service.create_player(PlayerCreate(name=f"Player {n}", number=n, position="FW", team_id=test_team.id), test_team)
+        for n in (1, 2)
+    ]
+
+def sync(db_session, team, since=0, **kwargs):
+    return SyncResponse.model_validate(SyncService(db_session).changes_since(team.id, since, team, **kwargs))
+
+def create_match(db_session, team, players):
+    return MatchService(db_session, team).create_match(MatchCreate(
+        date=date(2024, 1, 1), opponent="Team A", score="1:0", team_id=team.id,
+        player_ids=[p.id for p in players], quarter_scores=[{"quarter": 1, "our_score": 1, "opponent_score": 0}]
+    ), team)
+
+def test_initial_sync_returns_everything(db_session, test_team, test_players):
+    match = create_match(db_session, test_team, test_players)
+    result = sync(db_session, test_team)
+    assert result.team.id == test_team.id
+    assert [p.name for p in result.players] == ["Player 1", "Player 2"]
+    assert [m.id for m in result.matches] == [match.id]
+    assert [p.id for p in result.matches[0].players] == [p.id for p in test_players]
+    assert result.matches[0].quarter_scores["1"].our_score == 1
+    assert result.version > 0 and not result.has_more
+
+    # 변경이 없으면 빈 응답, 버전 그대로
+    empty = sync(db_session, test_team, result.version)
+    assert (empty.version, empty.team, empty.players, empty.matches) == (result.version, None, [], [])
+
+def test_delta_contains_only_changes(db_session, test_team, test_players):
+    match = create_match(db_session, test_team, test_players)
+    version = sync(db_session, test_team).version
+
+    PlayerService(db_session).update_player(test_players[1].id, PlayerUpdate(name="Renamed"), test_team)
+    delta = sync(db_session, test_team, version)
+    assert [p.name for p in delta.players] == ["Renamed"]
+    assert delta.matches == [] and delta.team is None
+    version = delta.version
+
+    # 골 추가 → 경기(상세)와 득점 선수 통계 변경
+    MatchService(db_session, test_team).add_goal(
+        match.id, GoalCreate(match_id=match.id, player_id=test_players[0].id, quarter=1), test_team
+    )
+    delta = sync(db_session, test_team, version)
+    assert [m.id for m in delta.matches] == [match.id]
+    assert len(delta.matches[0].goals) == 1
+    assert [p.goal_count for p in delta.players] == [1]
+    version = delta.version
+
+    # 삭제는 tombstone으로
+    PlayerService(db_session).delete_player(test_players[1].id, test_team)
+    MatchService(db_session, test_team).delete_match(match.id, test_team)
+    delta = sync(db_session, test_team, version)
+    assert delta.deleted.players == [test_players[1].id]
+    assert delta.deleted.matches == [match.id]
+    assert match.id not in [m.id for m in delta.matches]
+
+def test_log_keeps_one_row_per_entity_and_pages(db_session, test_team, test_players):
+    for goals in range(3):
+        PlayerService(db_session).update_player_stats(test_players[0].id, PlayerUpdate(goal_count=goals), test_team)
+    rows = db_session.query(ChangeLog).filter(ChangeLog.entity == "player").all()
+    assert sorted(row.entity_id for row in rows) == [p.id for p in test_players]
+    # 삭제 후 재삽입돼도 버전은 계속 증가
+    assert max(row.id for row in rows) == max(row.id for row in db_session.query(ChangeLog))
+
+    first = sync(db_session, test_team, limit=2)
+    assert first.has_more
+    rest = sync(db_session, test_team, first.version, limit=2)
+    assert not rest.has_more
+    assert len(first.players) + len(rest.players) == 2
+
+def test_sync_other_team_forbidden(db_session, test_team):
+    other = Team(name="Other", description="", type="AMATEUR")
+    db_session.add(other)
+    db_session.commit()
+    with pytest.raises(HTTPException) as exc_info:
+        SyncService(db_session).changes_since(other.id, 0, test_team)
+    assert exc_info.value.status_code == 403
+
+@pytest.mark.asyncio
+async def test_sync_over_http_returns_team_row(db_session, test_team, test_players):
+    # 실제 인증 의존성(TeamPrincipal 반환)을 거쳐도 팀 전체 정보가 응답에 포함
+    token = auth.create_access_token({"sub": str(test_team.id)})
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test",
+            headers={"Authorization": f"Bearer {token}"}
+        ) as client:
+            response = await client.get(f"/sync/team/{test_team.id}", params={"since": 0})
+            assert response.status_code == 200
+            body = response.json()
+            assert body["team"]["description"] == "Test Description"
+            assert len(body["players"]) == 2
+
+            TeamService(db_session).update_team(test_team.id, TeamUpdate(description="Edited"), test_team)
+            response = await client.get(f"/sync/team/{test_team.id}", params={"since": body["version"]})
+            assert response.status_code == 200
+            assert response.json()["team"]["description"] == "Edited"
+    finally:
+        app.dependency_overrides.clear()
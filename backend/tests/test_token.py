@@ -0,0 +1,112 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app import auth
+from app.database import Base
+from app.models import RefreshToken
+from app.schemas import TeamCreate, TeamUpdate
+from app.services.team_service import TeamService
+from app.services.token_service import TokenService
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+TEAM = TeamCreate(name="Test Team", description="Test Description", type="AMATEUR", password="test123")
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+def assert_rejected(service: TokenService, refresh_token: str):
+    with pytest.raises(HTTPException) as exc_info:
+        service.refresh(refresh_token)
+    assert exc_info.value.status_code == 401
+
+@pytest.mark.asyncio
+async def test_login_issues_refresh_token(db_session):
+    service = TeamService(db_session)
+    team = await service.create_team(TEAM)
+    tokens = await service.login_team(TEAM)
+    assert tokens["token_type"] == "bearer"
+    assert tokens["expires_in"] == auth.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    assert auth.decode_access_token(tokens["access_token"]).team_id == team.id
+
+    # 원문 토큰은 저장하지 않음
+    record = db_session.query(RefreshToken).one()
+    assert record.team_id == team.id
+    assert tokens["refresh_token"].encode() not in record.token_hash
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_and_detects_reuse(db_session):
+    team_service = TeamService(db_session)
+    await team_service.create_team(TEAM)
+    tokens = await team_service.login_team(TEAM)
+    service = TokenService(db_session)
+
+    rotated = service.refresh(tokens["refresh_token"])
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    assert auth.decode_access_token(rotated["access_token"]).team_id == 1
+    latest = service.refresh(rotated["refresh_token"])
+
+    # 이미 사용한 토큰 재사용 → 같은 세션(family) 전체 폐기
+    assert_rejected(service, tokens["refresh_token"])
+    assert_rejected(service, latest["refresh_token"])
+
+    # 다른 로그인 세션은 영향 없음
+    other = await team_service.login_team(TEAM)
+    service.refresh(other["refresh_token"])
+
+@pytest.mark.asyncio
+async def test_logout_expiry_and_password_change(db_session):
+    team_service = TeamService(db_session)
+    team = await team_service.create_team(TEAM)
+    service = TokenService(db_session)
+
+    tokens = await team_service.login_team(TEAM)
+    service.revoke(tokens["refresh_token"])
+    assert_rejected(service, tokens["refresh_token"])
+    assert_rejected(service, "not-a-token")
+
+    tokens = await team_service.login_team(TEAM)
+    db_session.query(RefreshToken).update({"expires_at": datetime.utcnow() - timedelta(seconds=1)})
+    db_session.commit()
+    assert_rejected(service, tokens["refresh_token"])
+
+    first = await team_service.login_team(TEAM)
+    second = await team_service.login_team(TEAM)
+    team_service.update_team(team.id, TeamUpdate(password="changed"), team)
+    assert_rejected(service, first["refresh_token"])
+    assert_rejected(service, second["refresh_token"])
+
+@pytest.mark.asyncio
+async def test_deleted_team_tokens_do_not_carry_over_to_reused_id(db_session):
+    team_service = TeamService(db_session)
+    team = await team_service.create_team(TEAM)
+    tokens = await team_service.login_team(TEAM)
+    team_service.delete_team(team.id, team)
+    assert db_session.query(RefreshToken).count() == 0
+
+    # 삭제된 팀의 ID를 새 팀이 재사용해도 이전 토큰은 거부
+    other = await team_service.create_team(TeamCreate(name="Team B", description="d", type="AMATEUR", password="b"))
+    assert other.id == team.id
+    assert_rejected(TokenService(db_session), tokens["refresh_token"])
+
+@pytest.mark.asyncio
+async def test_refresh_rejects_token_older_than_team(db_session):
+    team_service = TeamService(db_session)
+    team = await team_service.create_team(TEAM)
+    tokens = await team_service.login_team(TEAM)
+    # 행이 남아 있더라도 (CASCADE 미적용 DB) 토큰보다 나중에 생긴 팀이면 거부
+    db_session.query(RefreshToken).update({"created_at": team.created_at - timedelta(days=1)})
+    db_session.commit()
+    assert_rejected(TokenService(db_session), tokens["refresh_token"])
@@ -0,0 +1,106 @@
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app import auth
+from app.database import Base, get_db
+from app.main import app
+from app.models import Team, Player
+from app.utils.tracing import tracer
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def spans(monkeypatch):
+    exported = []
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    monkeypatch.setattr(tracer, "exporter", exported.append)
+    return exported
+
+@pytest_asyncio.fixture
+async def client(db_session):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    players = [Player(name=f"Player {i}", team_id=team.id, position="FW", number=i) for i in range(2)]
+    db_session.add_all(players)
+    db_session.commit()
+    token = auth.create_access_token({"sub": str(team.id)})
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test",
+            headers={"Authorization": f"Bearer {token}"}
+        ) as client:
+            yield client, team, players
+    finally:
+        app.dependency_overrides.clear()
+
+def create_payload(team, players):
+    return {
+        "date": "2024-01-01T00:00:00", "opponent": "Team A", "score": "2:1", "team_id": team.id,
+        "player_ids": [p.id for p in players], "quarter_scores": [{"quarter": 1, "our_score": 2, "opponent_score": 1}],
+        "goals": [{"match_id": 0, "player_id": players[0].id, "assist_player_id": players[1].id, "quarter": 1}],
+    }
+
+@pytest.mark.asyncio
+async def test_request_spans_cover_auth_service_and_sql(client, spans):
+    client, team, players = client
+    response = await client.post(
+        "/matches/create", json=create_payload(team, players),
+        headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}
+    )
+    assert response.status_code == 200
+
+    by_id = {span.span_id: span for span in spans}
+    root = spans[-1]
+    assert root.name == "POST /matches/create"
+    assert root.kind == "SERVER" and root.parent_id == PARENT_ID
+    assert root.attributes["http.status_code"] == 200
+    assert {span.trace_id for span in spans} == {TRACE_ID}
+    # 응답 헤더로 추적 ID 전달
+    assert response.headers["traceparent"] == f"00-{TRACE_ID}-{root.span_id}-01"
+
+    names = [span.name for span in spans]
+    assert "auth.get_current_team" in names
+    service = next(span for span in spans if span.name == "MatchService.create_match")
+    assert service.parent_id == root.span_id
+    sql = [span for span in spans if span.name == "sql"]
+    assert any(span.attributes["db.statement"].startswith("INSERT INTO matches") for span in sql)
+    commits = [span for span in spans if span.name == "db.commit"]
+    assert commits and all(by_id[span.parent_id].name == "MatchService.create_match" for span in commits)
+    # 커밋 중 flush된 INSERT는 커밋 스팬 아래
+    assert any(by_id[span.parent_id].name == "db.commit" for span in sql)
+
+    exported = root.to_dict()
+    assert exported["context"] == {"trace_id": f"0x{TRACE_ID}", "span_id": f"0x{root.span_id}"}
+    assert exported["start_time"].endswith("Z")
+
+@pytest.mark.asyncio
+async def test_unsampled_requests_create_no_spans(client, spans, monkeypatch):
+    client, team, players = client
+    response = await client.get(f"/players/team/{team.id}", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"})
+    assert response.status_code == 200
+    assert "traceparent" not in response.headers
+
+    monkeypatch.setattr(tracer, "sample_rate", 0.0)
+    await client.get(f"/players/team/{team.id}", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"})
+    assert spans == []
@@ -0,0 +1,158 @@
+import pytest
+import threading
+from app.services.player_service import PlayerService
+from app.services.match_service import MatchService
+from app.services.team_service import TeamService
+from app.models import Team, Player
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from datetime import date
+from app.schemas import GoalCreate, MatchCreate, MatchUpdate, PlayerUpdate, TeamUpdate
+from app.utils.versioning import parse_if_match
+from fastapi import HTTPException
+
+# 테스트용 DB 설정
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False, "timeout": 30})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def test_team(db_session):
+    team = Team(name="Test Team", description="Test Description", type="AMATEUR")
+    db_session.add(team)
+    db_session.commit()
+    return team
+
+@pytest.fixture
+def test_player(db_session, test_team):
+    player = Player(name="Player 1", team_id=test_team.id, position="FW", number=10, goal_count=0)
+    db_session.add(player)
+    db_session.commit()
+    return player
+
+def test_parse_if_match():
+    assert parse_if_match(None) is None
+    assert parse_if_match("*") is None
+    assert parse_if_match("3") == 3
+    assert parse_if_match('"3"') == 3
+    assert parse_if_match('W/"3"') == 3
+    with pytest.raises(HTTPException):
+        parse_if_match('"abc"')
+
+def test_stale_version_is_rejected(db_session, test_team, test_player):
+    service = PlayerService(db_session)
+    assert test_player.version_id == 1
+
+    player = service.update_player(test_player.id, PlayerUpdate(name="Renamed", version_id=1), test_team)
+    assert player.version_id == 2
+
+    # 이전 버전(1)을 기준으로 한 수정은 409, 변경 사항 없음
+    with pytest.raises(HTTPException) as exc_info:
+        service.update_player_stats(test_player.id, PlayerUpdate(goal_count=5), test_team, expected_version=1)
+    assert exc_info.value.status_code == 409
+    db_session.refresh(player)
+    assert player.goal_count == 0
+
+    # 버전을 생략하면 기존처럼 마지막 쓰기가 반영
+    player = service.update_player_stats(test_player.id, PlayerUpdate(goal_count=5), test_team)
+    assert (player.goal_count, player.version_id) == (5, 3)
+
+def test_match_and_team_versions(db_session, test_team, test_player):
+    match_service = MatchService(db_session, test_team)
+    match = match_service.create_match(MatchCreate(
+        date=date(2024, 1, 1), opponent="Team A", score="1:0", team_id=test_team.id,
+        player_ids=[test_player.id], quarter_scores=[]
+    ), test_team)
+    assert match.version_id == 1
+
+    match = match_service.update_match(match.id, MatchUpdate(score="2:0"), test_team, expected_version=1)
+    assert match.version_id == 2
+    with pytest.raises(HTTPException) as exc_info:
+        match_service.update_match(match.id, MatchUpdate(score="3:0", version_id=1), test_team)
+    assert exc_info.value.status_code == 409
+
+    team_service = TeamService(db_session)
+    team = team_service.update_team(test_team.id, TeamUpdate(description="New", version_id=1), test_team)
+    assert team.version_id == 2
+    with pytest.raises(HTTPException) as exc_info:
+        team_service.update_team(test_team.id, TeamUpdate(description="Old"), test_team, expected_version=1)
+    assert exc_info.value.status_code == 409
+
+def test_counter_updates_do_not_conflict(db_session, test_team, test_player):
+    """경기/골 기록의 누적 기록 증가는 버전을 올리지 않고, 먼저 읽은 요청과도 충돌하지 않음"""
+    match = MatchService(db_session, test_team).create_match(MatchCreate(
+        date=date(2024, 1, 1), opponent="Team A", score="2:0", team_id=test_team.id,
+        player_ids=[test_player.id], quarter_scores=[]
+    ), test_team)
+    # 다른 요청이 선수를 먼저 읽어 둔 상태 (goal_count=0, version_id=1)
+    other = TestingSessionLocal()
+    try:
+        other_team = other.get(Team, test_team.id)
+        other.get(Player, test_player.id)
+
+        MatchService(db_session, test_team).add_goal(
+            match.id, GoalCreate(match_id=match.id, player_id=test_player.id, quarter=1), test_team
+        )
+        MatchService(other, other_team).add_goal(
+            match.id, GoalCreate(match_id=match.id, player_id=test_player.id, quarter=2), other_team
+        )
+    finally:
+        other.close()
+
+    db_session.refresh(test_player)
+    assert (test_player.goal_count, test_player.version_id) == (2, 1)
+
+    # 사용자 수정은 버전을 올림
+    player = PlayerService(db_session).update_player(test_player.id, PlayerUpdate(name="Renamed"), test_team)
+    assert player.version_id == 2
+    player = PlayerService(db_session).update_player(test_player.id, PlayerUpdate(name="Renamed"), test_team)
+    assert player.version_id == 2
+
+def test_concurrent_writers_lose_no_updates(db_session, test_team, test_player):
+    """읽기-수정-쓰기 경쟁에서 충돌한 쓰기는 409로 실패하고 재시도하므로 증가분이 유실되지 않음"""
+    writers, increments = 8, 10
+    conflicts = []
+    errors = []
+    team_id, player_id = test_team.id, test_player.id
+
+    def writer():
+        for _ in range(increments):
+            while True:
+                db = TestingSessionLocal()
+                try:
+                    team = db.get(Team, team_id)
+                    player = db.get(Player, player_id)
+                    PlayerService(db).update_player_stats(
+                        player_id, PlayerUpdate(goal_count=player.goal_count + 1), team,
+                        expected_version=player.version_id
+                    )
+                    break
+                except HTTPException as exc:
+                    if exc.status_code != 409:
+                        errors.append(exc)
+                        return
+                    conflicts.append(1)
+                finally:
+                    db.close()
+
+    threads = [threading.Thread(target=writer) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    db_session.refresh(test_player)
+    assert errors == []
+    assert test_player.goal_count == writers * increments
+    assert test_player.version_id == writers * increments + 1